@@ -20,12 +20,19 @@ from atlasops.models import (  # noqa: F401
     ElectraCastProfile,
     JobPosting,
     CompanyDeepDive,
+    ScrapeCacheEntry,
+    ScrapeArtifact,
+    JobProcessingMetric,
+    HtmlBlob,
     Application,
     ApplicationEvent,
     GeneratedResume,
     SiteVisit,
     ApiUsage,
     SecurityEvent,
+    ApiUsageRollup,
+    SiteVisitRollup,
+    SiteVisitDailySession,
 )
 
 # Alembic Config object
@@ -0,0 +1,98 @@
+"""Add hourly/daily analytics rollup tables.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "api_usage_rollups",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("granularity", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("endpoint", sa.String(500), nullable=False),
+        sa.Column("method", sa.String(10), nullable=False),
+        sa.Column("status_class", sa.SmallInteger(), nullable=False),
+        sa.Column("request_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_response_time_ms", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("max_response_time_ms", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "endpoint",
+            "method",
+            "status_class",
+            name="uq_api_usage_rollups_bucket",
+        ),
+    )
+    op.create_index(
+        op.f("ix_api_usage_rollups_bucket_start"),
+        "api_usage_rollups",
+        ["bucket_start"],
+        unique=False,
+    )
+
+    op.create_table(
+        "site_visit_rollups",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("granularity", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("path", sa.String(500), nullable=False),
+        sa.Column("method", sa.String(10), nullable=False),
+        sa.Column("visit_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "path",
+            "method",
+            name="uq_site_visit_rollups_bucket",
+        ),
+    )
+    op.create_index(
+        op.f("ix_site_visit_rollups_bucket_start"),
+        "site_visit_rollups",
+        ["bucket_start"],
+        unique=False,
+    )
+
+    op.create_table(
+        "site_visit_daily_sessions",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("session_id", sa.String(255), nullable=False),
+        sa.PrimaryKeyConstraint("day", "session_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("site_visit_daily_sessions")
+    op.drop_index(op.f("ix_site_visit_rollups_bucket_start"), table_name="site_visit_rollups")
+    op.drop_table("site_visit_rollups")
+    op.drop_index(op.f("ix_api_usage_rollups_bucket_start"), table_name="api_usage_rollups")
+    op.drop_table("api_usage_rollups")
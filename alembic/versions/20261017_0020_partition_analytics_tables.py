@@ -0,0 +1,122 @@
+"""Convert api_usage and site_visits to monthly range-partitioned tables.
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-17
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created ahead of the current month
+MONTHS_AHEAD = 3
+
+TABLES = {
+    "api_usage": {
+        "columns": """
+            id UUID NOT NULL,
+            user_id UUID,
+            endpoint VARCHAR(500) NOT NULL,
+            method VARCHAR(10) NOT NULL,
+            status_code INTEGER NOT NULL,
+            response_time_ms INTEGER NOT NULL,
+            ip_address VARCHAR(45),
+            error_message TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        """,
+        "btree_indexes": ["user_id", "endpoint", "status_code"],
+    },
+    "site_visits": {
+        "columns": """
+            id UUID NOT NULL,
+            user_id UUID,
+            path VARCHAR(500) NOT NULL,
+            method VARCHAR(10) NOT NULL,
+            ip_address VARCHAR(45),
+            user_agent TEXT,
+            referer VARCHAR(500),
+            session_id VARCHAR(255),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        """,
+        "btree_indexes": ["user_id", "path", "session_id"],
+    },
+}
+
+
+def add_months(month: date, count: int) -> date:
+    # Align with atlasops/services/analytics_partitions.py add_months
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    # Align with atlasops/services/analytics_partitions.py partition_name
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def create_partition(table: str, month: date) -> None:
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    today = datetime.now(timezone.utc).date()
+    current_month = date(today.year, today.month, 1)
+
+    for table, spec in TABLES.items():
+        legacy = f"{table}_legacy"
+
+        # Move the existing table (and its index names) out of the way
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+        for column in [*spec["btree_indexes"], "created_at"]:
+            op.execute(f"ALTER INDEX ix_{table}_{column} RENAME TO ix_{legacy}_{column}")
+
+        # The partition key must be part of the primary key
+        op.execute(
+            f"CREATE TABLE {table} ({spec['columns']}, PRIMARY KEY (id, created_at)) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        for column in spec["btree_indexes"]:
+            op.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+        op.execute(f"CREATE INDEX ix_{table}_created_at ON {table} USING brin (created_at)")
+
+        # One partition per month from the oldest row through MONTHS_AHEAD
+        oldest = bind.execute(sa.text(f"SELECT min(created_at) FROM {legacy}")).scalar()
+        month = date(oldest.year, oldest.month, 1) if oldest else current_month
+        while month <= add_months(current_month, MONTHS_AHEAD):
+            create_partition(table, month)
+            month = add_months(month, 1)
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        op.execute(f"DROP TABLE {legacy}")
+
+
+def downgrade() -> None:
+    for table, spec in TABLES.items():
+        legacy = f"{table}_partitioned"
+
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+        for column in [*spec["btree_indexes"], "created_at"]:
+            op.execute(f"ALTER INDEX ix_{table}_{column} RENAME TO ix_{legacy}_{column}")
+
+        op.execute(f"CREATE TABLE {table} ({spec['columns']}, PRIMARY KEY (id))")
+        for column in [*spec["btree_indexes"], "created_at"]:
+            op.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        # Dropping the parent drops every partition with it
+        op.execute(f"DROP TABLE {legacy}")
@@ -0,0 +1,44 @@
+"""Add scrape cache table.
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scrape_cache",
+        sa.Column("url_hash", sa.String(64), nullable=False),
+        sa.Column("url", sa.String(2048), nullable=False),
+        sa.Column("html_gz", sa.LargeBinary(), nullable=True),
+        sa.Column("raw_text", sa.Text(), nullable=True),
+        sa.Column("extracted", postgresql.JSON(), nullable=True),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("miss_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("url_hash"),
+    )
+    op.create_index(
+        op.f("ix_scrape_cache_expires_at"),
+        "scrape_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_scrape_cache_expires_at"), table_name="scrape_cache")
+    op.drop_table("scrape_cache")
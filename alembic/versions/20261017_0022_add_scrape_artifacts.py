@@ -0,0 +1,38 @@
+"""Add scrape pipeline artifacts table.
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0022"
+down_revision: Union[str, None] = "0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scrape_artifacts",
+        sa.Column("job_posting_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("stage", sa.String(20), nullable=False),
+        sa.Column("fetched_with", sa.String(20), nullable=True),
+        sa.Column("html_gz", sa.LargeBinary(), nullable=True),
+        sa.Column("raw_text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["job_posting_id"], ["job_postings.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("job_posting_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scrape_artifacts")
@@ -0,0 +1,71 @@
+"""Add job processing metrics table.
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_processing_metrics",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("job_posting_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("stage", sa.String(20), nullable=False),
+        sa.Column("host", sa.String(255), nullable=True),
+        sa.Column("fetcher", sa.String(20), nullable=True),
+        sa.Column("success", sa.Boolean(), nullable=False, server_default="true"),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("bytes_fetched", sa.Integer(), nullable=True),
+        sa.Column("chars_extracted", sa.Integer(), nullable=True),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["job_posting_id"], ["job_postings.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_job_processing_metrics_job_posting_id"),
+        "job_processing_metrics",
+        ["job_posting_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_job_processing_metrics_host"),
+        "job_processing_metrics",
+        ["host"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_job_processing_metrics_created_at"),
+        "job_processing_metrics",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_job_processing_metrics_created_at"), table_name="job_processing_metrics"
+    )
+    op.drop_index(
+        op.f("ix_job_processing_metrics_host"), table_name="job_processing_metrics"
+    )
+    op.drop_index(
+        op.f("ix_job_processing_metrics_job_posting_id"),
+        table_name="job_processing_metrics",
+    )
+    op.drop_table("job_processing_metrics")
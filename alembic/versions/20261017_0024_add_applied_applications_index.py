@@ -0,0 +1,30 @@
+"""Add partial index for the stale-applications sweep.
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_applications_applied_updated_at",
+        "applications",
+        ["updated_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'applied'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_applied_updated_at", table_name="applications")
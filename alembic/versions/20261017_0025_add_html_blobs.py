@@ -0,0 +1,39 @@
+"""Add html blobs table.
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0025"
+down_revision: Union[str, None] = "0024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "html_blobs",
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("data_gz", sa.LargeBinary(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("sha256"),
+    )
+    op.create_index(
+        op.f("ix_html_blobs_last_used_at"),
+        "html_blobs",
+        ["last_used_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_html_blobs_last_used_at"), table_name="html_blobs")
+    op.drop_table("html_blobs")
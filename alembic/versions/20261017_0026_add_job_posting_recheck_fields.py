@@ -0,0 +1,45 @@
+"""Add liveness recheck fields to job postings.
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("job_postings", sa.Column("etag", sa.String(512), nullable=True))
+    op.add_column("job_postings", sa.Column("last_modified", sa.String(64), nullable=True))
+    op.add_column("job_postings", sa.Column("content_hash", sa.String(64), nullable=True))
+    op.add_column(
+        "job_postings",
+        sa.Column("last_checked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "job_postings",
+        sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_job_postings_last_checked_at"),
+        "job_postings",
+        ["last_checked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_job_postings_last_checked_at"), table_name="job_postings")
+    op.drop_column("job_postings", "closed_at")
+    op.drop_column("job_postings", "last_checked_at")
+    op.drop_column("job_postings", "content_hash")
+    op.drop_column("job_postings", "last_modified")
+    op.drop_column("job_postings", "etag")
@@ -0,0 +1,27 @@
+"""Add prompt_tokens_saved to job processing metrics.
+
+Revision ID: 0027
+Revises: 0026
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0027"
+down_revision: Union[str, None] = "0026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_processing_metrics",
+        sa.Column("prompt_tokens_saved", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_processing_metrics", "prompt_tokens_saved")
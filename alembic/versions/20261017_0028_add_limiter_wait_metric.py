@@ -0,0 +1,27 @@
+"""Add limiter_wait_ms to job processing metrics.
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_processing_metrics",
+        sa.Column("limiter_wait_ms", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_processing_metrics", "limiter_wait_ms")
@@ -0,0 +1,62 @@
+"""Add DEFAULT partitions to the partitioned analytics tables.
+
+Rows for a month without a partition land there instead of failing the
+insert; partition maintenance moves them out when the month's partition is
+created.
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-10-17
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0029"
+down_revision: Union[str, None] = "0028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("api_usage", "site_visits")
+
+
+def add_months(month: date, count: int) -> date:
+    # Align with atlasops/services/analytics_partitions.py add_months
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    # Align with atlasops/services/analytics_partitions.py partition_name
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in TABLES:
+        default = f"{table}_default"
+        op.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+
+        # Give the default partition's rows monthly partitions before dropping it
+        months = bind.execute(
+            sa.text(
+                f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date "
+                f"FROM {default}"
+            )
+        ).scalars()
+        for month in months:
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        op.execute(f"INSERT INTO {table} SELECT * FROM {default}")
+        op.execute(f"DROP TABLE {default}")
@@ -0,0 +1,25 @@
+"""Add user_edited_fields to job postings.
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0030"
+down_revision: Union[str, None] = "0029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("job_postings", sa.Column("user_edited_fields", postgresql.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_postings", "user_edited_fields")
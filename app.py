@@ -1,5 +1,6 @@
 """AtlasOps - FastAPI Application Entrypoint."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -10,6 +11,8 @@ from fastapi.staticfiles import StaticFiles
 from atlasops.api.v1.router import router as api_router
 from atlasops.config import get_settings
 from atlasops.middleware.analytics import AnalyticsMiddleware
+from atlasops.services.analytics_writer import analytics_writer
+from atlasops.services.prompt_compaction import load_tokenizers
 
 settings = get_settings()
 
@@ -23,8 +26,15 @@ UPLOADS_DIR.mkdir(exist_ok=True)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    analytics_writer.start()
+    await asyncio.to_thread(
+        load_tokenizers,
+        (settings.openai_model, settings.openai_extraction_model),
+        settings.llm_tokenizer_load_timeout_seconds,
+    )
     yield
     # Shutdown
+    await analytics_writer.stop()
 
 
 app = FastAPI(
@@ -1,5 +1,8 @@
 """Admin dashboard API endpoints."""
 
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -9,100 +12,115 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from atlasops.api.deps import AdminUser, DbSession
-from atlasops.models.analytics import ApiUsage, SecurityEvent, SiteVisit
+from atlasops.config import get_settings
+from atlasops.db import async_session_maker
+from atlasops.models.analytics import (
+    ApiUsage,
+    ApiUsageRollup,
+    SecurityEvent,
+    SiteVisit,
+    SiteVisitDailySession,
+    SiteVisitRollup,
+)
 from atlasops.models.user import User
 from atlasops.models.job import JobPosting
 from atlasops.models.application import Application
+from atlasops.services import processing_metrics, scrape_cache
+from atlasops.services.analytics_rollup import floor_day, rollup_window
+from atlasops.services.analytics_writer import analytics_writer
+from atlasops.services.llm_client import llm_client
 
+logger = logging.getLogger(__name__)
+settings = get_settings()
 router = APIRouter()
 
 
+async def _timed_first_row(name: str, stmt, db: Optional[AsyncSession] = None):
+    """Execute an aggregate statement and log how long it took.
+
+    Without ``db`` the statement runs on its own pooled session, so several
+    calls can be awaited concurrently.
+    """
+    start = time.perf_counter()
+    if db is None:
+        async with async_session_maker() as session:
+            row = (await session.execute(stmt)).first()
+    else:
+        row = (await db.execute(stmt)).first()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"Admin overview query '{name}' took {elapsed_ms:.1f} ms")
+    return row
+
+
 @router.get("/stats/overview")
 async def get_overview_stats(
     db: DbSession,
     admin: AdminUser,
     days: int = Query(default=30, ge=1, le=365),
 ):
-    """Get overview statistics for the admin dashboard."""
+    """Get overview statistics for the admin dashboard.
+
+    Traffic and API figures are read from the analytics rollup tables, which
+    the ``rollup_analytics`` beat task refreshes every few minutes.
+    """
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
     
-    # User stats
-    total_users_result = await db.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar() or 0
-    
-    new_users_result = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= cutoff_date)
-    )
-    new_users = new_users_result.scalar() or 0
-    
-    # Job posting stats
-    total_jobs_result = await db.execute(select(func.count(JobPosting.id)))
-    total_jobs = total_jobs_result.scalar() or 0
-    
-    recent_jobs_result = await db.execute(
-        select(func.count(JobPosting.id)).where(JobPosting.created_at >= cutoff_date)
-    )
-    recent_jobs = recent_jobs_result.scalar() or 0
-    
-    # Application stats
-    total_apps_result = await db.execute(select(func.count(Application.id)))
-    total_apps = total_apps_result.scalar() or 0
-    
-    recent_apps_result = await db.execute(
-        select(func.count(Application.id)).where(Application.created_at >= cutoff_date)
-    )
-    recent_apps = recent_apps_result.scalar() or 0
-    
-    # Site visit stats
-    total_visits_result = await db.execute(
-        select(func.count(SiteVisit.id)).where(SiteVisit.created_at >= cutoff_date)
-    )
-    total_visits = total_visits_result.scalar() or 0
-    
-    unique_visitors_result = await db.execute(
-        select(func.count(func.distinct(SiteVisit.session_id)))
-        .where(SiteVisit.created_at >= cutoff_date)
-        .where(SiteVisit.session_id.isnot(None))
-    )
-    unique_visitors = unique_visitors_result.scalar() or 0
-    
-    # API usage stats
-    total_api_calls_result = await db.execute(
-        select(func.count(ApiUsage.id)).where(ApiUsage.created_at >= cutoff_date)
-    )
-    total_api_calls = total_api_calls_result.scalar() or 0
-    
-    avg_response_time_result = await db.execute(
-        select(func.avg(ApiUsage.response_time_ms))
-        .where(ApiUsage.created_at >= cutoff_date)
-    )
-    avg_response_time = avg_response_time_result.scalar() or 0.0
+    # Independent aggregates, one multi-aggregate statement per table
+    queries = {
+        "users": select(
+            func.count(User.id),
+            func.count(User.id).filter(User.created_at >= cutoff_date),
+        ),
+        "jobs": select(
+            func.count(JobPosting.id),
+            func.count(JobPosting.id).filter(JobPosting.created_at >= cutoff_date),
+        ),
+        "applications": select(
+            func.count(Application.id),
+            func.count(Application.id).filter(Application.created_at >= cutoff_date),
+        ),
+        "visits": select(
+            func.coalesce(func.sum(SiteVisitRollup.visit_count), 0),
+        ).where(rollup_window(SiteVisitRollup, cutoff_date)),
+        "unique_visitors": select(
+            func.count(func.distinct(SiteVisitDailySession.session_id)),
+        ).where(SiteVisitDailySession.day >= cutoff_date.date()),
+        "api": select(
+            func.coalesce(func.sum(ApiUsageRollup.request_count), 0),
+            func.coalesce(func.sum(ApiUsageRollup.total_response_time_ms), 0),
+            func.coalesce(func.sum(ApiUsageRollup.error_count), 0),
+        ).where(rollup_window(ApiUsageRollup, cutoff_date)),
+        "security": select(
+            func.count(SecurityEvent.id),
+            func.count(SecurityEvent.id).filter(SecurityEvent.severity == "critical"),
+        ).where(SecurityEvent.resolved == False),
+    }
     
-    error_rate_result = await db.execute(
-        select(
-            func.count(ApiUsage.id).filter(ApiUsage.status_code >= 400),
-            func.count(ApiUsage.id),
+    if settings.admin_stats_concurrent:
+        # Each aggregate gets its own pooled connection, so the response
+        # time tracks the slowest query rather than the sum of all of them
+        rows = await asyncio.gather(
+            *(_timed_first_row(name, stmt) for name, stmt in queries.items())
         )
-        .where(ApiUsage.created_at >= cutoff_date)
-    )
-    error_row = error_rate_result.first()
-    error_count = error_row[0] or 0
-    total_calls = error_row[1] or 1
-    error_rate = (error_count / total_calls * 100) if total_calls > 0 else 0.0
+    else:
+        rows = [
+            await _timed_first_row(name, stmt, db)
+            for name, stmt in queries.items()
+        ]
+    results = dict(zip(queries, rows))
     
-    # Security events
-    unresolved_security_result = await db.execute(
-        select(func.count(SecurityEvent.id))
-        .where(SecurityEvent.resolved == False)
-    )
-    unresolved_security = unresolved_security_result.scalar() or 0
+    total_users, new_users = results["users"]
+    total_jobs, recent_jobs = results["jobs"]
+    total_apps, recent_apps = results["applications"]
+    total_visits = int(results["visits"][0] or 0)
+    unique_visitors = results["unique_visitors"][0] or 0
+    unresolved_security, critical_security = results["security"]
     
-    critical_security_result = await db.execute(
-        select(func.count(SecurityEvent.id))
-        .where(SecurityEvent.severity == "critical")
-        .where(SecurityEvent.resolved == False)
-    )
-    critical_security = critical_security_result.scalar() or 0
+    api_row = results["api"]
+    total_api_calls = int(api_row[0])
+    avg_response_time = float(api_row[1]) / total_api_calls if total_api_calls else 0.0
+    error_count = int(api_row[2])
+    error_rate = (error_count / total_api_calls * 100) if total_api_calls > 0 else 0.0
     
     return {
         "period_days": days,
@@ -134,6 +152,53 @@ async def get_overview_stats(
     }
 
 
+@router.get("/stats/analytics-writer")
+async def get_analytics_writer_stats(
+    admin: AdminUser,
+):
+    """Get queue and flush counters for the buffered analytics writer."""
+    return analytics_writer.snapshot()
+
+
+@router.get("/stats/scrape-cache")
+async def get_scrape_cache_stats(
+    db: DbSession,
+    admin: AdminUser,
+):
+    """Get entry counts and hit rate for the scrape cache."""
+    return await scrape_cache.cache_stats(db)
+
+
+@router.get("/stats/job-processing")
+async def get_job_processing_stats(
+    db: DbSession,
+    admin: AdminUser,
+    days: int = Query(default=7, ge=1, le=90),
+    hosts: int = Query(default=25, ge=1, le=200),
+):
+    """Get p50/p95 scrape pipeline latency per stage and per host.
+
+    Host rows are ordered by p95, so the slowest sites and stages come first.
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    return {
+        "days": days,
+        "stages": await processing_metrics.stage_latency(db, since),
+        "hosts": await processing_metrics.stage_latency(db, since, by_host=True, limit=hosts),
+    }
+
+
+@router.get("/stats/llm-limiter")
+async def get_llm_limiter_stats(admin: AdminUser):
+    """Get this API process's LLM call limiter state.
+
+    Reports the adaptive concurrency limit, queue depth and in-flight calls
+    per priority, remaining token/request budget, and recent wait times.
+    Worker-side waits are recorded per job in ``/stats/job-processing``.
+    """
+    return llm_client.limiter.metrics()
+
+
 @router.get("/analytics/visits")
 async def get_visit_analytics(
     db: DbSession,
@@ -153,33 +218,36 @@ async def get_visit_analytics(
     )
     visits = visits_result.scalars().all()
     
-    # Get popular paths
+    # Get popular paths (from rollups)
+    visit_count = func.sum(SiteVisitRollup.visit_count)
     popular_paths_result = await db.execute(
         select(
-            SiteVisit.path,
-            func.count(SiteVisit.id).label("count"),
+            SiteVisitRollup.path,
+            visit_count.label("count"),
         )
-        .where(SiteVisit.created_at >= cutoff_date)
-        .group_by(SiteVisit.path)
-        .order_by(func.count(SiteVisit.id).desc())
+        .where(rollup_window(SiteVisitRollup, cutoff_date))
+        .group_by(SiteVisitRollup.path)
+        .order_by(visit_count.desc())
         .limit(20)
     )
     popular_paths = [
-        {"path": row[0], "count": row[1]} for row in popular_paths_result.all()
+        {"path": row[0], "count": int(row[1])} for row in popular_paths_result.all()
     ]
     
-    # Get visits by day
+    # Get visits by day (from daily rollups)
+    visit_day = func.date(SiteVisitRollup.bucket_start)
     visits_by_day_result = await db.execute(
         select(
-            func.date(SiteVisit.created_at).label("date"),
-            func.count(SiteVisit.id).label("count"),
+            visit_day.label("date"),
+            visit_count.label("count"),
         )
-        .where(SiteVisit.created_at >= cutoff_date)
-        .group_by(func.date(SiteVisit.created_at))
-        .order_by(func.date(SiteVisit.created_at))
+        .where(SiteVisitRollup.granularity == "day")
+        .where(SiteVisitRollup.bucket_start >= floor_day(cutoff_date))
+        .group_by(visit_day)
+        .order_by(visit_day)
     )
     visits_by_day = [
-        {"date": row[0].isoformat(), "count": row[1]} for row in visits_by_day_result.all()
+        {"date": row[0].isoformat(), "count": int(row[1])} for row in visits_by_day_result.all()
     ]
     
     return {
@@ -218,47 +286,50 @@ async def get_api_usage_analytics(
     )
     usage = usage_result.scalars().all()
     
-    # Get endpoint statistics
+    # Get endpoint statistics (from rollups)
+    request_count = func.sum(ApiUsageRollup.request_count)
     endpoint_stats_result = await db.execute(
         select(
-            ApiUsage.endpoint,
-            ApiUsage.method,
-            func.count(ApiUsage.id).label("count"),
-            func.avg(ApiUsage.response_time_ms).label("avg_time"),
-            func.count(ApiUsage.id).filter(ApiUsage.status_code >= 400).label("error_count"),
+            ApiUsageRollup.endpoint,
+            ApiUsageRollup.method,
+            request_count.label("count"),
+            func.sum(ApiUsageRollup.total_response_time_ms).label("total_time"),
+            func.sum(ApiUsageRollup.error_count).label("error_count"),
         )
-        .where(ApiUsage.created_at >= cutoff_date)
-        .group_by(ApiUsage.endpoint, ApiUsage.method)
-        .order_by(func.count(ApiUsage.id).desc())
+        .where(rollup_window(ApiUsageRollup, cutoff_date))
+        .group_by(ApiUsageRollup.endpoint, ApiUsageRollup.method)
+        .order_by(request_count.desc())
         .limit(50)
     )
     endpoint_stats = [
         {
             "endpoint": row[0],
             "method": row[1],
-            "count": row[2],
-            "avg_response_time_ms": round(row[3] or 0, 2),
-            "error_count": row[4],
+            "count": int(row[2]),
+            "avg_response_time_ms": round(float(row[3]) / row[2], 2) if row[2] else 0.0,
+            "error_count": int(row[4]),
         }
         for row in endpoint_stats_result.all()
     ]
     
-    # Get usage by day
+    # Get usage by day (from daily rollups)
+    usage_day = func.date(ApiUsageRollup.bucket_start)
     usage_by_day_result = await db.execute(
         select(
-            func.date(ApiUsage.created_at).label("date"),
-            func.count(ApiUsage.id).label("count"),
-            func.avg(ApiUsage.response_time_ms).label("avg_time"),
+            usage_day.label("date"),
+            request_count.label("count"),
+            func.sum(ApiUsageRollup.total_response_time_ms).label("total_time"),
         )
-        .where(ApiUsage.created_at >= cutoff_date)
-        .group_by(func.date(ApiUsage.created_at))
-        .order_by(func.date(ApiUsage.created_at))
+        .where(ApiUsageRollup.granularity == "day")
+        .where(ApiUsageRollup.bucket_start >= floor_day(cutoff_date))
+        .group_by(usage_day)
+        .order_by(usage_day)
     )
     usage_by_day = [
         {
             "date": row[0].isoformat(),
-            "count": row[1],
-            "avg_response_time_ms": round(row[2] or 0, 2),
+            "count": int(row[1]),
+            "avg_response_time_ms": round(float(row[2]) / row[1], 2) if row[1] else 0.0,
         }
         for row in usage_by_day_result.all()
     ]
@@ -1,13 +1,14 @@
 """Job posting endpoints."""
 
 from typing import List
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from celery import group
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from atlasops.api.deps import CurrentUser, DbSession, PaidUser
-from atlasops.models.job import JobPosting
+from atlasops.models.job import EXTRACTED_FIELDS, JobPosting
 from atlasops.schemas.job import (
     JobIngestHtmlRequest,
     JobIngestRequest,
@@ -15,7 +16,9 @@ from atlasops.schemas.job import (
     JobPostingResponse,
     JobUpdateRequest,
 )
-from atlasops.workers.tasks import scrape_job_posting
+from atlasops.services import html_blobs
+from atlasops.services.scraper import compute_url_hash
+from atlasops.workers.tasks import scrape_pipeline
 from atlasops.services.entitlements import (
     can_access_premium_features,
     enforce_resume_quota,
@@ -53,26 +56,54 @@ async def ingest_jobs(
     current_user: CurrentUser,
     db: DbSession,
 ) -> dict:
-    """Ingest job posting URLs for processing."""
-    job_ids = []
+    """Ingest job posting URLs for processing.
+
+    URLs are deduplicated within the batch and against the user's existing
+    postings, inserted in a single statement and dispatched as one Celery
+    group, so large pastes return in roughly constant time.
+    """
+    # Dedupe within the batch on the normalized URL hash
+    urls_by_hash = {}
     for url in request.urls:
-        # Create job posting record
-        job = JobPosting(
-            user_id=current_user.id,
-            url=str(url),
-            status="pending",
-        )
-        db.add(job)
-        await db.flush()
-        job_ids.append(str(job.id))
+        urls_by_hash.setdefault(compute_url_hash(str(url)), str(url))
 
-        # Queue background task for scraping
-        scrape_job_posting.delay(str(job.id))
+    # Dedupe against postings this user already has
+    existing_result = await db.execute(
+        select(JobPosting.url_hash).where(
+            JobPosting.user_id == current_user.id,
+            JobPosting.url_hash.in_(list(urls_by_hash)),
+        )
+    )
+    existing_hashes = set(existing_result.scalars().all())
 
+    rows = [
+        {
+            "id": uuid4(),
+            "user_id": current_user.id,
+            "url": url,
+            "url_hash": url_hash,
+            "status": "pending",
+        }
+        for url_hash, url in urls_by_hash.items()
+        if url_hash not in existing_hashes
+    ]
+    if rows:
+        await db.execute(insert(JobPosting), rows)
+    # Commit before dispatching so workers can see the rows
     await db.commit()
 
+    job_ids = [str(row["id"]) for row in rows]
+    if job_ids:
+        # Queue background scraping as a single group publish
+        group(scrape_pipeline(job_id) for job_id in job_ids).apply_async()
+
+    skipped = len(request.urls) - len(job_ids)
+    message = f"Queued {len(job_ids)} job(s) for processing"
+    if skipped:
+        message += f" ({skipped} duplicate(s) skipped)"
+
     return {
-        "message": f"Queued {len(job_ids)} job(s) for processing",
+        "message": message,
         "job_ids": job_ids,
     }
 
@@ -91,24 +122,28 @@ async def ingest_job_html(
     """
     from atlasops.workers.tasks import extract_job_from_html
     
+    # Store the page once, compressed; only its reference goes on the queue
+    html_ref = await html_blobs.put(db, request.html_content)
+
     # Create job posting record
     job = JobPosting(
         user_id=current_user.id,
         url=request.url,
         status="processing",
-        raw_text=request.html_content[:50000],  # Limit size
     )
     db.add(job)
     await db.flush()
-    
-    # Queue background task for extraction (no scraping needed)
-    extract_job_from_html.delay(str(job.id), request.html_content)
-    
+    job_id = str(job.id)
+
+    # Commit before dispatching so the worker can see the row and the blob
     await db.commit()
+
+    # Queue background task for extraction (no scraping needed)
+    extract_job_from_html.delay(job_id, html_ref)
     
     return {
         "message": "Job captured and queued for processing",
-        "job_ids": [str(job.id)],
+        "job_ids": [job_id],
     }
 
 
@@ -198,6 +233,15 @@ async def update_job(
         if value is not None:
             setattr(job, field, value)
 
+    # Remember corrections so posting rechecks leave them alone
+    edited = {
+        field
+        for field, value in update_data.items()
+        if value is not None and field in EXTRACTED_FIELDS
+    }
+    if edited:
+        job.user_edited_fields = sorted(edited | set(job.user_edited_fields or []))
+
     # Re-validate minimum requirements and update status
     has_company = bool(job.company_name and job.company_name.strip())
     has_title = bool(job.job_title and job.job_title.strip())
@@ -478,7 +522,7 @@ async def retry_job(
     await db.commit()
     
     # Queue for reprocessing
-    scrape_job_posting.delay(str(job.id))
+    scrape_pipeline(str(job.id)).apply_async()
     
     await db.refresh(job)
     return job
@@ -504,7 +548,7 @@ async def retry_all_failed_jobs(
     for job in failed_jobs:
         job.status = "pending"
         job.error_message = None
-        scrape_job_posting.delay(str(job.id))
+        scrape_pipeline(str(job.id)).apply_async()
     
     await db.commit()
     
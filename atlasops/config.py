@@ -42,6 +42,34 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4o-mini"
     openai_extraction_model: str = "gpt-4o-mini"
 
+    # LLM response cache (opt-in, local SQLite with LRU size eviction)
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = ".cache/llm_cache.sqlite3"
+    llm_cache_max_mb: int = 256
+    llm_cache_ttl_job_extraction_seconds: int = 7 * 24 * 3600
+    llm_cache_ttl_resume_parse_seconds: int = 30 * 24 * 3600
+
+    # Job extraction input: drop repeated text and boilerplate, then cap at a
+    # token budget (counted with tiktoken when installed)
+    llm_prompt_compaction_enabled: bool = True
+    llm_extraction_max_input_tokens: int = 3500
+    # tiktoken encodings are loaded (downloaded unless TIKTOKEN_CACHE_DIR has
+    # them) once at startup; counts are approximate if this runs out
+    llm_tokenizer_load_timeout_seconds: float = 10.0
+
+    # LLM call limiter (per process): token/request budgets with a share
+    # reserved for interactive calls, and concurrency that adapts to 429s
+    # and latency
+    llm_tokens_per_minute: int = 200_000
+    llm_requests_per_minute: int = 500
+    llm_max_concurrency: int = 16
+    llm_min_concurrency: int = 1
+    llm_interactive_reserve: float = 0.2
+    llm_latency_target_seconds: float = 30.0
+    llm_rate_limit_pause_seconds: float = 10.0
+    llm_expected_completion_tokens: int = 1000
+    llm_max_retries: int = 3
+
     # LinkedIn OAuth
     linkedin_client_id: str = ""
     linkedin_client_secret: str = ""
@@ -78,6 +106,72 @@ class Settings(BaseSettings):
     electracast_intake_webhook_url: str = ""
     electracast_intake_webhook_secret: str = ""
 
+    # Analytics writer (batched inserts for site visits / API usage)
+    analytics_queue_size: int = 10000
+    analytics_batch_size: int = 500
+    analytics_flush_interval_seconds: float = 2.0
+    # Raw analytics partitions (monthly) older than this are dropped
+    analytics_retention_days: int = 400
+    analytics_partitions_ahead: int = 3
+
+    # Admin dashboard: run overview aggregates concurrently on separate connections
+    admin_stats_concurrent: bool = True
+
+    # Scraper HTTP client (shared per worker process)
+    scraper_http2: bool = False
+    scraper_max_connections: int = 100
+    scraper_max_keepalive_connections: int = 20
+    scraper_max_connections_per_host: int = 6
+    scraper_keepalive_expiry_seconds: float = 30.0
+    # Pages are streamed and dropped once they pass this size
+    scraper_max_response_bytes: int = 5 * 1024 * 1024
+
+    # Parser for extract_text_from_html: auto, selectolax, lxml or html.parser
+    scraper_html_backend: str = "auto"
+
+    # Fetch Greenhouse/Lever postings from their public JSON APIs instead of the page
+    scraper_ats_api_enabled: bool = True
+
+    # Playwright browser pool (shared per worker process)
+    playwright_max_concurrency: int = 4
+    playwright_pages_per_browser: int = 200
+    playwright_block_resources: bool = True
+
+    # Per-host scrape politeness, shared by all workers through Redis.
+    # Defaults for hosts without an entry in url_validator.JOB_SITE_LIMITS.
+    scrape_host_limits_enabled: bool = True
+    scrape_host_requests_per_minute: float = 30.0
+    scrape_host_burst: int = 5
+    scrape_host_max_concurrency: int = 4
+    scrape_host_lease_seconds: int = 120  # crashed fetches free their slot after this
+    scrape_host_max_inline_wait_seconds: float = 2.0  # longer waits re-queue the fetch
+    scrape_host_429_backoff_seconds: int = 60
+
+    # Liveness rechecks of scraped postings (hourly beat sweep)
+    posting_recheck_enabled: bool = True
+    posting_recheck_interval_hours: int = 24
+    posting_recheck_max_age_days: int = 60
+    posting_recheck_batch_size: int = 500
+
+    # Scrape cache (keyed by normalized URL hash)
+    scrape_cache_enabled: bool = True
+    scrape_cache_ttl_hours: int = 24
+    # Extension-captured HTML is kept this long after its last upload
+    html_blob_ttl_hours: int = 72
+    # Pipeline artifacts of jobs that never finished (failed for good) are
+    # deleted this long after their last stage; a re-run then fetches again
+    scrape_artifact_ttl_hours: int = 72
+    # Per-stage scrape pipeline timings kept for the admin latency report
+    processing_metrics_retention_days: int = 90
+
+    # Celery worker: run task coroutines concurrently on one shared loop
+    # (start the worker with `-P threads -c <WORKER_MAX_IN_FLIGHT>`)
+    worker_async_mode: bool = False
+    worker_max_in_flight: int = 50
+
+    # Rows closed per transaction by the stale-applications beat task
+    stale_applications_batch_size: int = 1000
+
     # Application
     debug: bool = False
     environment: str = "development"
@@ -1,94 +1,120 @@
 """Middleware for tracking analytics."""
 
-import asyncio
 import time
-from typing import Callable
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from atlasops.db import async_session_maker
-from atlasops.models.analytics import ApiUsage, SiteVisit
+from atlasops.services.analytics_writer import analytics_writer
 
+# Paths that are never tracked
+UNTRACKED_PATHS = {"/health", "/docs", "/openapi.json", "/redoc"}
 
-class AnalyticsMiddleware(BaseHTTPMiddleware):
-    """Middleware to track site visits and API usage."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class AnalyticsMiddleware:
+    """Pure ASGI middleware to track site visits and API usage.
+
+    Wraps ``send`` to capture the status code and response time without
+    re-buffering the response body, so streaming responses pass through
+    untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and track analytics."""
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate response time
-        response_time_ms = int((time.time() - start_time) * 1000)
-        
-        # Track analytics in background (don't block response)
-        # Use asyncio.create_task to run in background
-        asyncio.create_task(
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        response_time_ms: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_time_ms
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_time_ms = int((time.perf_counter() - start_time) * 1000)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if response_time_ms is None:
+                response_time_ms = int((time.perf_counter() - start_time) * 1000)
+            # Queue analytics rows; the writer bulk-inserts them in the background
             self._track_analytics(
-                request=request,
-                response=response,
+                scope=scope,
+                status_code=status_code,
                 response_time_ms=response_time_ms,
             )
-        )
-        
-        return response
-    
-    async def _track_analytics(
+
+    def _track_analytics(
         self,
-        request: Request,
-        response: Response,
+        scope: Scope,
+        status_code: int,
         response_time_ms: int,
-    ):
-        """Track analytics data."""
+    ) -> None:
+        """Queue analytics rows for the batched writer."""
         try:
+            path = scope["path"]
+
             # Skip tracking for admin endpoints (to avoid recursion)
-            if request.url.path.startswith("/api/v1/admin"):
+            if path.startswith("/api/v1/admin"):
                 return
-            
+
             # Skip tracking for health checks and docs
-            if request.url.path in ["/health", "/docs", "/openapi.json", "/redoc"]:
+            if path in UNTRACKED_PATHS:
                 return
-            
+
+            request = Request(scope)
+
             # Get user ID from request state if available (set by auth dependency)
-            user_id = None
-            if hasattr(request.state, "user") and request.state.user:
-                user_id = request.state.user.id
-            
+            user = getattr(request.state, "user", None)
+            user_id = user.id if user else None
+
             # Extract IP address
             ip_address = request.client.host if request.client else None
-            
-            # Track site visit for non-API routes
-            if not request.url.path.startswith("/api/"):
-                async with async_session_maker() as db:
-                    visit = SiteVisit(
-                        user_id=user_id,
-                        path=str(request.url.path),
-                        method=request.method,
-                        ip_address=ip_address,
-                        user_agent=request.headers.get("user-agent"),
-                        referer=request.headers.get("referer"),
-                        session_id=request.cookies.get("session_id"),
-                    )
-                    db.add(visit)
-                    await db.commit()
-            
+            created_at = datetime.now(timezone.utc)
+
             # Track API usage
-            if request.url.path.startswith("/api/"):
-                async with async_session_maker() as db:
-                    usage = ApiUsage(
-                        user_id=user_id,
-                        endpoint=str(request.url.path),
-                        method=request.method,
-                        status_code=response.status_code,
-                        response_time_ms=response_time_ms,
-                        ip_address=ip_address,
-                        error_message=None if response.status_code < 400 else f"HTTP {response.status_code}",
-                    )
-                    db.add(usage)
-                    await db.commit()
+            if path.startswith("/api/"):
+                analytics_writer.enqueue(
+                    "api_usage",
+                    {
+                        "id": uuid4(),
+                        "user_id": user_id,
+                        "endpoint": path[:500],
+                        "method": request.method,
+                        "status_code": status_code,
+                        "response_time_ms": response_time_ms,
+                        "ip_address": ip_address,
+                        "error_message": None if status_code < 400 else f"HTTP {status_code}",
+                        "created_at": created_at,
+                    },
+                )
+                return
+
+            # Track site visit for non-API routes
+            analytics_writer.enqueue(
+                "site_visit",
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "path": path[:500],
+                    "method": request.method,
+                    "ip_address": ip_address,
+                    "user_agent": request.headers.get("user-agent"),
+                    "referer": (request.headers.get("referer") or "")[:500] or None,
+                    "session_id": request.cookies.get("session_id"),
+                    "created_at": created_at,
+                },
+            )
         except Exception:
             # Silently fail - don't break the request if analytics fails
             pass
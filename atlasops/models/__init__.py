@@ -2,10 +2,24 @@
 
 from atlasops.models.user import User, UserProfile
 from atlasops.models.electracast import ElectraCastProfile, ElectraCastPodcast
-from atlasops.models.job import JobPosting, CompanyDeepDive
+from atlasops.models.job import (
+    JobPosting,
+    CompanyDeepDive,
+    ScrapeCacheEntry,
+    ScrapeArtifact,
+    JobProcessingMetric,
+    HtmlBlob,
+)
 from atlasops.models.application import Application, ApplicationEvent
 from atlasops.models.resume import GeneratedResume
-from atlasops.models.analytics import SiteVisit, ApiUsage, SecurityEvent
+from atlasops.models.analytics import (
+    SiteVisit,
+    ApiUsage,
+    SecurityEvent,
+    ApiUsageRollup,
+    SiteVisitRollup,
+    SiteVisitDailySession,
+)
 
 __all__ = [
     "User",
@@ -14,10 +28,17 @@ __all__ = [
     "ElectraCastPodcast",
     "JobPosting",
     "CompanyDeepDive",
+    "ScrapeCacheEntry",
+    "ScrapeArtifact",
+    "JobProcessingMetric",
+    "HtmlBlob",
     "Application",
     "ApplicationEvent",
     "GeneratedResume",
     "SiteVisit",
     "ApiUsage",
     "SecurityEvent",
+    "ApiUsageRollup",
+    "SiteVisitRollup",
+    "SiteVisitDailySession",
 ]
@@ -1,10 +1,20 @@
 """Analytics and tracking models for admin dashboard."""
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,9 +22,17 @@ from atlasops.db import Base
 
 
 class SiteVisit(Base):
-    """Track page visits and user navigation."""
+    """Track page visits and user navigation.
+
+    Range-partitioned by month on ``created_at``; see
+    ``atlasops.services.analytics_partitions`` for maintenance and retention.
+    """
 
     __tablename__ = "site_visits"
+    __table_args__ = (
+        Index("ix_site_visits_created_at", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -31,15 +49,22 @@ class SiteVisit(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
 
 
 class ApiUsage(Base):
-    """Track API endpoint usage and performance."""
+    """Track API endpoint usage and performance.
+
+    Range-partitioned by month on ``created_at``; see
+    ``atlasops.services.analytics_partitions`` for maintenance and retention.
+    """
 
     __tablename__ = "api_usage"
+    __table_args__ = (
+        Index("ix_api_usage_created_at", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -56,8 +81,7 @@ class ApiUsage(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
 
 
@@ -90,3 +114,75 @@ class SecurityEvent(Base):
         nullable=False,
         index=True,
     )
+
+
+class ApiUsageRollup(Base):
+    """Pre-aggregated API usage per time bucket, endpoint, method and status class."""
+
+    __tablename__ = "api_usage_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "endpoint",
+            "method",
+            "status_class",
+            name="uq_api_usage_rollups_bucket",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    granularity: Mapped[str] = mapped_column(String(8), nullable=False)  # hour, day
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    endpoint: Mapped[str] = mapped_column(String(500), nullable=False)
+    method: Mapped[str] = mapped_column(String(10), nullable=False)
+    status_class: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 2 = 2xx, 4 = 4xx...
+    request_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_response_time_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    max_response_time_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class SiteVisitRollup(Base):
+    """Pre-aggregated site visits per time bucket, path and method."""
+
+    __tablename__ = "site_visit_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "path",
+            "method",
+            name="uq_site_visit_rollups_bucket",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    granularity: Mapped[str] = mapped_column(String(8), nullable=False)  # hour, day
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
+    method: Mapped[str] = mapped_column(String(10), nullable=False)
+    visit_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class SiteVisitDailySession(Base):
+    """Distinct visitor sessions per day, for unique-visitor counts."""
+
+    __tablename__ = "site_visit_daily_sessions"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    session_id: Mapped[str] = mapped_column(String(255), primary_key=True)
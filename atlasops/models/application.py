@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +33,14 @@ class Application(Base):
     """Job application tracking."""
 
     __tablename__ = "applications"
+    __table_args__ = (
+        # Serves the stale-applications sweep without scanning closed rows
+        Index(
+            "ix_applications_applied_updated_at",
+            "updated_at",
+            postgresql_where=text("status = 'applied'"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
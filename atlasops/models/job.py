@@ -4,7 +4,16 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +24,17 @@ if TYPE_CHECKING:
     from atlasops.models.resume import GeneratedCoverLetter, GeneratedResume
     from atlasops.models.user import User
 
+# Fields filled by extraction that users can also edit (PATCH /jobs/{id})
+EXTRACTED_FIELDS = (
+    "company_name",
+    "job_title",
+    "location",
+    "remote_policy",
+    "salary_range",
+    "job_description",
+    "requirements",
+    "benefits",
+)
 
 class JobPosting(Base):
     """Job posting with raw and structured data."""
@@ -43,6 +63,8 @@ class JobPosting(Base):
     requirements: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     benefits: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     structured_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Extracted fields the user has edited; rechecks don't overwrite them
+    user_edited_fields: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
 
     # Processing status
     status: Mapped[str] = mapped_column(
@@ -51,6 +73,17 @@ class JobPosting(Base):
     extraction_confidence: Mapped[Optional[float]] = mapped_column(nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Liveness rechecks (conditional requests against the posting URL)
+    etag: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    last_checked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), index=True, nullable=True
+    )
+    closed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )  # set when the posting URL returns 404/410
+
     # Application tracking (built-in status without separate Application entity)
     application_status: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True
@@ -120,3 +153,121 @@ class CompanyDeepDive(Base):
     job_posting: Mapped["JobPosting"] = relationship(
         "JobPosting", back_populates="deep_dive"
     )
+
+
+class ScrapeCacheEntry(Base):
+    """Fetched HTML, extracted text and LLM extraction for a normalized URL.
+
+    Keyed by ``compute_url_hash`` so repeat ingests of the same posting (by any
+    user) can reuse the result without a network or LLM call.
+    """
+
+    __tablename__ = "scrape_cache"
+
+    url_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    url: Mapped[str] = mapped_column(String(2048))
+    html_gz: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)  # zlib
+    raw_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    extracted: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    miss_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+class ScrapeArtifact(Base):
+    """Intermediate output of the staged scrape pipeline for one job posting.
+
+    The fetch stage stores the compressed HTML and the parse stage adds the
+    extracted text, so a retried stage resumes from the previous stage's
+    result. Removed once the job is finished (by the LLM stage, or by the
+    parse stage for pages with schema.org JobPosting data); artifacts of
+    jobs that never finish are purged after SCRAPE_ARTIFACT_TTL_HOURS.
+    """
+
+    __tablename__ = "scrape_artifacts"
+
+    job_posting_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("job_postings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    stage: Mapped[str] = mapped_column(String(20))  # fetched, parsed
+    fetched_with: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
+    )  # httpx, playwright, cache
+    html_gz: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)  # zlib
+    raw_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class JobProcessingMetric(Base):
+    """Timing and resource usage of one scrape pipeline step for a job posting.
+
+    ``stage`` is one of fetch, parse, structured (schema.org extraction that
+    replaced the LLM call) or llm. Fetch rows are written per fetcher
+    attempted (httpx, playwright, cache, or an ATS API such as greenhouse-api)
+    with ``success`` marking the one that produced usable content; parse and
+    llm rows carry the fetcher whose content they processed (``extension`` for
+    extension-supplied HTML). ``prompt_tokens_saved`` is what prompt
+    compaction removed from an llm call's input and ``limiter_wait_ms`` how
+    long it queued in the LLM call limiter.
+    """
+
+    __tablename__ = "job_processing_metrics"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    job_posting_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("job_postings.id", ondelete="CASCADE"), index=True
+    )
+    stage: Mapped[str] = mapped_column(String(20))
+    host: Mapped[Optional[str]] = mapped_column(String(255), index=True, nullable=True)
+    fetcher: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    success: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    duration_ms: Mapped[float] = mapped_column(Float)
+    bytes_fetched: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    chars_extracted: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    completion_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    prompt_tokens_saved: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    limiter_wait_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+    )
+
+
+class HtmlBlob(Base):
+    """Compressed page HTML stored once per distinct content.
+
+    Keyed by the SHA-256 of the HTML so tasks can be queued with a short
+    reference instead of the page itself.
+    """
+
+    __tablename__ = "html_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data_gz: Mapped[bytes] = mapped_column(LargeBinary)  # zlib
+    size_bytes: Mapped[int] = mapped_column(Integer)  # uncompressed
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+    )
@@ -72,6 +72,9 @@ class JobPostingResponse(BaseModel):
     benefits: Optional[List[str]] = None  # Benefits are returned as a list from LLM
     extraction_confidence: Optional[float] = None
     error_message: Optional[str] = None
+    # Liveness recheck fields
+    last_checked_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
     # Application tracking fields
     application_status: Optional[str] = None
     interview_date: Optional[datetime] = None
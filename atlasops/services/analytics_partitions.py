@@ -0,0 +1,156 @@
+"""Monthly partition maintenance and retention for raw analytics tables.
+
+Each table also has a DEFAULT partition, so inserts don't fail for a month
+whose partition is missing (say, if maintenance stopped running). When that
+month's partition is created, its rows are moved out of the default one.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Range-partitioned (by created_at, monthly) append-only tables
+PARTITIONED_TABLES = ("api_usage", "site_visits")
+
+_PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def _partition_month(table: str, name: str) -> Optional[date]:
+    if not name.startswith(f"{table}_"):
+        return None
+    match = _PARTITION_SUFFIX.search(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def list_partitions(db: AsyncSession, table: str) -> dict[str, date]:
+    """Return ``{partition_name: month_start}`` for a partitioned table."""
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    partitions = {}
+    for (name,) in result.all():
+        month = _partition_month(table, name)
+        if month is not None:
+            partitions[name] = month
+    return partitions
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    table: str,
+    months_ahead: int,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Create any missing partitions from the current month to ``months_ahead``.
+
+    A new partition is filled with its month's rows from the default
+    partition before being attached.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    current = date(today.year, today.month, 1)
+    existing = await list_partitions(db, table)
+    default = default_partition_name(table)
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+        start, end = month.isoformat(), add_months(month, 1).isoformat()
+        await db.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {name} (LIKE {table} INCLUDING DEFAULTS)")
+        )
+        await db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} "
+                f"WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await db.execute(
+            text(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+async def drop_expired_partitions(
+    db: AsyncSession,
+    table: str,
+    retention_days: int,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Detach and drop partitions whose whole month is older than the horizon.
+
+    Rows of those months left in the default partition are deleted too.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    horizon = today - timedelta(days=retention_days)
+    horizon_month = date(horizon.year, horizon.month, 1)
+    await db.execute(
+        text(
+            f"DELETE FROM {default_partition_name(table)} "
+            f"WHERE created_at < '{horizon_month.isoformat()}'"
+        )
+    )
+
+    dropped = []
+    for name, month in sorted((await list_partitions(db, table)).items()):
+        if add_months(month, 1) > horizon:
+            continue
+        await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
+
+
+async def maintain_partitions(
+    db: AsyncSession,
+    retention_days: int,
+    months_ahead: int,
+) -> dict[str, Any]:
+    """Pre-create upcoming partitions and drop expired ones for every table."""
+    summary: dict[str, Any] = {}
+    for table in PARTITIONED_TABLES:
+        created = await ensure_partitions(db, table, months_ahead)
+        dropped = await drop_expired_partitions(db, table, retention_days)
+        await db.commit()
+        summary[table] = {"created": created, "dropped": dropped}
+        logger.info(
+            f"Partition maintenance for {table}: "
+            f"created {created or 'none'}, dropped {dropped or 'none'}"
+        )
+    return summary
@@ -0,0 +1,262 @@
+"""Incremental hourly/daily rollups of raw analytics events."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import and_, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from atlasops.models.analytics import (
+    ApiUsage,
+    ApiUsageRollup,
+    SiteVisit,
+    SiteVisitDailySession,
+    SiteVisitRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+HOUR = "hour"
+DAY = "day"
+
+# Rows can land in the raw tables a little after their created_at (buffered
+# writer, clock skew), so each run re-aggregates this much history.
+LATE_ARRIVAL_GRACE = timedelta(hours=1)
+
+# Upper bound on raw history aggregated per transaction during backfill
+CHUNK = timedelta(days=1)
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(value: datetime) -> datetime:
+    return datetime.combine(value.date(), time.min, tzinfo=value.tzinfo or timezone.utc)
+
+
+def ceil_day(value: datetime) -> datetime:
+    start = floor_day(value)
+    return start if start == value else start + timedelta(days=1)
+
+
+def rollup_window(model, cutoff: datetime):
+    """Filter selecting the rollup rows that cover ``[cutoff, now)``.
+
+    Whole days come from daily rows; the partial first day comes from hourly
+    rows, so the number of rows read depends on the window length, not on
+    raw event volume.
+    """
+    day_boundary = ceil_day(cutoff)
+    return or_(
+        and_(model.granularity == DAY, model.bucket_start >= day_boundary),
+        and_(
+            model.granularity == HOUR,
+            model.bucket_start >= floor_hour(cutoff),
+            model.bucket_start < day_boundary,
+        ),
+    )
+
+
+async def _start_for(db: AsyncSession, rollup_model, raw_model) -> Optional[datetime]:
+    """Return where incremental aggregation should resume for a source table."""
+    last_bucket = (
+        await db.execute(
+            select(func.max(rollup_model.bucket_start)).where(rollup_model.granularity == HOUR)
+        )
+    ).scalar()
+    if last_bucket is not None:
+        return last_bucket - LATE_ARRIVAL_GRACE
+
+    first_event = (await db.execute(select(func.min(raw_model.created_at)))).scalar()
+    return floor_hour(first_event) if first_event is not None else None
+
+
+async def _rollup_api_usage_hours(db: AsyncSession, start: datetime, end: datetime) -> None:
+    bucket = func.date_trunc("hour", ApiUsage.created_at)
+    status_class = ApiUsage.status_code // 100
+    source = (
+        select(
+            literal(HOUR),
+            bucket,
+            ApiUsage.endpoint,
+            ApiUsage.method,
+            status_class,
+            func.count(),
+            func.count().filter(ApiUsage.status_code >= 400),
+            func.sum(ApiUsage.response_time_ms),
+            func.max(ApiUsage.response_time_ms),
+            func.now(),
+        )
+        .where(ApiUsage.created_at >= start, ApiUsage.created_at < end)
+        .group_by(bucket, ApiUsage.endpoint, ApiUsage.method, status_class)
+    )
+    await db.execute(_upsert_api_usage(source))
+
+
+async def _rollup_api_usage_days(db: AsyncSession, start: datetime, end: datetime) -> None:
+    bucket = func.date_trunc("day", ApiUsageRollup.bucket_start)
+    source = (
+        select(
+            literal(DAY),
+            bucket,
+            ApiUsageRollup.endpoint,
+            ApiUsageRollup.method,
+            ApiUsageRollup.status_class,
+            func.sum(ApiUsageRollup.request_count),
+            func.sum(ApiUsageRollup.error_count),
+            func.sum(ApiUsageRollup.total_response_time_ms),
+            func.max(ApiUsageRollup.max_response_time_ms),
+            func.now(),
+        )
+        .where(
+            ApiUsageRollup.granularity == HOUR,
+            ApiUsageRollup.bucket_start >= start,
+            ApiUsageRollup.bucket_start < end,
+        )
+        .group_by(
+            bucket,
+            ApiUsageRollup.endpoint,
+            ApiUsageRollup.method,
+            ApiUsageRollup.status_class,
+        )
+    )
+    await db.execute(_upsert_api_usage(source))
+
+
+def _upsert_api_usage(source):
+    stmt = pg_insert(ApiUsageRollup).from_select(
+        [
+            "granularity",
+            "bucket_start",
+            "endpoint",
+            "method",
+            "status_class",
+            "request_count",
+            "error_count",
+            "total_response_time_ms",
+            "max_response_time_ms",
+            "updated_at",
+        ],
+        source,
+    )
+    return stmt.on_conflict_do_update(
+        constraint="uq_api_usage_rollups_bucket",
+        set_={
+            "request_count": stmt.excluded.request_count,
+            "error_count": stmt.excluded.error_count,
+            "total_response_time_ms": stmt.excluded.total_response_time_ms,
+            "max_response_time_ms": stmt.excluded.max_response_time_ms,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+async def _rollup_site_visit_hours(db: AsyncSession, start: datetime, end: datetime) -> None:
+    bucket = func.date_trunc("hour", SiteVisit.created_at)
+    source = (
+        select(
+            literal(HOUR),
+            bucket,
+            SiteVisit.path,
+            SiteVisit.method,
+            func.count(),
+            func.now(),
+        )
+        .where(SiteVisit.created_at >= start, SiteVisit.created_at < end)
+        .group_by(bucket, SiteVisit.path, SiteVisit.method)
+    )
+    await db.execute(_upsert_site_visits(source))
+
+    sessions = pg_insert(SiteVisitDailySession).from_select(
+        ["day", "session_id"],
+        select(func.date(SiteVisit.created_at), SiteVisit.session_id)
+        .where(
+            SiteVisit.created_at >= start,
+            SiteVisit.created_at < end,
+            SiteVisit.session_id.isnot(None),
+        )
+        .distinct(),
+    )
+    await db.execute(sessions.on_conflict_do_nothing())
+
+
+async def _rollup_site_visit_days(db: AsyncSession, start: datetime, end: datetime) -> None:
+    bucket = func.date_trunc("day", SiteVisitRollup.bucket_start)
+    source = (
+        select(
+            literal(DAY),
+            bucket,
+            SiteVisitRollup.path,
+            SiteVisitRollup.method,
+            func.sum(SiteVisitRollup.visit_count),
+            func.now(),
+        )
+        .where(
+            SiteVisitRollup.granularity == HOUR,
+            SiteVisitRollup.bucket_start >= start,
+            SiteVisitRollup.bucket_start < end,
+        )
+        .group_by(bucket, SiteVisitRollup.path, SiteVisitRollup.method)
+    )
+    await db.execute(_upsert_site_visits(source))
+
+
+def _upsert_site_visits(source):
+    stmt = pg_insert(SiteVisitRollup).from_select(
+        ["granularity", "bucket_start", "path", "method", "visit_count", "updated_at"],
+        source,
+    )
+    return stmt.on_conflict_do_update(
+        constraint="uq_site_visit_rollups_bucket",
+        set_={
+            "visit_count": stmt.excluded.visit_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+async def _refresh_source(
+    db: AsyncSession,
+    rollup_model,
+    raw_model,
+    rollup_hours,
+    rollup_days,
+    now: datetime,
+) -> int:
+    start = await _start_for(db, rollup_model, raw_model)
+    if start is None:
+        return 0
+
+    end = floor_hour(now) + timedelta(hours=1)
+    chunks = 0
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + CHUNK, end)
+        await rollup_hours(db, chunk_start, chunk_end)
+        # Re-derive every day touched by this chunk from its hourly rows
+        await rollup_days(db, floor_day(chunk_start), ceil_day(chunk_end))
+        await db.commit()
+        chunks += 1
+        chunk_start = chunk_end
+    return chunks
+
+
+async def refresh_rollups(db: AsyncSession, now: Optional[datetime] = None) -> dict[str, Any]:
+    """Bring hourly and daily rollups up to date with the raw event tables."""
+    now = now or datetime.now(timezone.utc)
+    api_chunks = await _refresh_source(
+        db, ApiUsageRollup, ApiUsage, _rollup_api_usage_hours, _rollup_api_usage_days, now
+    )
+    visit_chunks = await _refresh_source(
+        db, SiteVisitRollup, SiteVisit, _rollup_site_visit_hours, _rollup_site_visit_days, now
+    )
+    logger.info(
+        f"Refreshed analytics rollups ({api_chunks} api_usage chunk(s), "
+        f"{visit_chunks} site_visits chunk(s))"
+    )
+    return {"api_usage_chunks": api_chunks, "site_visit_chunks": visit_chunks}
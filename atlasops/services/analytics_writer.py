@@ -0,0 +1,176 @@
+"""Buffered, batched writer for analytics rows."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from sqlalchemy import insert
+
+from atlasops.config import get_settings
+from atlasops.db import async_session_maker
+from atlasops.models.analytics import ApiUsage, SiteVisit
+
+logger = logging.getLogger(__name__)
+
+# Row kinds accepted by the writer, mapped to their ORM model
+ANALYTICS_MODELS = {
+    "site_visit": SiteVisit,
+    "api_usage": ApiUsage,
+}
+
+
+@dataclass(slots=True)
+class AnalyticsWriterStats:
+    """Counters exposed by the analytics writer."""
+
+    queued: int = 0
+    flushed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class AnalyticsWriter:
+    """In-process bounded queue with a background bulk-insert flusher.
+
+    Requests enqueue plain row dicts without touching the database. A single
+    background task drains the queue and bulk-inserts rows in batches, flushing
+    whenever ``batch_size`` rows are pending or ``flush_interval`` seconds have
+    passed. When the queue is full, new rows are dropped rather than blocking
+    the request.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = AnalyticsWriterStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="analytics-writer")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out everything still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._drain()
+        self._queue = None
+
+    def enqueue(self, kind: str, row: dict[str, Any]) -> bool:
+        """Queue a row for insertion. Returns False if the row was dropped."""
+        if kind not in ANALYTICS_MODELS:
+            raise ValueError(f"Unknown analytics row kind: {kind}")
+        if self._queue is None:
+            self.stats.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait((kind, row))
+        except asyncio.QueueFull:
+            self.stats.dropped += 1
+            return False
+        self.stats.queued += 1
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current counters and queue depth."""
+        return {
+            **asdict(self.stats),
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Shutting down: write the partial batch before exiting
+                if batch:
+                    await self._flush(batch)
+                raise
+
+            flush = asyncio.ensure_future(self._flush(batch))
+            try:
+                await asyncio.shield(flush)
+            except asyncio.CancelledError:
+                # Shutting down mid-flush: let the write finish before exiting
+                await flush
+                raise
+
+    async def _drain(self) -> None:
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for kind, row in batch:
+            grouped.setdefault(kind, []).append(row)
+
+        try:
+            async with async_session_maker() as db:
+                for kind, rows in grouped.items():
+                    await db.execute(insert(ANALYTICS_MODELS[kind]), rows)
+                await db.commit()
+        except Exception:
+            # Analytics must never take the app down; count and move on
+            logger.exception(f"Failed to flush {len(batch)} analytics rows")
+            self.stats.failed += len(batch)
+            return
+
+        self.stats.flushed += len(batch)
+        self.stats.batches += 1
+
+
+def _build_writer() -> AnalyticsWriter:
+    settings = get_settings()
+    return AnalyticsWriter(
+        max_queue_size=settings.analytics_queue_size,
+        batch_size=settings.analytics_batch_size,
+        flush_interval=settings.analytics_flush_interval_seconds,
+    )
+
+
+# Singleton instance
+analytics_writer = _build_writer()
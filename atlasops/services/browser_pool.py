@@ -0,0 +1,141 @@
+"""Long-lived Playwright browser pool for JS-rendered scraping."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from atlasops.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Resource types never needed to read a job posting's text
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+class BrowserPool:
+    """One Chromium process shared by many short-lived contexts.
+
+    Each fetch gets a fresh browser context (isolated cookies/storage) and
+    page. Concurrency is bounded by a semaphore, and the browser is relaunched
+    after ``max_pages`` pages or when it disconnects (crash).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        max_pages: int = 200,
+        block_resources: bool = True,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_pages = max_pages
+        self.block_resources = block_resources
+        self.user_agent = user_agent
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._pages_served = 0
+        self._active = 0
+        self.launches = 0
+
+    async def _ensure_browser(self) -> Any:
+        async with self._lock:
+            if self._browser is not None and not self._browser.is_connected():
+                logger.warning("Chromium disconnected; relaunching")
+                await self._close_browser()
+            # Recycle worn browsers once in-flight pages on them are done
+            elif self._browser is not None and self._pages_served >= self.max_pages and self._active == 0:
+                logger.info(f"Recycling Chromium after {self._pages_served} page(s)")
+                await self._close_browser()
+
+            if self._browser is None:
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._pages_served = 0
+                self.launches += 1
+            return self._browser
+
+    async def _close_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                logger.warning("Error closing Chromium", exc_info=True)
+
+    @staticmethod
+    async def _block_route(route) -> None:
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Yield a fresh page in its own browser context."""
+        async with self._semaphore:
+            browser = await self._ensure_browser()
+            self._active += 1
+            self._pages_served += 1
+            context = None
+            try:
+                context = await browser.new_context(user_agent=self.user_agent)
+                if self.block_resources:
+                    await context.route("**/*", self._block_route)
+                yield await context.new_page()
+            finally:
+                self._active -= 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        logger.warning("Error closing browser context", exc_info=True)
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        async with self._lock:
+            await self._close_browser()
+            playwright, self._playwright = self._playwright, None
+            if playwright is not None:
+                await playwright.stop()
+
+
+# Process-wide pool, bound to the event loop it was created on
+_pool: Optional[BrowserPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the shared browser pool, creating it on first use."""
+    global _pool, _pool_loop
+
+    from atlasops.services.scraper import USER_AGENT
+
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        _pool = BrowserPool(
+            max_concurrency=settings.playwright_max_concurrency,
+            max_pages=settings.playwright_pages_per_browser,
+            block_resources=settings.playwright_block_resources,
+            user_agent=USER_AGENT,
+        )
+        _pool_loop = loop
+    return _pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the shared browser pool (worker shutdown hook)."""
+    global _pool, _pool_loop
+
+    pool, _pool, _pool_loop = _pool, None, None
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,192 @@
+"""Per-host scrape politeness: token buckets and concurrency caps in Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+from atlasops.config import get_settings
+from atlasops.utils.url_validator import JOB_SITE_LIMITS, HostLimit, match_job_site
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "scrape:host"
+
+# Atomically take a concurrency slot and a token, or report how long to wait.
+# KEYS: bucket hash, lease sorted set
+# ARGV: tokens per second, burst, max concurrency, lease id, lease seconds
+# Returns {1, 0} when acquired, else {0, wait_ms}.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cap = tonumber(ARGV[3])
+local lease_seconds = tonumber(ARGV[5])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+if redis.call('ZCARD', KEYS[2]) >= cap then
+  return {0, 1000}
+end
+
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens') or burst)
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts') or now)
+tokens = math.min(burst, tokens + math.max(now - ts, 0) * rate)
+if tokens < 1 then
+  redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+  return {0, math.ceil((1 - tokens) / rate * 1000)}
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 3600)
+redis.call('ZADD', KEYS[2], now + lease_seconds, ARGV[4])
+redis.call('EXPIRE', KEYS[2], lease_seconds + 60)
+return {1, 0}
+"""
+
+# Empty a bucket so every worker holds off the host for ARGV[2] seconds.
+_PENALIZE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('HSET', KEYS[1], 'tokens', -tonumber(ARGV[1]) * tonumber(ARGV[2]), 'ts', now)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]) + 3600)
+return 1
+"""
+
+
+@dataclass
+class HostSlot:
+    """Outcome of a slot request: a lease to release, or a time to wait."""
+
+    key: str
+    lease_id: Optional[str] = None
+    wait_seconds: float = 0.0
+
+    @property
+    def acquired(self) -> bool:
+        return self.lease_id is not None
+
+
+def host_limit(url: str) -> Tuple[str, HostLimit]:
+    """Return the limiter key and limit for a URL.
+
+    Known job sites share one budget across their subdomains; other hosts
+    are limited individually.
+    """
+    site = match_job_site(url)
+    if site is None:
+        host = (urlparse(url).hostname or "").lower()
+        site = host[4:] if host.startswith("www.") else host
+    limit = JOB_SITE_LIMITS.get(site) or HostLimit(
+        requests_per_minute=settings.scrape_host_requests_per_minute,
+        burst=settings.scrape_host_burst,
+        max_concurrency=settings.scrape_host_max_concurrency,
+    )
+    return site, limit
+
+
+# Process-wide Redis client, bound to the event loop it was created on
+_redis = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_redis():
+    """Return the shared async Redis client, creating it on first use."""
+    global _redis, _redis_loop
+
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(settings.redis_url)
+        _redis_loop = loop
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (worker shutdown hook)."""
+    global _redis, _redis_loop
+
+    client, _redis, _redis_loop = _redis, None, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _try_acquire(key: str, limit: HostLimit) -> HostSlot:
+    lease_id = uuid.uuid4().hex
+    acquired, wait_ms = await get_redis().eval(
+        _ACQUIRE_SCRIPT,
+        2,
+        f"{KEY_PREFIX}:{key}:bucket",
+        f"{KEY_PREFIX}:{key}:leases",
+        limit.requests_per_minute / 60,
+        limit.burst,
+        limit.max_concurrency,
+        lease_id,
+        settings.scrape_host_lease_seconds,
+    )
+    if acquired:
+        return HostSlot(key, lease_id=lease_id)
+    return HostSlot(key, wait_seconds=int(wait_ms) / 1000)
+
+
+async def acquire(url: str) -> HostSlot:
+    """Take a fetch slot for a URL's host.
+
+    Waits inline for up to SCRAPE_HOST_MAX_INLINE_WAIT_SECONDS; past that the
+    returned slot is not acquired and ``wait_seconds`` says when to come back
+    (with jitter, so deferred fetches don't return in lockstep). If Redis is
+    unreachable the fetch is allowed rather than blocked.
+    """
+    key, limit = host_limit(url)
+    if not settings.scrape_host_limits_enabled:
+        return HostSlot(key, lease_id="")
+
+    waited = 0.0
+    try:
+        while True:
+            slot = await _try_acquire(key, limit)
+            if slot.acquired:
+                return slot
+            if waited + slot.wait_seconds > settings.scrape_host_max_inline_wait_seconds:
+                slot.wait_seconds *= random.uniform(1.0, 1.5)
+                return slot
+            await asyncio.sleep(slot.wait_seconds)
+            waited += slot.wait_seconds
+    except Exception:
+        logger.warning(f"Host limiter unavailable; not limiting {key}", exc_info=True)
+        return HostSlot(key, lease_id="")
+
+
+async def release(slot: HostSlot) -> None:
+    """Give back a slot's concurrency lease."""
+    if not slot.lease_id:
+        return
+    try:
+        await get_redis().zrem(f"{KEY_PREFIX}:{slot.key}:leases", slot.lease_id)
+    except Exception:
+        logger.warning(f"Failed to release host slot for {slot.key}", exc_info=True)
+
+
+async def penalize(url: str, seconds: float) -> None:
+    """Hold off every worker from a host that answered 429."""
+    key, limit = host_limit(url)
+    if not settings.scrape_host_limits_enabled:
+        return
+    try:
+        await get_redis().eval(
+            _PENALIZE_SCRIPT,
+            1,
+            f"{KEY_PREFIX}:{key}:bucket",
+            limit.requests_per_minute / 60,
+            seconds,
+        )
+        logger.info(f"Backing off {key} for {seconds}s after HTTP 429")
+    except Exception:
+        logger.warning(f"Failed to back off {key}", exc_info=True)
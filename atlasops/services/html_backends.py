@@ -0,0 +1,161 @@
+"""Pluggable HTML parser backends for scraper text extraction.
+
+``extract_text_from_html`` only needs a handful of operations on a parsed
+page (CSS ``select_one``, stripped text of a node, the section under a
+heading, whole-page text minus boilerplate tags). Each backend implements
+them with BeautifulSoup's text semantics, so every backend produces the same
+output; ``scripts/bench_html_backends.py`` checks that against a fixture
+corpus and reports pages per second.
+
+Backends, fastest first:
+
+- ``selectolax``: lexbor (C) parser and CSS engine
+- ``lxml``: BeautifulSoup tree built by the libxml2 (C) parser
+- ``html.parser``: BeautifulSoup with the pure-Python parser (the original path)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, List, Optional
+
+from atlasops.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+
+class SoupPage:
+    """Page parsed into a BeautifulSoup tree."""
+
+    def __init__(self, html: str, features: str) -> None:
+        from bs4 import BeautifulSoup
+
+        self.soup = BeautifulSoup(html, features)
+
+    def select_one(self, selector: str) -> Optional[Any]:
+        return self.soup.select_one(selector)
+
+    def text(self, node: Any, separator: str = "") -> str:
+        return node.get_text(separator=separator, strip=True)
+
+    def section_under_heading(self, tag: str, phrase: str) -> Optional[Any]:
+        """Nearest section (else div) around a ``tag`` whose text contains ``phrase``."""
+        heading = self.soup.find(tag, string=lambda t: t and phrase in t.lower())
+        if heading is None:
+            return None
+        return heading.find_parent("section") or heading.find_parent("div")
+
+    def page_text(self, drop_tags: Iterable[str]) -> str:
+        for element in self.soup(list(drop_tags)):
+            element.decompose()
+        return self.soup.get_text(separator=" ", strip=True)
+
+
+class SelectolaxPage:
+    """Page parsed with selectolax's lexbor engine."""
+
+    def __init__(self, html: str) -> None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        self.tree = LexborHTMLParser(html)
+
+    def select_one(self, selector: str) -> Optional[Any]:
+        return self.tree.css_first(selector)
+
+    def text(self, node: Any, separator: str = "") -> str:
+        # Same as BeautifulSoup's get_text(strip=True): strip every text
+        # node, drop the empty ones, join the rest
+        parts = []
+        for child in node.traverse(include_text=True):
+            if child.tag == "-text":
+                stripped = child.text_content.strip()
+                if stripped:
+                    parts.append(stripped)
+        return separator.join(parts)
+
+    @classmethod
+    def _string(cls, node: Any) -> Optional[str]:
+        # BeautifulSoup's Tag.string: the text of a lone text child, looking
+        # through single-child wrappers
+        children = list(node.iter(include_text=True))
+        if len(children) != 1:
+            return None
+        child = children[0]
+        if child.tag == "-text":
+            return child.text_content
+        if child.tag.startswith("-"):
+            return None
+        return cls._string(child)
+
+    @staticmethod
+    def _find_parent(node: Any, tag: str) -> Optional[Any]:
+        parent = node.parent
+        while parent is not None:
+            if parent.tag == tag:
+                return parent
+            parent = parent.parent
+        return None
+
+    def section_under_heading(self, tag: str, phrase: str) -> Optional[Any]:
+        """Nearest section (else div) around a ``tag`` whose text contains ``phrase``."""
+        for heading in self.tree.css(tag):
+            string = self._string(heading)
+            if string and phrase in string.lower():
+                return self._find_parent(heading, "section") or self._find_parent(heading, "div")
+        return None
+
+    def page_text(self, drop_tags: Iterable[str]) -> str:
+        self.tree.strip_tags(list(drop_tags))
+        return self.text(self.tree.root, " ")
+
+
+def _importable(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def available_backends() -> List[str]:
+    """Backends whose parser packages are installed, fastest first."""
+    available = []
+    if _importable("selectolax.lexbor"):
+        available.append("selectolax")
+    if _importable("bs4"):
+        if _importable("lxml"):
+            available.append("lxml")
+        available.append("html.parser")
+    return available
+
+
+_default_backend: Optional[str] = None
+
+
+def default_backend() -> Optional[str]:
+    """Backend chosen by SCRAPER_HTML_BACKEND ("auto" picks the fastest installed)."""
+    global _default_backend
+
+    if _default_backend is None:
+        available = available_backends()
+        configured = settings.scraper_html_backend
+        if configured != "auto" and configured in available:
+            _default_backend = configured
+        else:
+            if configured != "auto":
+                logger.warning(f"HTML backend '{configured}' is not installed; using auto")
+            _default_backend = available[0] if available else ""
+    return _default_backend or None
+
+
+def parse_html(html: str, backend: Optional[str] = None):
+    """Parse HTML with the given (or default) backend, or None if none is installed."""
+    backend = backend or default_backend()
+    if backend == "selectolax":
+        return SelectolaxPage(html)
+    if backend in ("lxml", "html.parser"):
+        return SoupPage(html, backend)
+    return None
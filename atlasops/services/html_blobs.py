@@ -0,0 +1,55 @@
+"""Content-addressed store for page HTML handed to background tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from atlasops.models.job import HtmlBlob
+from atlasops.services.scrape_cache import compress_html, decompress_html
+
+
+def _hash_and_compress(html: str) -> Tuple[str, bytes, int]:
+    data = html.encode("utf-8")
+    return hashlib.sha256(data).hexdigest(), compress_html(html), len(data)
+
+
+async def put(db: AsyncSession, html: str) -> str:
+    """Store HTML (once per distinct content) and return its reference."""
+    # Compressing multi-megabyte pages would stall the event loop
+    sha256, data_gz, size = await asyncio.to_thread(_hash_and_compress, html)
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(HtmlBlob).values(
+        sha256=sha256,
+        data_gz=data_gz,
+        size_bytes=size,
+        created_at=now,
+        last_used_at=now,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[HtmlBlob.sha256],
+            set_={"last_used_at": now},
+        )
+    )
+    return sha256
+
+
+async def get(db: AsyncSession, sha256: str) -> Optional[str]:
+    """Return the HTML stored under a reference, or None if it is gone."""
+    result = await db.execute(select(HtmlBlob.data_gz).where(HtmlBlob.sha256 == sha256))
+    data_gz = result.scalar_one_or_none()
+    return decompress_html(data_gz) if data_gz is not None else None
+
+
+async def purge_unused(db: AsyncSession, hours: int) -> int:
+    """Delete blobs not stored or reused for ``hours``. Returns the number removed."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    result = await db.execute(delete(HtmlBlob).where(HtmlBlob.last_used_at < cutoff))
+    return result.rowcount or 0
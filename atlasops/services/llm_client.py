@@ -1,27 +1,117 @@
 """Unified LLM client for all AI operations."""
 
+import asyncio
 import json
 import logging
+import random
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar
 
+import openai
 from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from atlasops.config import get_settings
+from atlasops.services.llm_cache import get_llm_cache, make_cache_key
+from atlasops.services.llm_limiter import INTERACTIVE, LLMLimiter
+from atlasops.services.prompt_compaction import compact, get_tokenizer
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 T = TypeVar("T", bound=BaseModel)
 
+# Token usage collector for the current task, set by track_usage()
+_usage: ContextVar[Optional[Dict[str, int]]] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[Dict[str, int]]:
+    """Collect token usage of the LLM calls made inside the block.
+
+    Usage is tracked per asyncio task, so concurrent callers don't mix counts.
+    Calls served from the response cache count toward ``cached_calls`` only.
+    ``prompt_tokens_saved`` is what prompt compaction removed from the inputs
+    and ``limiter_wait_ms`` the time spent queued in the call limiter.
+    """
+    usage = {
+        "calls": 0,
+        "cached_calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "prompt_tokens_saved": 0,
+        "limiter_wait_ms": 0.0,
+    }
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def _parse_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """The first {...} span of a completion as JSON, or None."""
+    match = re.search(r"\{[\s\S]*\}", text)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group())
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds from a 429's Retry-After (or OpenAI's retry-after-ms) header."""
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
 
 class LLMClient:
-    """Unified LLM client with structured output support."""
+    """Unified LLM client with structured output support.
+
+    Provider calls go through an adaptive limiter (see ``llm_limiter``).
+    ``priority`` marks a call as interactive (the default: a user is waiting)
+    or background (Celery tasks).
+    """
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # 429s and transient errors are retried here, through the limiter
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
         self.prompts_dir = Path(__file__).parent.parent / "prompts"
+        self.cache = get_llm_cache()
+        self.limiter = LLMLimiter(
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            requests_per_minute=settings.llm_requests_per_minute,
+            max_concurrency=settings.llm_max_concurrency,
+            min_concurrency=settings.llm_min_concurrency,
+            interactive_reserve=settings.llm_interactive_reserve,
+            latency_target_seconds=settings.llm_latency_target_seconds,
+            rate_limit_pause_seconds=settings.llm_rate_limit_pause_seconds,
+        )
+
+    def _estimate_tokens(self, params: Dict[str, Any]) -> int:
+        tokenizer = get_tokenizer(params.get("model"))
+        prompt_tokens = sum(
+            tokenizer.count(message.get("content") or "") for message in params["messages"]
+        )
+        completion_tokens = min(
+            params.get("max_tokens") or settings.llm_expected_completion_tokens,
+            settings.llm_expected_completion_tokens,
+        )
+        return prompt_tokens + completion_tokens
 
     def load_prompt(self, prompt_name: str) -> str:
         """Load a prompt template from the prompts directory."""
@@ -37,21 +127,98 @@ class LLMClient:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache_ttl: Optional[int] = None,
+        priority: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None,
     ) -> str:
-        """Generate a text completion."""
+        """Generate a text completion.
+
+        Pass ``cache_ttl`` (seconds) to serve repeated identical calls from the
+        local response cache when it is enabled. ``validate`` decides which
+        completions are usable enough to cache; by default any non-empty one.
+        """
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await self.client.chat.completions.create(
+        return await self._create_cached(
+            cache_ttl,
+            priority,
+            validate,
             model=model or settings.openai_model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
 
-        return response.choices[0].message.content or ""
+    async def _create_cached(
+        self,
+        cache_ttl: Optional[int],
+        priority: Optional[str],
+        validate: Optional[Callable[[str], bool]] = None,
+        **params: Any,
+    ) -> str:
+        """Create a chat completion, consulting the response cache if asked to.
+
+        Only completions that pass ``validate`` are cached (or served from the
+        cache), so a malformed answer is retried instead of replayed.
+        """
+        cache_key = None
+        if cache_ttl and self.cache is not None:
+            cache_key = make_cache_key(**params)
+            cached = await self.cache.get(cache_key)
+            if cached is not None and (validate is None or validate(cached)):
+                usage = _usage.get()
+                if usage is not None:
+                    usage["cached_calls"] += 1
+                return cached
+
+        response = await self._create_limited(priority or INTERACTIVE, params)
+        content = response.choices[0].message.content or ""
+
+        usage = _usage.get()
+        if usage is not None:
+            usage["calls"] += 1
+            if response.usage is not None:
+                usage["prompt_tokens"] += response.usage.prompt_tokens or 0
+                usage["completion_tokens"] += response.usage.completion_tokens or 0
+
+        if cache_key is not None and content and (validate is None or validate(content)):
+            await self.cache.set(cache_key, content, cache_ttl)
+        return content
+
+    async def _create_limited(self, priority: str, params: Dict[str, Any]):
+        """Create a chat completion through the limiter, retrying 429s and
+        transient provider errors."""
+        estimated_tokens = self._estimate_tokens(params)
+        attempts = settings.llm_max_retries + 1
+        for attempt in range(attempts):
+            async with self.limiter.slot(priority, estimated_tokens) as permit:
+                usage = _usage.get()
+                if usage is not None:
+                    usage["limiter_wait_ms"] += permit.waited_seconds * 1000
+                try:
+                    response = await self.client.chat.completions.create(**params)
+                except openai.RateLimitError as e:
+                    if getattr(e, "code", None) == "insufficient_quota":
+                        raise
+                    self.limiter.record_rate_limited(_retry_after(e.response))
+                    logger.warning(f"LLM rate limited (attempt {attempt + 1}/{attempts})")
+                    if attempt + 1 == attempts:
+                        raise
+                    continue
+                except (openai.APIConnectionError, openai.InternalServerError) as e:
+                    logger.warning(f"LLM call failed (attempt {attempt + 1}/{attempts}): {e}")
+                    if attempt + 1 == attempts:
+                        raise
+                else:
+                    self.limiter.record(
+                        permit,
+                        tokens_used=response.usage.total_tokens if response.usage else None,
+                    )
+                    return response
+            await asyncio.sleep(min(0.5 * 2**attempt, 8) + random.uniform(0, 0.5))
 
     async def complete_structured(
         self,
@@ -60,6 +227,8 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         model: Optional[str] = None,
         temperature: float = 0.3,
+        cache_ttl: Optional[int] = None,
+        priority: Optional[str] = None,
     ) -> T:
         """Generate a structured response validated against a Pydantic model."""
         # Build JSON schema instruction
@@ -78,14 +247,22 @@ Do not include any text before or after the JSON. Only output the JSON object.""
             {"role": "user", "content": prompt},
         ]
 
-        response = await self.client.chat.completions.create(
+        def _valid(text: str) -> bool:
+            try:
+                response_model.model_validate_json(text)
+            except ValueError:
+                return False
+            return True
+
+        content = await self._create_cached(
+            cache_ttl,
+            priority,
+            _valid,
             model=model or settings.openai_model,
             messages=messages,
             temperature=temperature,
             response_format={"type": "json_object"},
-        )
-
-        content = response.choices[0].message.content or "{}"
+        ) or "{}"
 
         try:
             data = json.loads(content)
@@ -98,7 +275,7 @@ Do not include any text before or after the JSON. Only output the JSON object.""
             raise ValueError(f"Invalid response structure: {e}")
 
     async def extract_job_posting(
-        self, raw_text: str, url: str
+        self, raw_text: str, url: str, priority: Optional[str] = None
     ) -> Dict[str, Any]:
         """Extract structured data from job posting text."""
         try:
@@ -122,25 +299,38 @@ Job posting text:
 {raw_text}"""
 
         # Use more text since site-specific extraction is cleaner
-        prompt = prompt_template.format(url=url, raw_text=raw_text[:15000])
+        posting_text = raw_text[:15000]
+        if settings.llm_prompt_compaction_enabled:
+            compaction = compact(
+                raw_text,
+                settings.llm_extraction_max_input_tokens,
+                model=settings.openai_extraction_model,
+                baseline=posting_text,
+            )
+            posting_text = compaction.text
+            logger.info(
+                f"Compacted posting text from {compaction.original_tokens} to "
+                f"{compaction.tokens} tokens ({compaction.tokenizer})"
+            )
+            usage = _usage.get()
+            if usage is not None:
+                usage["prompt_tokens_saved"] += compaction.tokens_saved
+
+        prompt = prompt_template.format(url=url, raw_text=posting_text)
 
         response = await self.complete(
             prompt,
             system_prompt="You are a job posting parser. Extract structured information accurately. Never invent or hallucinate details.",
             model=settings.openai_extraction_model,
             temperature=0.1,
+            cache_ttl=settings.llm_cache_ttl_job_extraction_seconds,
+            priority=priority,
+            validate=lambda text: _parse_json_object(text) is not None,
         )
 
-        # Try to parse as JSON
-        try:
-            # Find JSON in response
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", response)
-            if json_match:
-                return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
+        extracted = _parse_json_object(response)
+        if extracted is not None:
+            return extracted
 
         # Return raw response if JSON parsing fails
         return {"raw_extraction": response}
@@ -0,0 +1,225 @@
+"""Adaptive rate and concurrency limiter for LLM provider calls.
+
+Each process gets one limiter (owned by its ``LLMClient``) with:
+
+- token buckets for provider tokens and requests per minute, charged with an
+  estimate up front and corrected with the real usage afterwards;
+- a share of both buckets and of the concurrency limit reserved for
+  interactive calls (API requests a user is waiting on), so a burst of
+  background extraction can't starve them;
+- an adaptive concurrency limit (additive increase, multiplicative
+  decrease) that halves on a 429, backs off when calls get slower than the
+  latency target and creeps back up while calls succeed quickly;
+- a pause after a 429 for the provider's Retry-After;
+- queue depth, in-flight and wait-time metrics (``metrics()``).
+
+Budgets are per process: set LLM_TOKENS_PER_MINUTE and
+LLM_REQUESTS_PER_MINUTE to each process's share of the account limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+# Wait-time samples kept for the metrics percentiles
+WAIT_SAMPLES = 1000
+
+
+class _Bucket:
+    """Token bucket refilled continuously up to one minute's budget."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float, floor: float) -> float:
+        """Seconds until ``amount`` can be taken while keeping ``floor`` in reserve."""
+        # A single call larger than the whole budget still has to run eventually
+        amount = min(amount, self.capacity - floor)
+        shortfall = amount + floor - self.level
+        return shortfall / self.rate if shortfall > 0 else 0.0
+
+
+@dataclass
+class Permit:
+    """A granted call slot; pass it back to ``LLMLimiter.record``."""
+
+    priority: str
+    estimated_tokens: int
+    waited_seconds: float
+    started: float = 0.0
+
+
+class LLMLimiter:
+    """Token-bucket and adaptive-concurrency limiter with interactive headroom."""
+
+    def __init__(
+        self,
+        *,
+        tokens_per_minute: int,
+        requests_per_minute: int,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        interactive_reserve: float = 0.2,
+        latency_target_seconds: float = 30.0,
+        rate_limit_pause_seconds: float = 10.0,
+    ) -> None:
+        self.tokens = _Bucket(tokens_per_minute)
+        self.requests = _Bucket(requests_per_minute)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min(min_concurrency, max_concurrency))
+        self.interactive_reserve = interactive_reserve
+        self.latency_target_seconds = latency_target_seconds
+        self.rate_limit_pause_seconds = rate_limit_pause_seconds
+
+        self.concurrency_limit = float(max_concurrency)
+        self.paused_until = 0.0
+        self.in_flight = {priority: 0 for priority in PRIORITIES}
+        self.waiting = {priority: 0 for priority in PRIORITIES}
+        self.waits: Dict[str, Deque[float]] = {
+            priority: deque(maxlen=WAIT_SAMPLES) for priority in PRIORITIES
+        }
+        self.counters = {"calls": 0, "rate_limited": 0, "slow_calls": 0}
+
+        self._changed: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _condition(self) -> asyncio.Condition:
+        # Bound to the loop it's first used on; recreated if the loop changes
+        loop = asyncio.get_running_loop()
+        if self._changed is None or self._loop is not loop:
+            self._changed = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = {priority: 0 for priority in PRIORITIES}
+            self.waiting = {priority: 0 for priority in PRIORITIES}
+        return self._changed
+
+    def _slots(self, priority: str) -> int:
+        limit = int(self.concurrency_limit)
+        if priority == INTERACTIVE:
+            return limit
+        return max(1, int(limit * (1 - self.interactive_reserve)))
+
+    def _wait_seconds(self, priority: str, tokens: int, now: float) -> Optional[float]:
+        """0 if a call can start now, seconds to wait for budget, or None to
+        wait for a running call to finish."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        if priority == BACKGROUND and self.waiting[INTERACTIVE]:
+            return None
+        if sum(self.in_flight.values()) >= int(self.concurrency_limit):
+            return None
+        if priority == BACKGROUND and self.in_flight[BACKGROUND] >= self._slots(BACKGROUND):
+            return None
+
+        reserve = self.interactive_reserve if priority == BACKGROUND else 0.0
+        self.tokens.refill(now)
+        self.requests.refill(now)
+        return max(
+            self.tokens.wait_for(tokens, self.tokens.capacity * reserve),
+            self.requests.wait_for(1, self.requests.capacity * reserve),
+        )
+
+    @asynccontextmanager
+    async def slot(self, priority: str, estimated_tokens: int) -> AsyncIterator[Permit]:
+        """Wait for budget and a concurrency slot, then hold it for the call."""
+        if priority not in PRIORITIES:
+            priority = INTERACTIVE
+        changed = self._condition()
+        start = time.monotonic()
+
+        async with changed:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    wait = self._wait_seconds(priority, estimated_tokens, time.monotonic())
+                    if wait == 0:
+                        break
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self.waiting[priority] -= 1
+
+            self.tokens.level -= estimated_tokens
+            self.requests.level -= 1
+            self.in_flight[priority] += 1
+            # Background callers held back for this one may go now
+            changed.notify_all()
+
+        waited = time.monotonic() - start
+        self.waits[priority].append(waited)
+        permit = Permit(priority, estimated_tokens, waited, started=time.monotonic())
+        try:
+            yield permit
+        finally:
+            async with changed:
+                self.in_flight[priority] -= 1
+                changed.notify_all()
+
+    def record(self, permit: Permit, *, tokens_used: Optional[int] = None) -> None:
+        """Record a successful call: correct the token charge and adapt concurrency."""
+        self.counters["calls"] += 1
+        if tokens_used is not None:
+            self.tokens.level += permit.estimated_tokens - tokens_used
+
+        latency = time.monotonic() - permit.started
+        if latency > self.latency_target_seconds:
+            self.counters["slow_calls"] += 1
+            self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * 0.9)
+        else:
+            self.concurrency_limit = min(
+                self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit
+            )
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve concurrency and pause new calls."""
+        self.counters["rate_limited"] += 1
+        self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+        pause = retry_after if retry_after is not None else self.rate_limit_pause_seconds
+        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current limits, queue depth, in-flight calls and recent wait times."""
+
+        def _waits(samples: Deque[float]) -> Dict[str, Any]:
+            if not samples:
+                return {"count": 0, "avg_ms": None, "p95_ms": None, "max_ms": None}
+            ordered = sorted(samples)
+            return {
+                "count": len(ordered),
+                "avg_ms": round(1000 * sum(ordered) / len(ordered), 1),
+                "p95_ms": round(1000 * ordered[min(int(0.95 * len(ordered)), len(ordered) - 1)], 1),
+                "max_ms": round(1000 * ordered[-1], 1),
+            }
+
+        now = time.monotonic()
+        self.tokens.refill(now)
+        self.requests.refill(now)
+        return {
+            "concurrency_limit": round(self.concurrency_limit, 2),
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": dict(self.waiting),
+            "in_flight": dict(self.in_flight),
+            "tokens_available": int(self.tokens.level),
+            "requests_available": int(self.requests.level),
+            "paused_seconds": round(max(0.0, self.paused_until - now), 1),
+            "wait_times": {priority: _waits(self.waits[priority]) for priority in PRIORITIES},
+            **self.counters,
+        }
@@ -0,0 +1,117 @@
+"""Per-stage timing and resource metrics for the scrape pipeline."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from atlasops.models.job import JobProcessingMetric
+
+
+def url_host(url: str) -> Optional[str]:
+    """Lower-cased host of a URL without a leading ``www.``."""
+    host = (urlparse(url).hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def record(
+    db: AsyncSession,
+    job,
+    stage: str,
+    duration_ms: float,
+    **fields: Any,
+) -> None:
+    """Add a metric row for a job; it is written with the stage's next commit."""
+    db.add(
+        JobProcessingMetric(
+            job_posting_id=job.id,
+            stage=stage,
+            host=url_host(job.url),
+            duration_ms=round(duration_ms, 2),
+            **fields,
+        )
+    )
+
+
+def _percentile(fraction: float):
+    return func.percentile_cont(fraction).within_group(JobProcessingMetric.duration_ms)
+
+
+async def stage_latency(
+    db: AsyncSession,
+    since: datetime,
+    *,
+    by_host: bool = False,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """Return p50/p95 duration and mean resource use per stage (and host).
+
+    Fetch rows are split by fetcher so direct fetches, Playwright fallbacks
+    and cache reads are reported separately. Per-host rows are ordered by
+    p95, slowest first.
+    """
+    p50 = _percentile(0.5)
+    p95 = _percentile(0.95)
+    group_by = [JobProcessingMetric.stage, JobProcessingMetric.fetcher]
+    if by_host:
+        group_by.append(JobProcessingMetric.host)
+
+    stmt = (
+        select(
+            *group_by,
+            func.count().label("count"),
+            func.count().filter(JobProcessingMetric.success.is_(False)).label("failures"),
+            p50.label("p50"),
+            p95.label("p95"),
+            func.avg(JobProcessingMetric.bytes_fetched).label("avg_bytes"),
+            func.avg(JobProcessingMetric.chars_extracted).label("avg_chars"),
+            func.avg(JobProcessingMetric.prompt_tokens).label("avg_prompt_tokens"),
+            func.avg(JobProcessingMetric.completion_tokens).label("avg_completion_tokens"),
+            func.sum(JobProcessingMetric.prompt_tokens_saved).label("prompt_tokens_saved"),
+            func.avg(JobProcessingMetric.limiter_wait_ms).label("avg_limiter_wait_ms"),
+        )
+        .where(JobProcessingMetric.created_at >= since)
+        .group_by(*group_by)
+        .order_by(p95.desc() if by_host else JobProcessingMetric.stage)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+
+    def _round(value) -> Optional[float]:
+        return round(float(value), 1) if value is not None else None
+
+    rows = []
+    for row in result.mappings().all():
+        entry = {
+            "stage": row["stage"],
+            "fetcher": row["fetcher"],
+            "count": row["count"],
+            "failures": row["failures"],
+            "p50_ms": _round(row["p50"]),
+            "p95_ms": _round(row["p95"]),
+            "avg_bytes_fetched": _round(row["avg_bytes"]),
+            "avg_chars_extracted": _round(row["avg_chars"]),
+            "avg_prompt_tokens": _round(row["avg_prompt_tokens"]),
+            "avg_completion_tokens": _round(row["avg_completion_tokens"]),
+            "prompt_tokens_saved": row["prompt_tokens_saved"],
+            "avg_limiter_wait_ms": _round(row["avg_limiter_wait_ms"]),
+        }
+        if by_host:
+            entry["host"] = row["host"]
+        rows.append(entry)
+    return rows
+
+
+async def purge_older_than(db: AsyncSession, days: int) -> int:
+    """Delete metric rows older than ``days``. Returns the number removed."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    result = await db.execute(
+        delete(JobProcessingMetric).where(JobProcessingMetric.created_at < cutoff)
+    )
+    return result.rowcount or 0
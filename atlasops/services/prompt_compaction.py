@@ -0,0 +1,234 @@
+"""Token-aware compaction of scraped text before it goes into an LLM prompt.
+
+Scraped posting text carries a lot the model doesn't need: navigation and
+sign-in chrome, cookie banners, legal statements, and content repeated by
+the page (LinkedIn's "about the job" section, "show more" duplicates).
+``compact`` drops repeated blocks and sentences and boilerplate sentences,
+then trims the rest to a token budget.
+
+Tokens are counted with tiktoken for the target model when its encoding was
+loaded at startup (``load_tokenizers``); otherwise an approximation of 4
+characters per token is used.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token of English text for the tiktoken-less fallback
+APPROX_CHARS_PER_TOKEN = 4
+
+# Short standalone lines that are page chrome wherever they appear
+CHROME_LINE_RE = re.compile(
+    r"^(?:skip to (?:main )?content|sign in|sign up|join now|log ?in|register|"
+    r"apply(?: now| for this job)?|easy apply|save(?: job)?|share(?: this job)?|"
+    r"report this job|show (?:more|less)|see more|read more|back to (?:search|jobs)|"
+    r"(?:similar|related) jobs|people also viewed|menu|close|home)\W*$",
+    re.IGNORECASE,
+)
+
+# Boilerplate matched inside short lines (links in footers and banners) with
+# little else on them
+SHORT_BOILERPLATE_RE = re.compile(
+    r"\b(?:privacy policy|cookie (?:policy|settings|preferences)|terms of (?:service|use)|"
+    r"user agreement|all rights reserved|accept (?:all )?cookies)\b|^(?:©|copyright\b)",
+    re.IGNORECASE,
+)
+SHORT_LINE_MAX_CHARS = 200
+SHORT_REMAINDER_MAX_CHARS = 40
+
+# Legal statements that carry no posting details
+LEGAL_BOILERPLATE_RE = re.compile(
+    r"\b(?:(?:this|our) (?:web)?site uses cookies|we use cookies|"
+    r"equal (?:employment )?opportunity employer|"
+    r"without regard to (?:race|color|religion|sex|age|national origin)|"
+    r"reasonable accommodations? (?:to|for) (?:qualified )?(?:individuals|applicants) with disabilities|"
+    r"e-verify)\b",
+    re.IGNORECASE,
+)
+# A sentence is only dropped for a legal statement near its start and within
+# this length. Text flattened from inline markup runs sentences together, so a
+# match deep inside a long unit usually shares it with posting details.
+LEGAL_MAX_CHARS = 400
+LEGAL_LEAD_MAX_CHARS = 60
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+class Compaction(NamedTuple):
+    """Compacted text with token counts before and after."""
+
+    text: str
+    original_tokens: int
+    tokens: int
+    tokenizer: str
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+class Tokenizer:
+    """Counts and truncates text in a model's tokens (or approximately)."""
+
+    def __init__(self, encoding=None) -> None:
+        self.encoding = encoding
+        self.name = encoding.name if encoding is not None else "approx"
+
+    def count(self, text: str) -> int:
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return -(-len(text) // APPROX_CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """First ``max_tokens`` tokens of ``text``, cut back to a line or word boundary."""
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            cut = self.encoding.decode(tokens[:max_tokens])
+        else:
+            if len(text) <= max_tokens * APPROX_CHARS_PER_TOKEN:
+                return text
+            cut = text[: max_tokens * APPROX_CHARS_PER_TOKEN]
+
+        # Don't end mid-word (or mid-line, if a line break is close)
+        for boundary in ("\n", " "):
+            at = cut.rfind(boundary)
+            if at > len(cut) * 0.9:
+                return cut[:at].rstrip()
+        return cut
+
+
+# Tokenizers loaded by load_tokenizers(), by model
+_tokenizers: Dict[str, Tokenizer] = {}
+_approx = Tokenizer()
+
+
+def load_tokenizers(models: Iterable[str], timeout: float) -> None:
+    """Load tiktoken encodings for ``models``, waiting at most ``timeout`` seconds.
+
+    tiktoken downloads an encoding on first use (unless TIKTOKEN_CACHE_DIR
+    already has it), synchronously and without a timeout. So this is called
+    once at process startup rather than on the first LLM call, and the load
+    runs in a daemon thread that is abandoned if it takes too long. Models
+    that don't load are counted approximately.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("tiktoken not installed; approximating prompt token counts")
+        return
+
+    def _load() -> None:
+        for model in set(models):
+            try:
+                try:
+                    encoding = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                logger.warning(
+                    f"Could not load tiktoken encoding for {model} ({e}); "
+                    "approximating token counts"
+                )
+                continue
+            _tokenizers[model] = Tokenizer(encoding)
+
+    thread = threading.Thread(target=_load, name="tiktoken-load", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.warning(
+            f"Loading tiktoken encodings took over {timeout}s; approximating token counts "
+            "(pre-seed TIKTOKEN_CACHE_DIR to avoid the download)"
+        )
+
+
+def get_tokenizer(model: Optional[str] = None) -> Tokenizer:
+    """Tokenizer for an OpenAI model, if loaded at startup; else approximate.
+
+    Never loads an encoding itself, so it is safe to call on the event loop.
+    """
+    return _tokenizers.get(model or "", _approx)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split()).strip(" .,:;-*•|")
+
+
+def _is_boilerplate(unit: str) -> bool:
+    if CHROME_LINE_RE.match(unit.strip()):
+        return True
+    if len(unit) <= SHORT_LINE_MAX_CHARS and SHORT_BOILERPLATE_RE.search(unit):
+        remainder = SHORT_BOILERPLATE_RE.sub("", unit)
+        if len(remainder.strip()) <= SHORT_REMAINDER_MAX_CHARS:
+            return True
+    if len(unit) > LEGAL_MAX_CHARS:
+        return False
+    match = LEGAL_BOILERPLATE_RE.search(unit)
+    return match is not None and match.start() <= LEGAL_LEAD_MAX_CHARS
+
+
+def _units(line: str) -> List[str]:
+    return _SENTENCE_RE.split(line)
+
+
+def dedupe_and_strip(text: str) -> str:
+    """Drop repeated paragraphs and sentences, and boilerplate sentences.
+
+    The first occurrence of anything repeated is kept; comparison ignores
+    case, spacing and surrounding punctuation. Only the offending sentence of
+    a line is dropped, never the rest of the line.
+    """
+    seen_paragraphs = set()
+    seen = set()
+    paragraphs = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        key = _normalize(paragraph)
+        if not key or key in seen_paragraphs:
+            continue
+        seen_paragraphs.add(key)
+
+        lines = []
+        for line in paragraph.split("\n"):
+            kept = []
+            for unit in _units(line):
+                key = _normalize(unit)
+                if not key or key in seen or _is_boilerplate(unit):
+                    continue
+                seen.add(key)
+                kept.append(unit.strip())
+            if kept:
+                lines.append(" ".join(kept))
+        if lines:
+            paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+
+def compact(
+    text: str,
+    max_tokens: int,
+    *,
+    model: Optional[str] = None,
+    baseline: Optional[str] = None,
+) -> Compaction:
+    """Compact ``text`` for a prompt and trim it to ``max_tokens``.
+
+    ``original_tokens`` counts ``baseline`` when given (what would have been
+    sent without compaction), else ``text`` itself.
+    """
+    tokenizer = get_tokenizer(model)
+    compacted = tokenizer.truncate(dedupe_and_strip(text), max_tokens)
+    return Compaction(
+        text=compacted,
+        original_tokens=tokenizer.count(text if baseline is None else baseline),
+        tokens=tokenizer.count(compacted),
+        tokenizer=tokenizer.name,
+    )
@@ -6,9 +6,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from atlasops.config import get_settings
 from atlasops.services.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Load prompt template
 PROMPT_PATH = Path(__file__).parent.parent / "prompts" / "resume_parser_v1.md"
@@ -52,6 +54,8 @@ class ResumeParser:
                 prompt=prompt,
                 max_tokens=4000,
                 temperature=0.1,  # Low temperature for consistent extraction
+                cache_ttl=settings.llm_cache_ttl_resume_parse_seconds,
+                validate=self._is_parseable,
             )
 
             # Parse JSON from response
@@ -73,6 +77,13 @@ class ResumeParser:
             logger.error(f"Resume parsing failed: {e}")
             raise
 
+    def _is_parseable(self, response: str) -> bool:
+        """Whether a response holds a JSON object (only those are cached)."""
+        try:
+            return isinstance(self._extract_json(response), dict)
+        except json.JSONDecodeError:
+            return False
+
     def _extract_json(self, response: str) -> dict[str, Any]:
         """Extract JSON from LLM response."""
         # Try to find JSON in the response
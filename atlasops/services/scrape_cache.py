@@ -0,0 +1,141 @@
+"""Content-addressed cache of scrape and extraction results."""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from atlasops.config import get_settings
+from atlasops.models.job import ScrapeArtifact, ScrapeCacheEntry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def compress_html(html: str) -> bytes:
+    return zlib.compress(html.encode("utf-8"), 6)
+
+
+def decompress_html(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
+
+
+async def get_cached(db: AsyncSession, url_hash: str) -> Optional[ScrapeCacheEntry]:
+    """Return the unexpired cache entry for a URL hash, counting hits and misses."""
+    if not settings.scrape_cache_enabled:
+        return None
+
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        select(ScrapeCacheEntry).where(
+            ScrapeCacheEntry.url_hash == url_hash,
+            ScrapeCacheEntry.expires_at > now,
+        )
+    )
+    entry = result.scalar_one_or_none()
+    # Only a complete extraction counts as a hit; a cached fetch alone still
+    # needs the LLM call and is counted as a miss when the result is stored
+    if entry is not None and entry.extracted is not None:
+        await db.execute(
+            update(ScrapeCacheEntry)
+            .where(ScrapeCacheEntry.url_hash == url_hash)
+            .values(hit_count=ScrapeCacheEntry.hit_count + 1)
+        )
+        logger.info(f"Scrape cache hit for {url_hash}")
+    else:
+        logger.info(f"Scrape cache miss for {url_hash}")
+    return entry
+
+
+async def store(
+    db: AsyncSession,
+    url_hash: str,
+    url: str,
+    *,
+    html: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    extracted: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Insert or refresh the cache entry for a URL hash, counting a miss."""
+    if not settings.scrape_cache_enabled:
+        return
+
+    now = datetime.now(timezone.utc)
+    values = {
+        "url": url,
+        "html_gz": compress_html(html) if html else None,
+        "raw_text": raw_text,
+        "extracted": extracted,
+        "fetched_at": now,
+        "expires_at": now + timedelta(hours=settings.scrape_cache_ttl_hours),
+    }
+    stmt = pg_insert(ScrapeCacheEntry).values(
+        url_hash=url_hash, hit_count=0, miss_count=1, **values
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ScrapeCacheEntry.url_hash],
+            set_={**values, "miss_count": ScrapeCacheEntry.miss_count + 1},
+        )
+    )
+
+
+async def store_extraction(
+    db: AsyncSession, url_hash: str, extracted: Dict[str, Any]
+) -> None:
+    """Attach an LLM extraction to the entry stored for an earlier fetch."""
+    if not settings.scrape_cache_enabled:
+        return
+
+    await db.execute(
+        update(ScrapeCacheEntry)
+        .where(ScrapeCacheEntry.url_hash == url_hash)
+        .values(extracted=extracted)
+    )
+
+
+async def purge_expired(db: AsyncSession) -> int:
+    """Delete expired entries. Returns the number removed."""
+    result = await db.execute(
+        delete(ScrapeCacheEntry).where(
+            ScrapeCacheEntry.expires_at <= datetime.now(timezone.utc)
+        )
+    )
+    return result.rowcount or 0
+
+
+async def purge_stale_artifacts(db: AsyncSession, hours: int) -> int:
+    """Delete pipeline artifacts not updated for ``hours``. Returns the number removed."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    result = await db.execute(delete(ScrapeArtifact).where(ScrapeArtifact.updated_at < cutoff))
+    return result.rowcount or 0
+
+
+async def cache_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Return entry counts and the overall hit rate."""
+    now = datetime.now(timezone.utc)
+    row = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(ScrapeCacheEntry.expires_at > now),
+                func.coalesce(func.sum(ScrapeCacheEntry.hit_count), 0),
+                func.coalesce(func.sum(ScrapeCacheEntry.miss_count), 0),
+            )
+        )
+    ).first()
+    entries, live_entries, hits, misses = row[0], row[1], int(row[2]), int(row[3])
+    lookups = hits + misses
+    return {
+        "entries": entries,
+        "live_entries": live_entries,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate_percent": round(hits / lookups * 100, 2) if lookups else 0.0,
+    }
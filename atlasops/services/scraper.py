@@ -1,15 +1,24 @@
 """Job posting scraper service."""
 
+import asyncio
+import codecs
 import hashlib
+import html as html_lib
 import logging
-from typing import Optional, Tuple
-from urllib.parse import urlparse
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import httpx
 
+from atlasops.config import get_settings
+from atlasops.services.html_backends import parse_html
+from atlasops.services.structured_data import format_salary, fragment_text
 from atlasops.utils.url_validator import validate_url
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # User agent for web scraping
 USER_AGENT = (
@@ -18,63 +27,298 @@ USER_AGENT = (
 )
 
 
-async def fetch_url_content(url: str) -> Tuple[Optional[str], Optional[str]]:
+# Process-wide HTTP client, bound to the event loop it was created on
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared scraper HTTP client, creating it on first use.
+
+    Connections are kept alive and reused across fetches, so repeated hosts
+    skip the TCP/TLS handshake. A new client is created if the event loop
+    changed since the last call.
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and not _http_client.is_closed and _http_client_loop is loop:
+        return _http_client
+
+    use_http2 = settings.scraper_http2 and _http2_available()
+    if settings.scraper_http2 and not use_http2:
+        logger.warning("SCRAPER_HTTP2 is enabled but the h2 package is not installed")
+
+    _http_client = httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        http2=use_http2,
+        limits=httpx.Limits(
+            max_connections=settings.scraper_max_connections,
+            max_keepalive_connections=settings.scraper_max_keepalive_connections,
+            keepalive_expiry=settings.scraper_keepalive_expiry_seconds,
+        ),
+    )
+    _http_client_loop = loop
+    _host_semaphores.clear()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared scraper HTTP client (worker shutdown hook)."""
+    global _http_client, _http_client_loop
+
+    client, _http_client, _http_client_loop = _http_client, None, None
+    _host_semaphores.clear()
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = (urlparse(url).hostname or "").lower()
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.scraper_max_connections_per_host)
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+
+# Errors for responses refused by content type or size. The browser would
+# download the same response, so these are final rather than a reason to
+# retry with Playwright.
+UNEXPECTED_CONTENT_TYPE = "Unexpected content type"
+RESPONSE_TOO_LARGE = "Response too large"
+
+
+def is_rejected_response(error: Optional[str]) -> bool:
+    """Whether a fetch error means the response itself was refused."""
+    return bool(error) and error.startswith((UNEXPECTED_CONTENT_TYPE, RESPONSE_TOO_LARGE))
+
+
+async def _read_html(response: httpx.Response) -> Tuple[Optional[str], Optional[str]]:
+    """Read a streamed response as HTML text, within SCRAPER_MAX_RESPONSE_BYTES.
+
+    Headers are checked before any of the body is read, so non-HTML responses
+    and those declaring an oversized body are dropped without downloading
+    them. The body is decoded chunk by chunk and the read stops as soon as it
+    passes the limit, so at most that many bytes are ever held.
+    """
+    content_type = response.headers.get("content-type", "")
+    if "text/html" not in content_type.lower():
+        return None, f"{UNEXPECTED_CONTENT_TYPE}: {content_type}"
+
+    max_bytes = settings.scraper_max_response_bytes
+    declared = response.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        return None, f"{RESPONSE_TOO_LARGE}: {declared} bytes (limit {max_bytes})"
+
+    encoding = response.charset_encoding or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    parts = []
+    received = 0
+    async for chunk in response.aiter_bytes():
+        received += len(chunk)
+        if received > max_bytes:
+            return None, f"{RESPONSE_TOO_LARGE}: over {max_bytes} bytes"
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), None
+
+
+class PageFetch(NamedTuple):
+    """Result of fetching a page.
+
+    ``etag`` and ``last_modified`` are the response's validators, kept for
+    conditional rechecks (see ``fetch_if_modified``).
+    """
+
+    content: Optional[str]
+    error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+async def _fetch_html(url: str) -> PageFetch:
+    """Stream an HTML page through the shared, per-host limited client."""
+    client = get_http_client()
+    try:
+        async with _host_semaphore(url):
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                content, error = await _read_html(response)
+                return PageFetch(
+                    content,
+                    error,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                )
+
+    except httpx.TimeoutException:
+        return PageFetch(None, "Request timed out")
+    except httpx.HTTPStatusError as e:
+        return PageFetch(None, f"HTTP error: {e.response.status_code}")
+    except httpx.RequestError as e:
+        return PageFetch(None, f"Request error: {str(e)}")
+    except Exception as e:
+        logger.exception("Unexpected error fetching URL")
+        return PageFetch(None, f"Unexpected error: {str(e)}")
+
+
+async def fetch_url_content(url: str) -> PageFetch:
     """
     Fetch content from a URL.
 
     Returns:
-        Tuple of (content, error_message)
+        PageFetch with the content or an error message, and the response's
+        ETag/Last-Modified validators
     """
     # Validate URL first
     is_valid, error = validate_url(url)
     if not is_valid:
-        return None, error
+        return PageFetch(None, error)
+
+    return await _fetch_html(url)
 
-    try:
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={"User-Agent": USER_AGENT},
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
 
-            content_type = response.headers.get("content-type", "")
-            if "text/html" not in content_type.lower():
-                return None, f"Unexpected content type: {content_type}"
+# Responses that mean the posting has been taken down
+GONE_STATUS_CODES = {404, 410}
 
-            return response.text, None
+
+class ConditionalFetch(NamedTuple):
+    """Result of a conditional recheck of a posting URL.
+
+    ``status`` is one of not_modified, gone, changed or error. ``html`` and
+    the validators are only set for changed pages.
+    """
+
+    status: str
+    html: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _validators_match(
+    response: httpx.Response, etag: Optional[str], last_modified: Optional[str]
+) -> bool:
+    # For servers that ignore conditional headers on HEAD but still send validators
+    if etag and response.headers.get("etag"):
+        return response.headers["etag"] == etag
+    if last_modified and response.headers.get("last-modified"):
+        return response.headers["last-modified"] == last_modified
+    return False
+
+
+async def fetch_if_modified(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> ConditionalFetch:
+    """Recheck a URL using its stored ETag/Last-Modified.
+
+    With validators available, a conditional HEAD is tried first so an
+    unchanged (304) or removed (404/410) posting costs no body transfer. The
+    page is only downloaded, with the same conditional headers, when HEAD
+    can't settle it.
+    """
+    is_valid, error = validate_url(url)
+    if not is_valid:
+        return ConditionalFetch("error", error=error)
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    client = get_http_client()
+    try:
+        async with _host_semaphore(url):
+            if headers:
+                head = await client.head(url, headers=headers)
+                if head.status_code == 304 or (
+                    head.status_code == 200 and _validators_match(head, etag, last_modified)
+                ):
+                    return ConditionalFetch("not_modified")
+                if head.status_code in GONE_STATUS_CODES:
+                    return ConditionalFetch("gone")
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    return ConditionalFetch("not_modified")
+                if response.status_code in GONE_STATUS_CODES:
+                    return ConditionalFetch("gone")
+                response.raise_for_status()
+
+                html, error = await _read_html(response)
+
+        if html is None:
+            return ConditionalFetch("error", error=error)
+        return ConditionalFetch(
+            "changed",
+            html=html,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
 
     except httpx.TimeoutException:
-        return None, "Request timed out"
+        return ConditionalFetch("error", error="Request timed out")
     except httpx.HTTPStatusError as e:
-        return None, f"HTTP error: {e.response.status_code}"
+        return ConditionalFetch("error", error=f"HTTP error: {e.response.status_code}")
     except httpx.RequestError as e:
-        return None, f"Request error: {str(e)}"
+        return ConditionalFetch("error", error=f"Request error: {str(e)}")
     except Exception as e:
-        logger.exception("Unexpected error fetching URL")
-        return None, f"Unexpected error: {str(e)}"
+        logger.exception("Unexpected error rechecking URL")
+        return ConditionalFetch("error", error=f"Unexpected error: {str(e)}")
 
 
 async def fetch_with_playwright(url: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Fetch content using Playwright for JS-rendered pages.
 
+    Pages are rendered in the worker's shared browser pool rather than a
+    freshly launched Chromium. The same content-type and
+    SCRAPER_MAX_RESPONSE_BYTES checks as the plain fetch apply, to both the
+    response and the rendered page.
+
     Returns:
         Tuple of (content, error_message)
     """
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         return None, "Playwright not installed"
 
+    from atlasops.services.browser_pool import get_browser_pool
+
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+        async with get_browser_pool().page() as page:
+            response = await page.goto(url, wait_until="networkidle", timeout=30000)
+            max_bytes = settings.scraper_max_response_bytes
+            if response is not None:
+                content_type = response.headers.get("content-type", "")
+                if "text/html" not in content_type.lower():
+                    return None, f"{UNEXPECTED_CONTENT_TYPE}: {content_type}"
+                declared = response.headers.get("content-length", "")
+                if declared.isdigit() and int(declared) > max_bytes:
+                    return None, f"{RESPONSE_TOO_LARGE}: {declared} bytes (limit {max_bytes})"
+
             content = await page.content()
-            await browser.close()
+            if len(content.encode("utf-8")) > max_bytes:
+                return None, f"{RESPONSE_TOO_LARGE}: rendered page over {max_bytes} bytes"
             return content, None
 
     except Exception as e:
@@ -82,50 +326,342 @@ async def fetch_with_playwright(url: str) -> Tuple[Optional[str], Optional[str]]
         return None, f"Playwright error: {str(e)}"
 
 
-def extract_text_from_html(html: str, url: str = "") -> str:
+# Public ATS posting APIs
+#
+# Applicant tracking systems that publish each posting as JSON let us skip
+# the page download (and Playwright) and build the extraction from the JSON
+# directly, without the LLM. To support another vendor, subclass
+# PostingApiFetcher and pass an instance to register_api_fetcher().
+
+
+class ApiFetch(NamedTuple):
+    """Result of fetching a posting through an ATS API.
+
+    ``extracted`` has the keys of ``llm_client.extract_job_posting`` and
+    ``text`` is a plain-text rendering of it for ``JobPosting.raw_text``.
+    """
+
+    fetcher: str
+    extracted: Optional[Dict[str, Any]] = None
+    text: Optional[str] = None
+    bytes_fetched: int = 0
+    error: Optional[str] = None
+
+
+class PostingApiFetcher(ABC):
+    """Fetches single postings from one ATS vendor's public JSON API.
+
+    Subclasses set ``name`` and ``default_api_base`` and implement
+    ``api_url`` and ``to_extraction``; ``api_base`` can be overridden to point
+    at a stand-in server.
+    """
+
+    name = ""
+    default_api_base = ""
+
+    def __init__(self, api_base: Optional[str] = None) -> None:
+        self.api_base = (api_base or self.default_api_base).rstrip("/")
+
+    @abstractmethod
+    def api_url(self, url: str) -> Optional[str]:
+        """API URL for a posting page URL, or None if it isn't one of ours."""
+
+    @abstractmethod
+    def to_extraction(self, data: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Map the API's JSON to an extraction dict."""
+
+    async def fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[Dict[str, Any], int]:
+        """Fetch the posting JSON. Returns (data, bytes transferred)."""
+        response = await client.get(self.api_url(url), headers={"Accept": "application/json"})
+        response.raise_for_status()
+        return response.json(), len(response.content)
+
+
+def _remote_policy_from(text: Optional[str]) -> str:
+    text = (text or "").lower()
+    for policy in ("hybrid", "remote"):
+        if policy in text:
+            return policy
+    return "unknown"
+
+
+class GreenhouseFetcher(PostingApiFetcher):
+    """Greenhouse job board API (boards-api.greenhouse.io)."""
+
+    name = "greenhouse-api"
+    default_api_base = "https://boards-api.greenhouse.io"
+
+    _PATH_RE = re.compile(r"^/([\w-]+)/jobs/(\d+)")
+
+    def api_url(self, url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        if not (host.endswith(".greenhouse.io") and host.split(".")[0] in ("boards", "job-boards")):
+            return None
+
+        match = self._PATH_RE.match(parsed.path)
+        if match:
+            board, job_id = match.groups()
+        else:
+            # Embedded application form: /embed/job_app?for=<board>&token=<id>
+            query = parse_qs(parsed.query)
+            board = (query.get("for") or [""])[0]
+            job_id = (query.get("token") or [""])[0]
+            if not (parsed.path.startswith("/embed/job_app") and board and job_id.isdigit()):
+                return None
+        return f"{self.api_base}/v1/boards/{board}/jobs/{job_id}?pay_transparency=true"
+
+    async def fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[Dict[str, Any], int]:
+        data, size = await super().fetch(client, url)
+        if not data.get("company_name"):
+            # Older boards omit the company; the board itself has its name
+            board_url = self.api_url(url).split("/jobs/")[0]
+            response = await client.get(board_url)
+            if response.is_success:
+                data["company_name"] = response.json().get("name")
+                size += len(response.content)
+        return data, size
+
+    def to_extraction(self, data: Dict[str, Any], url: str) -> Dict[str, Any]:
+        # JobPosting.location is String(255)
+        location = ((data.get("location") or {}).get("name") or "")[:255] or None
+        salary = None
+        for pay in data.get("pay_input_ranges") or []:
+            low, high = pay.get("min_cents"), pay.get("max_cents")
+            salary = format_salary(
+                low / 100 if low is not None else None,
+                high / 100 if high is not None else None,
+                pay.get("currency_type"),
+                None,
+            )
+            if salary:
+                break
+
+        return {
+            "company_name": data.get("company_name"),
+            "job_title": data.get("title"),
+            "location": location,
+            "remote_policy": _remote_policy_from(location),
+            "salary_range": salary,
+            "job_description": fragment_text(data.get("content") or ""),
+            "requirements": None,
+            "benefits": None,
+            "source": self.name,
+        }
+
+
+class LeverFetcher(PostingApiFetcher):
+    """Lever postings API (api.lever.co).
+
+    The API has no company field, so the name is read from the hosted
+    posting page (``og:site_name``, or its "Company - Title" ``<title>``).
+    Without it the extraction is incomplete and the job takes the page and
+    LLM path.
+    """
+
+    name = "lever-api"
+    default_api_base = "https://api.lever.co"
+
+    _PATH_RE = re.compile(r"^/([\w.-]+)/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})")
+    _WORKPLACE_TYPES = {"remote": "remote", "hybrid": "hybrid", "onsite": "onsite"}
+    _SITE_NAME_RE = re.compile(
+        r"<meta[^>]+property=[\"']og:site_name[\"'][^>]+content=[\"']([^\"']+)", re.IGNORECASE
+    )
+    _TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+    def api_url(self, url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        if host not in ("jobs.lever.co", "jobs.eu.lever.co"):
+            return None
+        match = self._PATH_RE.match(parsed.path)
+        if not match:
+            return None
+
+        api_base = self.api_base
+        if host == "jobs.eu.lever.co" and api_base == self.default_api_base:
+            api_base = "https://api.eu.lever.co"
+        company, posting_id = match.groups()
+        return f"{api_base}/v0/postings/{company}/{posting_id}?mode=json"
+
+    def page_url(self, url: str) -> str:
+        """The hosted posting page (served by a stand-in ``api_base`` too)."""
+        if self.api_base == self.default_api_base:
+            return url
+        return f"{self.api_base}{urlparse(url).path}"
+
+    def company_name(self, html: str, title: Optional[str]) -> Optional[str]:
+        """Company name from the posting page, or None if it can't be told apart."""
+        match = self._SITE_NAME_RE.search(html)
+        if match:
+            return html_lib.unescape(match.group(1)).strip() or None
+        match = self._TITLE_RE.search(html)
+        page_title = " ".join(html_lib.unescape(match.group(1)).split()) if match else ""
+        suffix = f" - {' '.join(title.split())}" if title else ""
+        if suffix and page_title.endswith(suffix):
+            return page_title[: -len(suffix)].strip() or None
+        return None
+
+    async def fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[Dict[str, Any], int]:
+        data, size = await super().fetch(client, url)
+        async with client.stream("GET", self.page_url(url)) as response:
+            if response.is_success:
+                html, _ = await _read_html(response)
+                if html:
+                    data["company_name"] = self.company_name(html, data.get("text"))
+                size += response.num_bytes_downloaded
+        return data, size
+
+    def to_extraction(self, data: Dict[str, Any], url: str) -> Dict[str, Any]:
+        categories = data.get("categories") or {}
+        location = categories.get("location")
+        if categories.get("allLocations"):
+            location = "; ".join(categories["allLocations"])
+        # JobPosting.location is String(255); multi-city postings run longer
+        location = (location or "")[:255] or None
+
+        sections = [data.get("descriptionPlain") or fragment_text(data.get("description") or "")]
+        benefits = []
+        for item in data.get("lists") or []:
+            heading = item.get("text") or ""
+            body = fragment_text(item.get("content") or "")
+            sections.append(f"{heading}\n{body}" if heading else body)
+            if "benefit" in heading.lower() or "perks" in heading.lower():
+                benefits.extend(line for line in body.split("\n") if line)
+        if data.get("additionalPlain"):
+            sections.append(data["additionalPlain"])
+
+        salary = data.get("salaryRange") or {}
+        interval = (salary.get("interval") or "").split("-")
+        unit = interval[1] if len(interval) > 1 else None
+
+        return {
+            "company_name": data.get("company_name"),
+            "job_title": data.get("text"),
+            "location": location,
+            "remote_policy": self._WORKPLACE_TYPES.get(
+                data.get("workplaceType"), _remote_policy_from(location)
+            ),
+            "salary_range": format_salary(
+                salary.get("min"), salary.get("max"), salary.get("currency"), unit
+            ),
+            "job_description": "\n\n".join(section.strip() for section in sections if section),
+            "requirements": {"work_schedule": categories["commitment"]}
+            if categories.get("commitment")
+            else None,
+            "benefits": benefits or None,
+            "source": self.name,
+        }
+
+
+API_FETCHERS: List[PostingApiFetcher] = []
+
+
+def register_api_fetcher(fetcher: PostingApiFetcher) -> PostingApiFetcher:
+    """Add an ATS API fetcher; later registrations take precedence."""
+    API_FETCHERS.insert(0, fetcher)
+    return fetcher
+
+
+register_api_fetcher(GreenhouseFetcher())
+register_api_fetcher(LeverFetcher())
+
+
+def find_api_fetcher(url: str) -> Optional[PostingApiFetcher]:
+    """Return the registered API fetcher that handles a posting URL, if any."""
+    if not settings.scraper_ats_api_enabled:
+        return None
+    for fetcher in API_FETCHERS:
+        if fetcher.api_url(url):
+            return fetcher
+    return None
+
+
+def extraction_text(extracted: Dict[str, Any]) -> str:
+    """Plain-text rendering of an extraction, in the site-specific text layout."""
+    parts = [
+        f"{label}: {extracted[key]}"
+        for label, key in (
+            ("Job Title", "job_title"),
+            ("Company", "company_name"),
+            ("Location", "location"),
+            ("Salary", "salary_range"),
+        )
+        if extracted.get(key)
+    ]
+    if extracted.get("job_description"):
+        parts.append(f"Job Description:\n{extracted['job_description']}")
+    return "\n\n".join(parts)
+
+
+async def fetch_from_api(url: str, fetcher: Optional[PostingApiFetcher] = None) -> ApiFetch:
+    """Fetch a posting through its ATS API (the registered fetcher for ``url``
+    unless one is given)."""
+    fetcher = fetcher or find_api_fetcher(url)
+    if fetcher is None:
+        return ApiFetch("", error="No API fetcher for URL")
+
+    is_valid, error = validate_url(url)
+    if not is_valid:
+        return ApiFetch(fetcher.name, error=error)
+
+    client = get_http_client()
+    try:
+        async with _host_semaphore(fetcher.api_url(url)):
+            data, size = await fetcher.fetch(client, url)
+        extracted = fetcher.to_extraction(data, url)
+        return ApiFetch(fetcher.name, extracted, extraction_text(extracted), size)
+
+    except httpx.TimeoutException:
+        return ApiFetch(fetcher.name, error="Request timed out")
+    except httpx.HTTPStatusError as e:
+        return ApiFetch(fetcher.name, error=f"HTTP error: {e.response.status_code}")
+    except httpx.RequestError as e:
+        return ApiFetch(fetcher.name, error=f"Request error: {str(e)}")
+    except (ValueError, AttributeError, TypeError) as e:
+        return ApiFetch(fetcher.name, error=f"Unexpected API response: {str(e)}")
+    except Exception as e:
+        logger.exception("Unexpected error fetching posting API")
+        return ApiFetch(fetcher.name, error=f"Unexpected error: {str(e)}")
+
+
+def extract_text_from_html(html: str, url: str = "", backend: Optional[str] = None) -> str:
     """Extract readable text from HTML, removing boilerplate.
     
     For known job sites (LinkedIn, Indeed), use site-specific selectors
     to extract just the job content.
+
+    The page is parsed with the fastest installed parser backend (see
+    ``html_backends``) unless ``backend`` names one; all backends give the
+    same result.
     """
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError:
+    page = parse_html(html, backend)
+    if page is None:
         # Fallback: basic tag stripping
-        import re
-
         text = re.sub(r"<[^>]+>", " ", html)
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
-    soup = BeautifulSoup(html, "html.parser")
-    
     # Try site-specific extraction first
-    job_text = _extract_linkedin_job(soup) if "linkedin.com" in url else None
+    job_text = _extract_linkedin_job(page) if "linkedin.com" in url else None
     if not job_text:
-        job_text = _extract_indeed_job(soup) if "indeed.com" in url else None
+        job_text = _extract_indeed_job(page) if "indeed.com" in url else None
     
     if job_text and len(job_text) > 200:
         logger.info(f"Site-specific extraction found {len(job_text)} chars")
         return job_text
 
     # Fallback to generic extraction
-    # Remove script and style elements
-    for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
-        element.decompose()
-
-    # Get text
-    text = soup.get_text(separator=" ", strip=True)
+    # Drop script, style and page chrome, then get text
+    text = page.page_text(["script", "style", "nav", "footer", "header", "aside"])
 
     # Clean up whitespace
-    import re
-
     text = re.sub(r"\s+", " ", text)
 
     return text.strip()
 
 
-def _extract_linkedin_job(soup) -> str:
+def _extract_linkedin_job(page) -> str:
     """Extract job content from LinkedIn job posting page."""
     parts = []
     
@@ -138,9 +674,9 @@ def _extract_linkedin_job(soup) -> str:
         "h1[data-test-job-title]",
     ]
     for selector in title_selectors:
-        title = soup.select_one(selector)
+        title = page.select_one(selector)
         if title:
-            parts.append(f"Job Title: {title.get_text(strip=True)}")
+            parts.append(f"Job Title: {page.text(title)}")
             break
     
     # Company name
@@ -151,9 +687,9 @@ def _extract_linkedin_job(soup) -> str:
         "a[data-test-app-aware-link]",
     ]
     for selector in company_selectors:
-        company = soup.select_one(selector)
+        company = page.select_one(selector)
         if company:
-            company_text = company.get_text(strip=True)
+            company_text = page.text(company)
             if company_text and len(company_text) < 100:  # Avoid picking up wrong elements
                 parts.append(f"Company: {company_text}")
                 break
@@ -165,9 +701,9 @@ def _extract_linkedin_job(soup) -> str:
         ".job-details-jobs-unified-top-card__primary-description-container",
     ]
     for selector in location_selectors:
-        location = soup.select_one(selector)
+        location = page.select_one(selector)
         if location:
-            loc_text = location.get_text(strip=True)
+            loc_text = page.text(location)
             if loc_text and len(loc_text) < 200:
                 parts.append(f"Location: {loc_text}")
                 break
@@ -183,52 +719,55 @@ def _extract_linkedin_job(soup) -> str:
         "[data-test-id='job-details']",
     ]
     for selector in description_selectors:
-        desc = soup.select_one(selector)
+        desc = page.select_one(selector)
         if desc:
-            desc_text = desc.get_text(separator="\n", strip=True)
+            desc_text = page.text(desc, "\n")
             if len(desc_text) > 100:
                 parts.append(f"Job Description:\n{desc_text}")
                 break
     
     # Also try to find "About the job" section
-    about_section = soup.find("h2", string=lambda t: t and "about the job" in t.lower())
+    about_section = page.section_under_heading("h2", "about the job")
     if about_section:
-        parent = about_section.find_parent("section") or about_section.find_parent("div")
-        if parent:
-            about_text = parent.get_text(separator="\n", strip=True)
-            if about_text and "About the job" not in " ".join(parts):
-                parts.append(f"About:\n{about_text}")
+        about_text = page.text(about_section, "\n")
+        if about_text and "About the job" not in " ".join(parts):
+            parts.append(f"About:\n{about_text}")
     
     return "\n\n".join(parts)
 
 
-def _extract_indeed_job(soup) -> str:
+def _extract_indeed_job(page) -> str:
     """Extract job content from Indeed job posting page."""
     parts = []
     
     # Job title
-    title = soup.select_one("h1.jobsearch-JobInfoHeader-title")
+    title = page.select_one("h1.jobsearch-JobInfoHeader-title")
     if title:
-        parts.append(f"Job Title: {title.get_text(strip=True)}")
+        parts.append(f"Job Title: {page.text(title)}")
     
     # Company
-    company = soup.select_one("[data-testid='inlineHeader-companyName']") or soup.select_one(".jobsearch-InlineCompanyRating-companyHeader")
+    company = page.select_one("[data-testid='inlineHeader-companyName']") or page.select_one(".jobsearch-InlineCompanyRating-companyHeader")
     if company:
-        parts.append(f"Company: {company.get_text(strip=True)}")
+        parts.append(f"Company: {page.text(company)}")
     
     # Location  
-    location = soup.select_one("[data-testid='inlineHeader-companyLocation']") or soup.select_one(".jobsearch-JobInfoHeader-subtitle")
+    location = page.select_one("[data-testid='inlineHeader-companyLocation']") or page.select_one(".jobsearch-JobInfoHeader-subtitle")
     if location:
-        parts.append(f"Location: {location.get_text(strip=True)}")
+        parts.append(f"Location: {page.text(location)}")
     
     # Description
-    desc = soup.select_one("#jobDescriptionText") or soup.select_one(".jobsearch-jobDescriptionText")
+    desc = page.select_one("#jobDescriptionText") or page.select_one(".jobsearch-jobDescriptionText")
     if desc:
-        parts.append(f"Job Description:\n{desc.get_text(separator=chr(10), strip=True)}")
+        parts.append(f"Job Description:\n{page.text(desc, chr(10))}")
     
     return "\n\n".join(parts)
 
 
+def compute_content_hash(text: str) -> str:
+    """Hash extracted posting text to detect content changes between fetches."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def compute_url_hash(url: str) -> str:
     """Compute a hash of the URL for deduplication."""
     # Normalize URL
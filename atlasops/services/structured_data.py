@@ -0,0 +1,254 @@
+"""schema.org JobPosting extraction from embedded JSON-LD.
+
+Many applicant tracking systems (Greenhouse, Lever, Workday, Ashby, ...)
+embed the posting as ``<script type="application/ld+json">`` for search
+engines. When that data is complete it gives the same fields the LLM
+extraction does, without the LLM call.
+"""
+
+from __future__ import annotations
+
+import html as html_lib
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JSONLD_RE = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Marks extractions made from structured data in JobPosting.structured_data
+SOURCE = "schema.org"
+
+SKIP_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+BLOCK_RE = re.compile(
+    r"<br\s*/?>|</?(?:p|div|li|ul|ol|h[1-6]|tr|table|section|blockquote)\b[^>]*>",
+    re.IGNORECASE,
+)
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+def fragment_text(markup: str) -> str:
+    """Text of an HTML fragment (a description embedded in JSON), one block per line.
+
+    Inline markup (``<em>``, ``<a>``...) is dropped in place so words stay
+    together; block elements start new lines.
+    """
+    # Some sites entity-encode the markup a second time
+    if "<" not in markup and "&lt;" in markup:
+        markup = html_lib.unescape(markup)
+    text = BLOCK_RE.sub("\n", SKIP_RE.sub("", markup))
+    text = html_lib.unescape(TAG_RE.sub("", text))
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _iter_objects(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every JSON-LD node, looking inside lists and @graph."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_objects(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_objects(data["@graph"])
+
+
+def _is_job_posting(node: Dict[str, Any]) -> bool:
+    types = node.get("@type")
+    if isinstance(types, list):
+        return "JobPosting" in types
+    return types == "JobPosting"
+
+
+def find_job_posting(html: str) -> Optional[Dict[str, Any]]:
+    """Return the first schema.org JobPosting embedded in the page, if any."""
+    for match in JSONLD_RE.finditer(html):
+        raw = match.group(1).strip()
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw, strict=False)
+        except json.JSONDecodeError:
+            logger.debug("Skipping invalid JSON-LD block")
+            continue
+        for node in _iter_objects(data):
+            if _is_job_posting(node):
+                return node
+    return None
+
+
+def _name(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("name")
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _location(posting: Dict[str, Any]) -> Optional[str]:
+    places = []
+    for place in _as_list(posting.get("jobLocation")):
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, str):
+            parts = [address]
+        elif isinstance(address, dict):
+            parts = [
+                _name(address.get(key))
+                for key in ("addressLocality", "addressRegion", "addressCountry")
+            ]
+        else:
+            parts = [_name(place)]
+        text = ", ".join(part for part in parts if part)
+        if text and text not in places:
+            places.append(text)
+    return "; ".join(places)[:255] or None
+
+
+def _remote_policy(posting: Dict[str, Any]) -> str:
+    location_types = [str(t).upper() for t in _as_list(posting.get("jobLocationType"))]
+    if "TELECOMMUTE" in location_types:
+        return "remote"
+    return "unknown"
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_salary(
+    low: Optional[float], high: Optional[float], currency: Optional[str], unit: Optional[str]
+) -> Optional[str]:
+    """Salary range text such as "USD 150,000 - 185,000 per year"."""
+    amounts = [f"{amount:,.0f}" for amount in (low, high) if amount is not None]
+    if not amounts:
+        return None
+    if len(amounts) == 2 and amounts[0] == amounts[1]:
+        amounts = amounts[:1]
+    text = " - ".join(amounts)
+    if currency:
+        text = f"{currency} {text}"
+    if unit:
+        text = f"{text} per {unit}"
+    return text[:100]
+
+
+def _salary_range(posting: Dict[str, Any]) -> Optional[str]:
+    salary = posting.get("baseSalary") or posting.get("estimatedSalary")
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if not isinstance(salary, dict):
+        return None
+
+    value = salary.get("value")
+    unit = salary.get("unitText")
+    if isinstance(value, dict):
+        unit = value.get("unitText") or unit
+        low = _number(value.get("minValue"))
+        high = _number(value.get("maxValue"))
+        if low is None and high is None:
+            low = high = _number(value.get("value"))
+    else:
+        low = high = _number(value)
+    return format_salary(low, high, salary.get("currency"), str(unit).lower() if unit else None)
+
+
+def _requirements(posting: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    requirements: Dict[str, Any] = {}
+
+    skills = []
+    for skill in _as_list(posting.get("skills")):
+        name = _name(skill)
+        if name:
+            skills.extend(part.strip() for part in re.split(r"[,\n]", name) if part.strip())
+    if skills:
+        requirements["hard_skills"] = skills
+
+    experience = posting.get("experienceRequirements")
+    if isinstance(experience, dict) and experience.get("monthsOfExperience"):
+        months = _number(experience["monthsOfExperience"])
+        if months:
+            requirements["experience_years"] = f"{months / 12:g} years"
+    elif isinstance(experience, str) and experience.strip():
+        requirements["experience_years"] = fragment_text(experience)
+
+    education = posting.get("educationRequirements")
+    if isinstance(education, dict):
+        education = education.get("credentialCategory") or education.get("name")
+    if isinstance(education, str) and education.strip():
+        requirements["education"] = education.strip()
+
+    employment = [
+        str(kind).replace("_", "-").title() for kind in _as_list(posting.get("employmentType"))
+    ]
+    if employment:
+        requirements["work_schedule"] = ", ".join(employment)
+
+    return requirements or None
+
+
+def _benefits(posting: Dict[str, Any]) -> Optional[List[str]]:
+    benefits = []
+    for benefit in _as_list(posting.get("jobBenefits")):
+        if isinstance(benefit, str) and benefit.strip():
+            text = fragment_text(benefit)
+            benefits.extend(line for line in text.split("\n") if line)
+    return benefits or None
+
+
+def is_complete(extracted: Dict[str, Any]) -> bool:
+    """Whether an extraction has the fields a job needs to be completed."""
+    description = extracted.get("job_description") or ""
+    return bool(
+        (extracted.get("job_title") or "").strip()
+        and (extracted.get("company_name") or "").strip()
+        and len(description.strip()) > 50
+    )
+
+
+def extract_job_posting(html: str) -> Optional[Dict[str, Any]]:
+    """Build an extraction from embedded JobPosting JSON-LD.
+
+    Returns a dict with the same keys as ``llm_client.extract_job_posting``,
+    or None unless the data has a title, a company and a description long
+    enough to pass the pipeline's required-field check.
+    """
+    posting = find_job_posting(html)
+    if posting is None:
+        return None
+
+    description = posting.get("description")
+    company = _name(posting.get("hiringOrganization"))
+    title = _name(posting.get("title"))
+    extracted = {
+        # JobPosting.company_name and job_title are String(255)
+        "company_name": company[:255] if company else None,
+        "job_title": title[:255] if title else None,
+        "job_description": fragment_text(description) if isinstance(description, str) else "",
+    }
+    if not is_complete(extracted):
+        return None
+
+    return {
+        **extracted,
+        "location": _location(posting),
+        "remote_policy": _remote_policy(posting),
+        "salary_range": _salary_range(posting),
+        "requirements": _requirements(posting),
+        "benefits": _benefits(posting),
+        "application_deadline": _name(posting.get("validThrough")),
+        "source": SOURCE,
+    }
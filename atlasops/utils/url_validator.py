@@ -2,7 +2,7 @@
 
 import ipaddress
 import socket
-from typing import Tuple
+from typing import Dict, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 
 # Blocked URL schemes
@@ -35,6 +35,24 @@ KNOWN_JOB_SITES = {
 }
 
 
+class HostLimit(NamedTuple):
+    """Scrape politeness limit for one site."""
+
+    requests_per_minute: float
+    burst: int
+    max_concurrency: int
+
+
+# Stricter scrape limits for known job sites that throttle aggressively.
+# Other known sites and unknown hosts use the SCRAPE_HOST_* defaults.
+JOB_SITE_LIMITS: Dict[str, HostLimit] = {
+    "linkedin.com": HostLimit(requests_per_minute=10, burst=2, max_concurrency=2),
+    "indeed.com": HostLimit(requests_per_minute=15, burst=3, max_concurrency=2),
+    "glassdoor.com": HostLimit(requests_per_minute=10, burst=2, max_concurrency=2),
+    "ziprecruiter.com": HostLimit(requests_per_minute=20, burst=3, max_concurrency=3),
+}
+
+
 def is_private_ip(ip: str) -> bool:
     """Check if an IP address is private/internal."""
     try:
@@ -96,17 +114,23 @@ def validate_url(url: str) -> Tuple[bool, str | None]:
     return True, None
 
 
-def is_known_job_site(url: str) -> bool:
-    """Check if URL is from a known job posting site."""
+def match_job_site(url: str) -> Optional[str]:
+    """Return the most specific KNOWN_JOB_SITES entry a URL belongs to."""
     try:
         parsed = urlparse(url)
         hostname = parsed.hostname.lower() if parsed.hostname else ""
+    except Exception:
+        return None
 
-        # Check against known job sites
-        for site in KNOWN_JOB_SITES:
-            if hostname == site or hostname.endswith(f".{site}"):
-                return True
+    # Check against known job sites
+    matches = [
+        site
+        for site in KNOWN_JOB_SITES
+        if hostname == site or hostname.endswith(f".{site}")
+    ]
+    return max(matches, key=len) if matches else None
 
-        return False
-    except Exception:
-        return False
+
+def is_known_job_site(url: str) -> bool:
+    """Check if URL is from a known job posting site."""
+    return match_job_site(url) is not None
@@ -2,15 +2,31 @@
 
 import asyncio
 import logging
+import re
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
 
-from celery import Celery
+from celery import Celery, chain, group
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from atlasops.config import get_settings
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Queues for the staged scrape pipeline; everything else uses the default
+FETCH_QUEUE = "scrape.fetch"
+PARSE_QUEUE = "scrape.parse"
+LLM_QUEUE = "scrape.llm"
+
 # Initialize Celery
 celery_app = Celery(
     "atlasops",
@@ -27,168 +43,642 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=300,  # 5 minutes max
     worker_prefetch_multiplier=1,
+    task_routes={
+        "atlasops.workers.tasks.fetch_job_stage": {"queue": FETCH_QUEUE},
+        "atlasops.workers.tasks.parse_job_stage": {"queue": PARSE_QUEUE},
+        "atlasops.workers.tasks.extract_job_stage": {"queue": LLM_QUEUE},
+        "atlasops.workers.tasks.recheck_job_posting": {"queue": FETCH_QUEUE},
+    },
 )
 
 
+# Per-process event loop and database engine, created lazily in each
+# (forked) worker process and reused by every task it runs
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_in_flight: Optional[asyncio.Semaphore] = None
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+_init_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's long-lived event loop.
+
+    In async mode (WORKER_ASYNC_MODE) the loop runs forever in a background
+    thread so that many task threads can share it.
+    """
+    global _loop, _loop_thread, _in_flight
+
+    with _init_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            if settings.worker_async_mode:
+                _in_flight = asyncio.Semaphore(settings.worker_max_in_flight)
+                _loop_thread = threading.Thread(
+                    target=_loop.run_forever, name="worker-event-loop", daemon=True
+                )
+                _loop_thread.start()
+            else:
+                asyncio.set_event_loop(_loop)
+        return _loop
+
+
+async def _run_limited(coro):
+    async with _in_flight:
+        return await coro
+
+
 def run_async(coro):
-    """Helper to run async functions in Celery tasks."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    """Helper to run async functions in Celery tasks on the process loop.
+
+    In async mode the coroutine is submitted to the shared loop thread and
+    the calling task thread blocks on its result, so with ``-P threads`` one
+    process keeps up to WORKER_MAX_IN_FLIGHT I/O-bound coroutines running
+    concurrently. Otherwise it runs to completion on the calling thread.
+    """
+    loop = get_worker_loop()
+    if settings.worker_async_mode:
+        return asyncio.run_coroutine_threadsafe(_run_limited(coro), loop).result()
+    return loop.run_until_complete(coro)
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Return this process's async session maker.
+
+    The engine (and its connection pool) is created once per worker process,
+    after the fork, so pooled connections are never shared with the parent.
+    """
+    global _engine, _session_maker
+
+    with _init_lock:
+        if _session_maker is None:
+            _engine = create_async_engine(
+                settings.database_url,
+                echo=False,
+                future=True,
+                pool_pre_ping=True,
+                pool_recycle=300,
+            )
+            _session_maker = async_sessionmaker(
+                _engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return _session_maker
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Give each forked child its own loop and engine, and load tokenizers."""
+    global _loop, _loop_thread, _in_flight, _engine, _session_maker
+
+    # Anything inherited from the parent is unusable after fork
+    _loop, _loop_thread, _in_flight = None, None, None
+    _engine, _session_maker = None, None
+    get_worker_loop()
+    get_session_maker()
+    logger.info("Initialized worker process event loop and database engine")
+
+    from atlasops.services.prompt_compaction import load_tokenizers
+
+    load_tokenizers(
+        (settings.openai_model, settings.openai_extraction_model),
+        settings.llm_tokenizer_load_timeout_seconds,
+    )
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Release pooled resources bound to the process loop."""
+    global _loop, _loop_thread, _in_flight, _engine, _session_maker
+
+    if _loop is None or _loop.is_closed():
+        return
+
+    from atlasops.services.browser_pool import close_browser_pool
+    from atlasops.services.host_limiter import close_redis
+    from atlasops.services.scraper import close_http_client
+
+    async def _close():
+        await close_http_client()
+        await close_browser_pool()
+        await close_redis()
+        if _engine is not None:
+            await _engine.dispose()
+
     try:
-        return loop.run_until_complete(coro)
+        if _loop_thread is not None:
+            asyncio.run_coroutine_threadsafe(_close(), _loop).result()
+            _loop.call_soon_threadsafe(_loop.stop)
+            _loop_thread.join()
+        else:
+            _loop.run_until_complete(_close())
     finally:
-        loop.close()
+        _loop.close()
+        _loop, _loop_thread, _in_flight = None, None, None
+        _engine, _session_maker = None, None
 
 
-def get_fresh_session():
-    """Create a fresh async session maker for Celery tasks.
-    
-    This avoids connection pool issues when Celery workers fork.
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def _apply_extraction(job, extracted: dict) -> None:
+    """Copy LLM-extracted fields onto a job and set its final status."""
+    job.company_name = extracted.get("company_name")
+    job.job_title = extracted.get("job_title")
+    job.location = extracted.get("location")
+    job.remote_policy = extracted.get("remote_policy")
+    job.salary_range = extracted.get("salary_range")
+    job.job_description = extracted.get("job_description")
+    job.requirements = extracted.get("requirements")
+    job.benefits = extracted.get("benefits")
+    job.structured_data = extracted
+
+    # Validate minimum required fields
+    has_company = bool(job.company_name and job.company_name.strip())
+    has_title = bool(job.job_title and job.job_title.strip())
+    has_description = bool(job.job_description and len(job.job_description.strip()) > 50)
+
+    if has_company and has_title and has_description:
+        job.status = "completed"
+        logger.info(f"Successfully processed job {job.id}")
+    else:
+        job.status = "needs_review"
+        missing = []
+        if not has_company:
+            missing.append("company name")
+        if not has_title:
+            missing.append("job title")
+        if not has_description:
+            missing.append("job description")
+        job.error_message = f"Missing required fields: {', '.join(missing)}. Use manual entry to add details."
+        logger.warning(f"Job {job.id} needs review - missing: {missing}")
+
+
+def _refresh_extraction(job, extracted: dict) -> None:
+    """Update a finished job from a recheck's re-extraction.
+
+    Fields the user has edited, and empty extracted values, are left as they
+    are, and so is the job's status.
     """
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-    
-    engine = create_async_engine(
-        settings.database_url,
-        echo=False,
-        future=True,
-        pool_pre_ping=True,
-        pool_recycle=300,
-    )
-    
-    session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
+    from atlasops.models.job import EXTRACTED_FIELDS
+
+    edited = set(job.user_edited_fields or [])
+    for field in EXTRACTED_FIELDS:
+        value = extracted.get(field)
+        if field not in edited and value is not None:
+            setattr(job, field, value)
+    job.structured_data = extracted
+
+
+async def _get_job(db: AsyncSession, job_id: str):
+    from sqlalchemy import select
+
+    from atlasops.models.job import JobPosting
+
+    result = await db.execute(select(JobPosting).where(JobPosting.id == job_id))
+    job = result.scalar_one_or_none()
+    if not job:
+        logger.error(f"Job {job_id} not found")
+    return job
+
+
+def _structured_extraction(db: AsyncSession, job, html: str, fetcher: str) -> Optional[dict]:
+    """
+    Extraction from the page's schema.org JobPosting JSON-LD, if complete.
+
+    Returns None (and the caller falls back to the LLM) unless the embedded
+    data has a title, a company and a usable description.
+    """
+    from atlasops.services import processing_metrics
+    from atlasops.services.structured_data import extract_job_posting
+
+    start = time.perf_counter()
+    extracted = extract_job_posting(html)
+    if extracted is not None:
+        processing_metrics.record(
+            db,
+            job,
+            "structured",
+            _elapsed_ms(start),
+            fetcher=fetcher,
+            chars_extracted=len(extracted["job_description"]),
+        )
+        logger.info(f"Job {job.id} extracted from schema.org data; skipping LLM")
+    return extracted
+
+
+async def _fail_job(db: AsyncSession, job, message: str) -> None:
+    job.status = "failed"
+    job.error_message = message
+    await db.commit()
+
+
+# Staged scrape pipeline
+#
+# Each stage is its own task on its own queue, so fetch (network-bound),
+# parse (CPU-bound) and LLM (rate-limited) workers can be sized separately
+# and each stage retries on its own schedule. A stage returns the job id to
+# pass the chain on, or None once the job is finished (or failed for good).
+# Stage output is kept in ScrapeArtifact, so a retry - or a manual re-run of
+# a failed job - picks up from the last completed stage.
+
+
+def scrape_pipeline(job_id: str):
+    """Return the fetch -> parse -> LLM chain for a job posting."""
+    return chain(
+        fetch_job_stage.s(job_id),
+        parse_job_stage.s(),
+        extract_job_stage.s(),
     )
-    
-    return session_maker, engine
 
 
-@celery_app.task(bind=True, max_retries=3)
-def scrape_job_posting(self, job_id: str):
+@celery_app.task
+def scrape_job_posting(job_id: str):
     """
     Scrape and extract data from a job posting URL.
 
-    This task:
-    1. Fetches the URL content
-    2. Extracts text
-    3. Uses LLM to parse structured data
-    4. Updates the database
+    Starts the staged pipeline; kept as a task so messages queued before the
+    split still run.
     """
     logger.info(f"Starting scrape for job {job_id}")
+    scrape_pipeline(job_id).apply_async()
 
-    async def _scrape():
-        from sqlalchemy import select
 
-        from atlasops.models.job import JobPosting
-        from atlasops.services.llm_client import llm_client
+# Consecutive HTTP 429 answers a fetch waits out before giving up on the host
+MAX_THROTTLED_DEFERRALS = 3
+
+
+class _Deferred(NamedTuple):
+    """Returned by a stage coroutine to re-queue the stage after a delay."""
+
+    countdown: float
+    throttled: bool = False
+
+
+@celery_app.task(bind=True, max_retries=3)
+def fetch_job_stage(self, job_id: Optional[str], throttled: int = 0) -> Optional[str]:
+    """
+    Pipeline stage 1: fetch the posting's HTML.
+
+    Finishes the job directly on a complete scrape cache hit, or when the
+    posting's ATS has a public JSON API (see ``scraper.find_api_fetcher``)
+    that returns a complete posting. Fetches go through the per-host
+    limiter; when a host is over its budget (or answers 429) the stage is
+    re-queued with a countdown instead of failing, keeping its place in the
+    chain. Network errors are retried with a linear backoff.
+    """
+    if job_id is None:
+        return None
+
+    async def _fetch():
+        from atlasops.models.job import ScrapeArtifact
+        from atlasops.services import host_limiter, processing_metrics, scrape_cache
         from atlasops.services.scraper import (
             compute_url_hash,
-            extract_text_from_html,
+            fetch_from_api,
             fetch_url_content,
             fetch_with_playwright,
+            find_api_fetcher,
+            is_rejected_response,
         )
+        from atlasops.services.structured_data import is_complete
 
-        # Create fresh connection for this task
-        session_maker, engine = get_fresh_session()
-        
-        async with session_maker() as db:
-            # Get job posting
-            result = await db.execute(
-                select(JobPosting).where(JobPosting.id == job_id)
-            )
-            job = result.scalar_one_or_none()
+        session_maker = get_session_maker()
 
+        async with session_maker() as db:
+            job = await _get_job(db, job_id)
             if not job:
-                logger.error(f"Job {job_id} not found")
-                return
+                return None
 
             try:
-                # Update status
                 job.status = "processing"
-                await db.commit()
-
-                # Compute URL hash
                 job.url_hash = compute_url_hash(job.url)
+                await db.commit()
 
-                # Fetch content
-                content, error = await fetch_url_content(job.url)
+                artifact = await db.get(ScrapeArtifact, job.id)
+                if artifact is not None and artifact.html_gz:
+                    logger.info(f"Resuming job {job_id} from stored '{artifact.stage}' artifact")
+                    return job_id
 
-                # Try Playwright if simple fetch fails or returns no content
-                if not content or len(content) < 500:
-                    logger.info(f"Trying Playwright for {job.url}")
-                    content, error = await fetch_with_playwright(job.url)
+                # Reuse a recent scrape of the same URL (any user) if we have one
+                start = time.perf_counter()
+                cached = await scrape_cache.get_cached(db, job.url_hash)
+                await db.commit()
+                lookup_ms = _elapsed_ms(start)
 
-                if not content:
-                    job.status = "failed"
-                    job.error_message = error or "Failed to fetch content"
+                if cached and cached.raw_text and cached.extracted:
+                    job.raw_text = cached.raw_text[:50000]
+                    _apply_extraction(job, cached.extracted)
+                    processing_metrics.record(db, job, "fetch", lookup_ms, fetcher="cache")
                     await db.commit()
-                    return
+                    logger.info(f"Using cached extraction for job {job_id}")
+                    return None
+
+                if cached and cached.html_gz:
+                    # Fetched before but extraction didn't finish; skip the fetch
+                    html_gz, fetched_with = cached.html_gz, "cache"
+                    processing_metrics.record(db, job, "fetch", lookup_ms, fetcher="cache")
+                else:
+                    slot = await host_limiter.acquire(job.url)
+                    if not slot.acquired:
+                        logger.info(
+                            f"Deferring fetch for job {job_id} by {slot.wait_seconds:.1f}s: "
+                            f"{slot.key} is over its rate limit"
+                        )
+                        return _Deferred(slot.wait_seconds)
+
+                    try:
+                        api_fetcher = find_api_fetcher(job.url)
+                        if api_fetcher is not None:
+                            start = time.perf_counter()
+                            api = await fetch_from_api(job.url, api_fetcher)
+                            complete = api.extracted is not None and is_complete(api.extracted)
+                            processing_metrics.record(
+                                db,
+                                job,
+                                "fetch",
+                                _elapsed_ms(start),
+                                fetcher=api.fetcher,
+                                success=complete,
+                                bytes_fetched=api.bytes_fetched,
+                                chars_extracted=len(api.text) if api.text else 0,
+                            )
+                            if complete:
+                                job.raw_text = api.text[:50000]
+                                await scrape_cache.store(
+                                    db,
+                                    job.url_hash,
+                                    job.url,
+                                    raw_text=api.text,
+                                    extracted=api.extracted,
+                                )
+                                _apply_extraction(job, api.extracted)
+                                await db.commit()
+                                logger.info(f"Job {job_id} fetched from {api.fetcher}; skipping LLM")
+                                return None
+                            logger.info(
+                                f"{api.fetcher} gave no usable posting for job {job_id} "
+                                f"({api.error or 'incomplete'}); fetching the page"
+                            )
+
+                        start = time.perf_counter()
+                        page = await fetch_url_content(job.url)
+                        content, error = page.content, page.error
+                        fetched_with = "httpx"
+                        # Validators let the first recheck be a conditional request
+                        if page.etag or page.last_modified:
+                            job.etag = page.etag
+                            job.last_modified = page.last_modified
+                        processing_metrics.record(
+                            db,
+                            job,
+                            "fetch",
+                            _elapsed_ms(start),
+                            fetcher=fetched_with,
+                            success=bool(content and len(content) >= 500),
+                            bytes_fetched=len(content.encode("utf-8")) if content else 0,
+                        )
+
+                        if error == "HTTP error: 429" and throttled < MAX_THROTTLED_DEFERRALS:
+                            backoff = settings.scrape_host_429_backoff_seconds
+                            await host_limiter.penalize(job.url, backoff)
+                            await db.commit()
+                            return _Deferred(backoff, throttled=True)
+
+                        # Try Playwright if simple fetch fails or returns no content,
+                        # unless the response was refused (non-HTML or oversized)
+                        if (not content or len(content) < 500) and not is_rejected_response(error):
+                            logger.info(f"Trying Playwright for {job.url}")
+                            start = time.perf_counter()
+                            content, error = await fetch_with_playwright(job.url)
+                            fetched_with = "playwright"
+                            processing_metrics.record(
+                                db,
+                                job,
+                                "fetch",
+                                _elapsed_ms(start),
+                                fetcher=fetched_with,
+                                success=bool(content),
+                                bytes_fetched=len(content.encode("utf-8")) if content else 0,
+                            )
+                    finally:
+                        await host_limiter.release(slot)
+
+                    if not content:
+                        await _fail_job(db, job, error or "Failed to fetch content")
+                        return None
+                    html_gz = scrape_cache.compress_html(content)
+
+                db.add(
+                    ScrapeArtifact(
+                        job_posting_id=job.id,
+                        stage="fetched",
+                        fetched_with=fetched_with,
+                        html_gz=html_gz,
+                    )
+                )
+                await db.commit()
+                return job_id
+
+            except Exception as e:
+                logger.exception(f"Error fetching job {job_id}")
+                await _fail_job(db, job, str(e))
+                raise
+
+    try:
+        result = run_async(_fetch())
+    except Exception:
+        logger.exception(f"Fetch stage failed for job {job_id}")
+        self.retry(countdown=60 * (self.request.retries + 1))
+
+    if isinstance(result, _Deferred):
+        # Replacing (rather than retrying) leaves the retry budget for real
+        # errors and re-links the rest of the chain to the new task
+        raise self.replace(
+            fetch_job_stage.si(
+                job_id, throttled=throttled + 1 if result.throttled else 0
+            ).set(countdown=result.countdown)
+        )
+    return result
+
+
+@celery_app.task(bind=True, max_retries=1)
+def parse_job_stage(self, job_id: Optional[str]) -> Optional[str]:
+    """
+    Pipeline stage 2: extract text from the fetched HTML.
+
+    Pages with complete schema.org JobPosting data are finished here and
+    never reach the LLM stage. Parsing is deterministic, so only a single
+    quick retry (for database errors) is attempted.
+    """
+    if job_id is None:
+        return None
+
+    async def _parse() -> Optional[str]:
+        from atlasops.models.job import ScrapeArtifact
+        from atlasops.services import processing_metrics, scrape_cache
+        from atlasops.services.scraper import compute_content_hash, extract_text_from_html
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            job = await _get_job(db, job_id)
+            if not job:
+                return None
+
+            try:
+                artifact = await db.get(ScrapeArtifact, job.id)
+                if artifact is None or not artifact.html_gz:
+                    await _fail_job(db, job, "No fetched content to parse")
+                    return None
+                if artifact.raw_text is not None:
+                    return job_id
 
                 # Extract text (pass URL for site-specific extraction)
+                start = time.perf_counter()
+                content = scrape_cache.decompress_html(artifact.html_gz)
                 raw_text = extract_text_from_html(content, job.url)
+                processing_metrics.record(
+                    db,
+                    job,
+                    "parse",
+                    _elapsed_ms(start),
+                    fetcher=artifact.fetched_with,
+                    chars_extracted=len(raw_text),
+                )
                 job.raw_text = raw_text[:50000]  # Limit storage
+                job.content_hash = compute_content_hash(raw_text)
                 logger.info(f"Extracted {len(raw_text)} chars from scraped content")
 
-                # Use LLM to extract structured data
-                extracted = await llm_client.extract_job_posting(raw_text, job.url)
-
-                # Update job with extracted data
-                job.company_name = extracted.get("company_name")
-                job.job_title = extracted.get("job_title")
-                job.location = extracted.get("location")
-                job.remote_policy = extracted.get("remote_policy")
-                job.salary_range = extracted.get("salary_range")
-                job.job_description = extracted.get("job_description")
-                job.requirements = extracted.get("requirements")
-                job.benefits = extracted.get("benefits")
-                job.structured_data = extracted
-
-                # Validate minimum required fields
-                has_company = bool(job.company_name and job.company_name.strip())
-                has_title = bool(job.job_title and job.job_title.strip())
-                has_description = bool(job.job_description and len(job.job_description.strip()) > 50)
-
-                if has_company and has_title and has_description:
-                    job.status = "completed"
-                    logger.info(f"Successfully processed job {job_id}")
-                else:
-                    job.status = "needs_review"
-                    missing = []
-                    if not has_company:
-                        missing.append("company name")
-                    if not has_title:
-                        missing.append("job title")
-                    if not has_description:
-                        missing.append("job description")
-                    job.error_message = f"Missing required fields: {', '.join(missing)}. Use manual entry to add details."
-                    logger.warning(f"Job {job_id} needs review - missing: {missing}")
+                artifact.raw_text = raw_text
+                artifact.stage = "parsed"
+
+                # Cache the fetch before the LLM call so other jobs can skip it
+                await scrape_cache.store(
+                    db, job.url_hash, job.url, html=content, raw_text=raw_text
+                )
+
+                extracted = _structured_extraction(db, job, content, artifact.fetched_with)
+                if extracted is not None:
+                    await scrape_cache.store_extraction(db, job.url_hash, extracted)
+                    _apply_extraction(job, extracted)
+                    await db.delete(artifact)
+                    await db.commit()
+                    return None
 
                 await db.commit()
+                return job_id
 
             except Exception as e:
-                logger.exception(f"Error processing job {job_id}")
-                job.status = "failed"
-                job.error_message = str(e)
+                logger.exception(f"Error parsing job {job_id}")
+                await _fail_job(db, job, str(e))
+                raise
+
+    try:
+        return run_async(_parse())
+    except Exception:
+        logger.exception(f"Parse stage failed for job {job_id}")
+        self.retry(countdown=10)
+
+
+@celery_app.task(bind=True, max_retries=5)
+def extract_job_stage(self, job_id: Optional[str]) -> Optional[str]:
+    """
+    Pipeline stage 3: LLM extraction of structured fields.
+
+    Retries back off exponentially (capped at 10 minutes) to ride out
+    provider rate limits without re-fetching or re-parsing. A re-extraction
+    queued by ``recheck_job_posting`` only refreshes the job's fields (see
+    ``_refresh_extraction``); it never changes the job's status.
+    """
+    if job_id is None:
+        return None
+
+    async def _extract() -> Optional[str]:
+        from atlasops.models.job import ScrapeArtifact
+        from atlasops.services import processing_metrics, scrape_cache
+        from atlasops.services.llm_client import llm_client, track_usage
+        from atlasops.services.llm_limiter import BACKGROUND
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            job = await _get_job(db, job_id)
+            if not job:
+                return None
+
+            refreshing = False
+            try:
+                artifact = await db.get(ScrapeArtifact, job.id)
+                refreshing = artifact is not None and artifact.fetched_with == "recheck"
+                if not refreshing:
+                    job.status = "processing"
+                    await db.commit()
+
+                if artifact is None or artifact.raw_text is None:
+                    await _fail_job(db, job, "No parsed content to extract from")
+                    return None
+
+                # Use LLM to extract structured data
+                start = time.perf_counter()
+                with track_usage() as usage:
+                    extracted = await llm_client.extract_job_posting(
+                        artifact.raw_text, job.url, priority=BACKGROUND
+                    )
+                processing_metrics.record(
+                    db,
+                    job,
+                    "llm",
+                    _elapsed_ms(start),
+                    fetcher=artifact.fetched_with,
+                    success="raw_extraction" not in extracted,
+                    prompt_tokens=usage["prompt_tokens"],
+                    completion_tokens=usage["completion_tokens"],
+                    prompt_tokens_saved=usage["prompt_tokens_saved"],
+                    limiter_wait_ms=round(usage["limiter_wait_ms"], 2),
+                )
+
+                if "raw_extraction" not in extracted:
+                    await scrape_cache.store_extraction(db, job.url_hash, extracted)
+
+                if not refreshing:
+                    _apply_extraction(job, extracted)
+                elif "raw_extraction" not in extracted:
+                    _refresh_extraction(job, extracted)
+                else:
+                    logger.warning(f"Re-extraction of job {job_id} gave no fields; keeping them")
+                await db.delete(artifact)
                 await db.commit()
+                return job_id
+
+            except Exception as e:
+                logger.exception(f"Error extracting job {job_id}")
+                if refreshing:
+                    # The job still has its earlier extraction; don't fail it
+                    await db.rollback()
+                else:
+                    await _fail_job(db, job, str(e))
                 raise
-            finally:
-                # Clean up the engine to avoid connection pool issues
-                await engine.dispose()
 
     try:
-        run_async(_scrape())
-    except Exception as e:
-        logger.exception(f"Task failed for job {job_id}")
-        self.retry(countdown=60 * (self.request.retries + 1))
+        return run_async(_extract())
+    except Exception:
+        logger.exception(f"LLM stage failed for job {job_id}")
+        self.retry(countdown=min(30 * 2 ** self.request.retries, 600))
 
 
 @celery_app.task(bind=True, max_retries=3)
-def extract_job_from_html(self, job_id: str, html_content: str):
+def extract_job_from_html(self, job_id: str, html_ref: str):
     """
     Extract job data from raw HTML content (browser extension).
     
     This task skips scraping since we already have the HTML from the extension.
+    ``html_ref`` is the page's key in the HTML blob store; messages queued
+    before the blob store existed carry the HTML itself.
     """
     logger.info(f"Extracting job data from HTML for job {job_id}")
 
@@ -196,11 +686,12 @@ def extract_job_from_html(self, job_id: str, html_content: str):
         from sqlalchemy import select
 
         from atlasops.models.job import JobPosting
-        from atlasops.services.llm_client import llm_client
+        from atlasops.services import html_blobs, processing_metrics
+        from atlasops.services.llm_client import llm_client, track_usage
+        from atlasops.services.llm_limiter import BACKGROUND
         from atlasops.services.scraper import extract_text_from_html
 
-        # Create fresh connection for this task
-        session_maker, engine = get_fresh_session()
+        session_maker = get_session_maker()
         
         async with session_maker() as db:
             # Get job posting
@@ -214,45 +705,51 @@ def extract_job_from_html(self, job_id: str, html_content: str):
                 return
 
             try:
+                if re.fullmatch(r"[0-9a-f]{64}", html_ref):
+                    html_content = await html_blobs.get(db, html_ref)
+                    if html_content is None:
+                        await _fail_job(db, job, "Captured page HTML is no longer available")
+                        return
+                else:
+                    html_content = html_ref
+
                 # Extract text from HTML (pass URL for site-specific extraction)
+                start = time.perf_counter()
                 raw_text = extract_text_from_html(html_content, job.url)
+                processing_metrics.record(
+                    db,
+                    job,
+                    "parse",
+                    _elapsed_ms(start),
+                    fetcher="extension",
+                    bytes_fetched=len(html_content.encode("utf-8")),
+                    chars_extracted=len(raw_text),
+                )
                 job.raw_text = raw_text[:50000]  # Limit storage
                 logger.info(f"Extracted {len(raw_text)} chars of text from HTML")
 
-                # Use LLM to extract structured data
-                extracted = await llm_client.extract_job_posting(raw_text, job.url)
-
-                # Update job with extracted data
-                job.company_name = extracted.get("company_name")
-                job.job_title = extracted.get("job_title")
-                job.location = extracted.get("location")
-                job.remote_policy = extracted.get("remote_policy")
-                job.salary_range = extracted.get("salary_range")
-                job.job_description = extracted.get("job_description")
-                job.requirements = extracted.get("requirements")
-                job.benefits = extracted.get("benefits")
-                job.structured_data = extracted
-
-                # Validate minimum required fields
-                has_company = bool(job.company_name and job.company_name.strip())
-                has_title = bool(job.job_title and job.job_title.strip())
-                has_description = bool(job.job_description and len(job.job_description.strip()) > 50)
-
-                if has_company and has_title and has_description:
-                    job.status = "completed"
-                    logger.info(f"Successfully extracted job {job_id} from extension HTML")
-                else:
-                    job.status = "needs_review"
-                    missing = []
-                    if not has_company:
-                        missing.append("company name")
-                    if not has_title:
-                        missing.append("job title")
-                    if not has_description:
-                        missing.append("job description")
-                    job.error_message = f"Missing required fields: {', '.join(missing)}. Use manual entry to add details."
-                    logger.warning(f"Job {job_id} needs review - missing: {missing}")
+                extracted = _structured_extraction(db, job, html_content, "extension")
+                if extracted is None:
+                    # Use LLM to extract structured data
+                    start = time.perf_counter()
+                    with track_usage() as usage:
+                        extracted = await llm_client.extract_job_posting(
+                            raw_text, job.url, priority=BACKGROUND
+                        )
+                    processing_metrics.record(
+                        db,
+                        job,
+                        "llm",
+                        _elapsed_ms(start),
+                        fetcher="extension",
+                        success="raw_extraction" not in extracted,
+                        prompt_tokens=usage["prompt_tokens"],
+                        completion_tokens=usage["completion_tokens"],
+                        prompt_tokens_saved=usage["prompt_tokens_saved"],
+                        limiter_wait_ms=round(usage["limiter_wait_ms"], 2),
+                    )
 
+                _apply_extraction(job, extracted)
                 await db.commit()
 
             except Exception as e:
@@ -261,8 +758,6 @@ def extract_job_from_html(self, job_id: str, html_content: str):
                 job.error_message = str(e)
                 await db.commit()
                 raise
-            finally:
-                await engine.dispose()
 
     try:
         run_async(_extract())
@@ -271,16 +766,158 @@ def extract_job_from_html(self, job_id: str, html_content: str):
         self.retry(countdown=60 * (self.request.retries + 1))
 
 
+@celery_app.task
+def recheck_job_postings():
+    """
+    Queue liveness rechecks for scraped postings not checked recently.
+
+    Picks up to POSTING_RECHECK_BATCH_SIZE postings (least recently checked
+    first) created within POSTING_RECHECK_MAX_AGE_DAYS and still open.
+    """
+    if not settings.posting_recheck_enabled:
+        return
+
+    logger.info("Queueing job posting rechecks")
+
+    async def _queue():
+        from sqlalchemy import or_, select
+
+        from atlasops.models.job import JobPosting
+
+        now = datetime.now(timezone.utc)
+        checked_before = now - timedelta(hours=settings.posting_recheck_interval_hours)
+        created_after = now - timedelta(days=settings.posting_recheck_max_age_days)
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            result = await db.execute(
+                select(JobPosting.id)
+                .where(
+                    JobPosting.status.in_(["completed", "needs_review"]),
+                    JobPosting.closed_at.is_(None),
+                    JobPosting.created_at >= created_after,
+                    or_(
+                        JobPosting.last_checked_at.is_(None),
+                        JobPosting.last_checked_at < checked_before,
+                    ),
+                )
+                .order_by(JobPosting.last_checked_at.asc().nulls_first())
+                .limit(settings.posting_recheck_batch_size)
+            )
+            job_ids = [str(job_id) for job_id in result.scalars().all()]
+
+        if job_ids:
+            group(recheck_job_posting.s(job_id) for job_id in job_ids).apply_async()
+        logger.info(f"Queued {len(job_ids)} job posting rechecks")
+
+    run_async(_queue())
+
+
+@celery_app.task
+def recheck_job_posting(job_id: str):
+    """
+    Recheck one posting with a conditional request.
+
+    A 304 only bumps ``last_checked_at`` and a 404/410 marks the posting
+    closed. A changed page is re-parsed, and only if its extracted text hash
+    differs is it re-extracted (from schema.org data when the page has it,
+    else through the LLM stage). Re-extraction refreshes only the fields the
+    user hasn't edited and leaves the job's status alone. Hosts over their
+    rate limit are skipped until the next sweep.
+    """
+
+    async def _recheck():
+        from atlasops.models.job import ScrapeArtifact
+        from atlasops.services import host_limiter, scrape_cache
+        from atlasops.services.scraper import (
+            compute_content_hash,
+            extract_text_from_html,
+            fetch_if_modified,
+        )
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            job = await _get_job(db, job_id)
+            if not job or job.closed_at is not None:
+                return
+
+            slot = await host_limiter.acquire(job.url)
+            if not slot.acquired:
+                logger.info(f"Skipping recheck of job {job_id}: {slot.key} is over its rate limit")
+                return
+            try:
+                result = await fetch_if_modified(job.url, job.etag, job.last_modified)
+            finally:
+                await host_limiter.release(slot)
+
+            now = datetime.now(timezone.utc)
+            job.last_checked_at = now
+
+            if result.status == "gone":
+                job.closed_at = now
+                logger.info(f"Job {job_id} posting is gone; marked closed")
+            elif result.status == "error":
+                logger.warning(f"Recheck of job {job_id} failed: {result.error}")
+                if result.error == "HTTP error: 429":
+                    await host_limiter.penalize(job.url, settings.scrape_host_429_backoff_seconds)
+            elif result.status == "changed":
+                job.etag = result.etag
+                job.last_modified = result.last_modified
+                raw_text = extract_text_from_html(result.html, job.url)
+                content_hash = compute_content_hash(raw_text)
+
+                if job.content_hash is None:
+                    # Scraped before content hashes were recorded; take a baseline
+                    job.content_hash = content_hash
+                elif content_hash != job.content_hash:
+                    if await db.get(ScrapeArtifact, job.id) is not None:
+                        # A pipeline run is already in flight for this job
+                        await db.commit()
+                        return
+                    logger.info(f"Job {job_id} posting changed; re-extracting")
+                    job.content_hash = content_hash
+                    job.raw_text = raw_text[:50000]
+                    extracted = _structured_extraction(db, job, result.html, "recheck")
+                    if extracted is not None:
+                        _refresh_extraction(job, extracted)
+                        await db.commit()
+                        return
+                    db.add(
+                        ScrapeArtifact(
+                            job_posting_id=job.id,
+                            stage="parsed",
+                            fetched_with="recheck",
+                            html_gz=scrape_cache.compress_html(result.html),
+                            raw_text=raw_text,
+                        )
+                    )
+                    await db.commit()
+                    extract_job_stage.delay(job_id)
+                    return
+
+            await db.commit()
+
+    run_async(_recheck())
+
+
 @celery_app.task
 def check_stale_applications():
     """
     Check for applications that have been in 'applied' status for 30+ days
     and auto-close them.
+
+    Works in batches of STALE_APPLICATIONS_BATCH_SIZE: each batch is closed
+    with one UPDATE ... RETURNING, gets its events in one bulk INSERT and is
+    committed on its own, so locks and memory stay bounded.
     """
     logger.info("Checking for stale applications")
 
     async def _check():
-        from sqlalchemy import select
+        from uuid import uuid4
+
+        from sqlalchemy import insert, select, update
 
         from atlasops.models.application import (
             Application,
@@ -289,41 +926,182 @@ def check_stale_applications():
         )
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        batch_size = settings.stale_applications_batch_size
+
+        session_maker = get_session_maker()
 
-        # Create fresh connection for this task
-        session_maker, engine = get_fresh_session()
-        
         async with session_maker() as db:
-            result = await db.execute(
-                select(Application).where(
-                    Application.status == ApplicationStatus.APPLIED,
-                    Application.updated_at < cutoff,
+            total = 0
+            while True:
+                now = datetime.now(timezone.utc)
+                # Skip rows a user is editing right now; the next run gets them
+                batch = (
+                    select(Application.id)
+                    .where(
+                        Application.status == ApplicationStatus.APPLIED,
+                        Application.updated_at < cutoff,
+                    )
+                    .order_by(Application.updated_at)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                    .scalar_subquery()
+                )
+                result = await db.execute(
+                    update(Application)
+                    .where(Application.id.in_(batch))
+                    .values(
+                        status=ApplicationStatus.NO_RESPONSE_CLOSED,
+                        updated_at=now,
+                    )
+                    .returning(Application.id)
+                    .execution_options(synchronize_session=False)
                 )
+                closed_ids = result.scalars().all()
+                if not closed_ids:
+                    break
+
+                await db.execute(
+                    insert(ApplicationEvent),
+                    [
+                        {
+                            "id": uuid4(),
+                            "application_id": application_id,
+                            "from_status": ApplicationStatus.APPLIED,
+                            "to_status": ApplicationStatus.NO_RESPONSE_CLOSED,
+                            "notes": "Auto-closed after 30 days with no response",
+                            "created_at": now,
+                        }
+                        for application_id in closed_ids
+                    ],
+                )
+                await db.commit()
+
+                total += len(closed_ids)
+                logger.info(f"Auto-closed {len(closed_ids)} stale applications ({total} so far)")
+                if len(closed_ids) < batch_size:
+                    break
+
+            logger.info(f"Auto-closed {total} stale applications")
+
+    run_async(_check())
+
+
+@celery_app.task
+def rollup_analytics():
+    """
+    Incrementally refresh the hourly and daily analytics rollup tables
+    read by the admin dashboard.
+    """
+    logger.info("Refreshing analytics rollups")
+
+    async def _rollup():
+        from atlasops.services.analytics_rollup import refresh_rollups
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            await refresh_rollups(db)
+
+    run_async(_rollup())
+
+
+@celery_app.task
+def maintain_analytics_partitions():
+    """
+    Pre-create upcoming monthly partitions for the raw analytics tables and
+    detach/drop partitions older than the retention horizon.
+    """
+    logger.info("Maintaining analytics partitions")
+
+    async def _maintain():
+        from atlasops.services.analytics_partitions import maintain_partitions
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            await maintain_partitions(
+                db,
+                retention_days=settings.analytics_retention_days,
+                months_ahead=settings.analytics_partitions_ahead,
             )
 
-            stale_apps = result.scalars().all()
+    run_async(_maintain())
 
-            for app in stale_apps:
-                # Create event
-                event = ApplicationEvent(
-                    application_id=app.id,
-                    from_status=app.status,
-                    to_status=ApplicationStatus.NO_RESPONSE_CLOSED,
-                    notes="Auto-closed after 30 days with no response",
-                )
-                db.add(event)
 
-                # Update status
-                app.status = ApplicationStatus.NO_RESPONSE_CLOSED
-                app.updated_at = datetime.now(timezone.utc)
+@celery_app.task
+def purge_scrape_cache():
+    """Delete expired scrape cache entries."""
+    logger.info("Purging expired scrape cache entries")
+
+    async def _purge():
+        from atlasops.services import scrape_cache
 
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            removed = await scrape_cache.purge_expired(db)
             await db.commit()
-            logger.info(f"Auto-closed {len(stale_apps)} stale applications")
-        
-        # Clean up engine
-        await engine.dispose()
+            logger.info(f"Purged {removed} expired scrape cache entries")
 
-    run_async(_check())
+    run_async(_purge())
+
+
+@celery_app.task
+def purge_scrape_artifacts():
+    """Delete pipeline artifacts left behind by jobs that never finished."""
+    logger.info("Purging stale scrape artifacts")
+
+    async def _purge():
+        from atlasops.services import scrape_cache
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            removed = await scrape_cache.purge_stale_artifacts(
+                db, settings.scrape_artifact_ttl_hours
+            )
+            await db.commit()
+            logger.info(f"Purged {removed} stale scrape artifacts")
+
+    run_async(_purge())
+
+
+@celery_app.task
+def purge_html_blobs():
+    """Delete extension-captured HTML not uploaded again within its TTL."""
+    logger.info("Purging unused HTML blobs")
+
+    async def _purge():
+        from atlasops.services import html_blobs
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            removed = await html_blobs.purge_unused(db, settings.html_blob_ttl_hours)
+            await db.commit()
+            logger.info(f"Purged {removed} unused HTML blobs")
+
+    run_async(_purge())
+
+
+@celery_app.task
+def purge_processing_metrics():
+    """Delete scrape pipeline metrics past the retention window."""
+    logger.info("Purging old job processing metrics")
+
+    async def _purge():
+        from atlasops.services import processing_metrics
+
+        session_maker = get_session_maker()
+
+        async with session_maker() as db:
+            removed = await processing_metrics.purge_older_than(
+                db, settings.processing_metrics_retention_days
+            )
+            await db.commit()
+            logger.info(f"Purged {removed} job processing metric rows")
+
+    run_async(_purge())
 
 
 # Celery Beat schedule for periodic tasks
@@ -332,4 +1110,32 @@ celery_app.conf.beat_schedule = {
         "task": "atlasops.workers.tasks.check_stale_applications",
         "schedule": timedelta(hours=24),
     },
+    "rollup-analytics": {
+        "task": "atlasops.workers.tasks.rollup_analytics",
+        "schedule": timedelta(minutes=5),
+    },
+    "maintain-analytics-partitions-daily": {
+        "task": "atlasops.workers.tasks.maintain_analytics_partitions",
+        "schedule": timedelta(hours=24),
+    },
+    "purge-scrape-cache-hourly": {
+        "task": "atlasops.workers.tasks.purge_scrape_cache",
+        "schedule": timedelta(hours=1),
+    },
+    "recheck-job-postings-hourly": {
+        "task": "atlasops.workers.tasks.recheck_job_postings",
+        "schedule": timedelta(hours=1),
+    },
+    "purge-scrape-artifacts-hourly": {
+        "task": "atlasops.workers.tasks.purge_scrape_artifacts",
+        "schedule": timedelta(hours=1),
+    },
+    "purge-html-blobs-hourly": {
+        "task": "atlasops.workers.tasks.purge_html_blobs",
+        "schedule": timedelta(hours=1),
+    },
+    "purge-processing-metrics-daily": {
+        "task": "atlasops.workers.tasks.purge_processing_metrics",
+        "schedule": timedelta(hours=24),
+    },
 }
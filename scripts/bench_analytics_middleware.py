@@ -0,0 +1,102 @@
+"""Microbenchmark: pure ASGI analytics middleware vs BaseHTTPMiddleware.
+
+Drives an in-process FastAPI app through httpx's ASGI transport (no network,
+no database) and reports p50/p99 latency for ``/health`` and a JSON endpoint
+under each middleware implementation.
+
+Usage:
+    python scripts/bench_analytics_middleware.py [requests_per_endpoint]
+
+Example:
+    python scripts/bench_analytics_middleware.py 5000
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from atlasops.middleware.analytics import AnalyticsMiddleware
+
+
+class LegacyAnalyticsMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware implementation, for comparison."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._asgi = AnalyticsMiddleware(app)
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        response_time_ms = int((time.perf_counter() - start_time) * 1000)
+        self._asgi._track_analytics(request.scope, response.status_code, response_time_ms)
+        return response
+
+
+def build_app(middleware_cls) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware_cls)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "version": "0.1.0"}
+
+    @app.get("/api/v1/items")
+    async def items():
+        return {"items": [{"id": i, "name": f"item-{i}"} for i in range(50)]}
+
+    return app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure(app: FastAPI, path: str, count: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up
+        for _ in range(min(200, count)):
+            await client.get(path)
+
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+    return samples
+
+
+async def main(count: int) -> None:
+    implementations = {
+        "BaseHTTPMiddleware": LegacyAnalyticsMiddleware,
+        "pure ASGI": AnalyticsMiddleware,
+    }
+    print(f"{count} requests per endpoint\n")
+    print(f"{'implementation':<20} {'endpoint':<16} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+    for name, middleware_cls in implementations.items():
+        app = build_app(middleware_cls)
+        for path in ["/health", "/api/v1/items"]:
+            samples = await measure(app, path, count)
+            print(
+                f"{name:<20} {path:<16} "
+                f"{percentile(samples, 50):>8.3f} "
+                f"{percentile(samples, 99):>8.3f} "
+                f"{statistics.mean(samples):>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
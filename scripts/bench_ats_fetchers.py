@@ -0,0 +1,154 @@
+"""Check and benchmark the ATS API fetchers against a local stand-in server.
+
+Starts a server on 127.0.0.1 that answers like the Greenhouse and Lever
+posting APIs (from ``scripts/fixtures/ats``) and also serves the same
+postings' HTML pages (from ``scripts/fixtures/html``). Then:
+
+1. runs each registered-type fetcher, pointed at the stand-in server, and
+   compares its extraction with ``fixtures/ats/expected/<fetcher>.json``;
+2. times N fetches of each posting via the API path (JSON + mapping, plus
+   the posting page for Lever's company name; no LLM call needed) against
+   the page path (HTML + ``extract_text_from_html``, which still needs an
+   LLM call afterwards) and reports bytes transferred.
+
+Exits non-zero if an extraction differs from the expected output. URL
+validation is bypassed because it rejects localhost by design.
+
+Usage:
+    python scripts/bench_ats_fetchers.py [iterations]
+
+Example:
+    python scripts/bench_ats_fetchers.py 200
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlasops.services import scraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+GREENHOUSE_URL = "https://boards.greenhouse.io/cobalt/jobs/5551234"
+LEVER_URL = "https://jobs.lever.co/tidewater/0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"
+
+ROUTES = {
+    "/v1/boards/cobalt/jobs/5551234": ("application/json", FIXTURES / "ats" / "greenhouse_job.json"),
+    "/v1/boards/cobalt": ("application/json", FIXTURES / "ats" / "greenhouse_board.json"),
+    "/v0/postings/tidewater/0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b": (
+        "application/json",
+        FIXTURES / "ats" / "lever_posting.json",
+    ),
+    # Lever's hosted posting page, read for the company name
+    "/tidewater/0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b": (
+        "text/html; charset=utf-8",
+        FIXTURES / "html" / "lever_job.html",
+    ),
+    "/pages/greenhouse": ("text/html; charset=utf-8", FIXTURES / "html" / "greenhouse_job.html"),
+    "/pages/lever": ("text/html; charset=utf-8", FIXTURES / "html" / "lever_job.html"),
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; don't let delayed ACKs time them
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        route = ROUTES.get(self.path.split("?", 1)[0])
+        if route is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        content_type, path = route
+        body = path.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def check(fetcher: scraper.PostingApiFetcher, extracted: dict) -> bool:
+    expected_path = FIXTURES / "ats" / "expected" / f"{fetcher.name}.json"
+    expected = json.loads(expected_path.read_text(encoding="utf-8"))
+    if extracted == expected:
+        return True
+    for key in sorted(set(expected) | set(extracted)):
+        if expected.get(key) != extracted.get(key):
+            print(f"  MISMATCH {fetcher.name}.{key}:")
+            print(f"    expected {expected.get(key)!r}")
+            print(f"    actual   {extracted.get(key)!r}")
+    return False
+
+
+async def api_path(client, fetcher, url):
+    data, size = await fetcher.fetch(client, url)
+    return fetcher.to_extraction(data, url), size
+
+
+async def page_path(client, page_url, url):
+    response = await client.get(page_url)
+    response.raise_for_status()
+    return scraper.extract_text_from_html(response.text, url), len(response.content)
+
+
+async def timed(fn, iterations: int):
+    result, size = await fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) * 1000 / iterations, size, result
+
+
+async def main(iterations: int) -> int:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    base = f"http://{host}:{port}"
+
+    cases = [
+        (scraper.GreenhouseFetcher(api_base=base), GREENHOUSE_URL, f"{base}/pages/greenhouse"),
+        (scraper.LeverFetcher(api_base=base), LEVER_URL, f"{base}/pages/lever"),
+    ]
+
+    client = scraper.get_http_client()
+    all_ok = True
+    print(f"{'fetcher':<16} {'output':<8} {'api ms':>8} {'api bytes':>10} {'page ms':>8} {'page bytes':>11}")
+    try:
+        for fetcher, url, page_url in cases:
+            assert fetcher.api_url(url), f"{fetcher.name} does not match {url}"
+            api_ms, api_bytes, extracted = await timed(
+                lambda: api_path(client, fetcher, url), iterations
+            )
+            page_ms, page_bytes, _ = await timed(
+                lambda: page_path(client, page_url, url), iterations
+            )
+            ok = check(fetcher, extracted)
+            all_ok = all_ok and ok
+            status = "same" if ok else "DIFFERS"
+            print(
+                f"{fetcher.name:<16} {status:<8} {api_ms:8.2f} {api_bytes:10d} "
+                f"{page_ms:8.2f} {page_bytes:11d}"
+            )
+    finally:
+        await scraper.close_http_client()
+        server.shutdown()
+
+    print("\nThe page path still needs an LLM extraction call per posting; the API path does not.")
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)))
@@ -0,0 +1,216 @@
+"""Offline extraction benchmark and regression harness.
+
+Runs the scraper's text extraction (``extract_text_from_html``, with its
+LinkedIn and Indeed extractors) and the schema.org JSON-LD extractor over the
+saved job pages in ``scripts/fixtures/html`` and reports, per site:
+
+- throughput (pages/s) and p50/p95/p99 latency per page;
+- field-level accuracy against ``fields.json``: title, company and location
+  (a labelled line such as ``Company: ...`` must hold exactly the expected
+  value; in unlabelled text the value must appear), description snippets that
+  must appear, and page noise (navigation, footers, banners) that must not;
+- regressions: pages whose text differs from ``expected/<page>.txt``, and
+  fields the extracted text has that prompt compaction (``compact``, at the
+  LLM extraction's token budget) loses.
+
+Exits non-zero on a regression, so selector or parser changes can be checked
+before they ship. After an intended change, inspect the diff and re-record
+the expected text with ``--update``. Everything runs offline.
+
+Usage:
+    python scripts/bench_extraction.py [--iterations N] [--backend NAME] [--update]
+
+Example:
+    python scripts/bench_extraction.py --iterations 200 --backend lxml
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlasops.config import get_settings
+from atlasops.services.html_backends import available_backends, default_backend
+from atlasops.services.prompt_compaction import compact
+from atlasops.services.scraper import extract_text_from_html
+from atlasops.services.structured_data import extract_job_posting
+from atlasops.utils.url_validator import match_job_site
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+LABELS = {"job_title": "Job Title", "company_name": "Company", "location": "Location"}
+
+
+def _norm(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def load_corpus():
+    manifest = json.loads((FIXTURES / "manifest.json").read_text(encoding="utf-8"))
+    fields = json.loads((FIXTURES / "fields.json").read_text(encoding="utf-8"))
+    corpus = []
+    for name, url in manifest.items():
+        corpus.append(
+            {
+                "name": name,
+                "url": url,
+                "site": match_job_site(url) or urlparse(url).hostname,
+                "html": (FIXTURES / name).read_text(encoding="utf-8"),
+                "expected_path": FIXTURES / "expected" / f"{Path(name).stem}.txt",
+                "fields": fields.get(name, {}),
+            }
+        )
+    return corpus
+
+
+def labelled_value(text: str, label: str):
+    for line in text.split("\n"):
+        if line.startswith(f"{label}: "):
+            return line[len(label) + 2 :]
+    return None
+
+
+def score_text(text: str, fields: dict):
+    """Return {check: passed} for one page's extracted text."""
+    checks = {}
+    normalized = _norm(text)
+    for key, label in LABELS.items():
+        if key not in fields:
+            continue
+        value = labelled_value(text, label)
+        if value is not None:
+            checks[key] = _norm(value) == _norm(fields[key])
+        else:
+            checks[key] = _norm(fields[key]) in normalized
+    snippets = fields.get("description", [])
+    if snippets:
+        checks["description"] = all(_norm(snippet) in normalized for snippet in snippets)
+    noise = fields.get("noise", [])
+    if noise:
+        checks["no_noise"] = not any(_norm(item) in normalized for item in noise)
+    return checks
+
+
+def score_structured(extracted, expected: dict):
+    if extracted is None:
+        return {key: False for key in expected}
+    return {key: extracted.get(key) == value for key, value in expected.items()}
+
+
+def timed(fn, iterations: int):
+    result = fn()  # warm up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, samples
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark and check job page extraction.")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed runs per page")
+    parser.add_argument("--backend", choices=available_backends(), default=None)
+    parser.add_argument(
+        "--update", action="store_true", help="Re-record expected text from the current output"
+    )
+    args = parser.parse_args()
+    backend = args.backend or default_backend()
+
+    corpus = load_corpus()
+    latencies = defaultdict(list)
+    results = defaultdict(lambda: defaultdict(list))
+    regressions = []
+    failed_checks = []
+    max_tokens = get_settings().llm_extraction_max_input_tokens
+
+    for page in corpus:
+        text, samples = timed(
+            lambda: extract_text_from_html(page["html"], page["url"], backend=backend),
+            args.iterations,
+        )
+        latencies[("text", page["site"])].extend(samples)
+        text_checks = score_text(text, page["fields"])
+        for check, passed in text_checks.items():
+            results[("text", page["site"])][check].append(passed)
+            if not passed:
+                failed_checks.append(f"text {page['name']}: {check}")
+
+        compacted, samples = timed(lambda: compact(text, max_tokens).text, args.iterations)
+        latencies[("compacted", page["site"])].extend(samples)
+        for check, passed in score_text(compacted, page["fields"]).items():
+            if check == "no_noise":
+                continue
+            results[("compacted", page["site"])][check].append(passed)
+            if not passed and text_checks[check]:
+                failed_checks.append(f"compacted {page['name']}: {check}")
+                regressions.append(f"{page['name']} (compaction lost {check})")
+
+        expected_path = page["expected_path"]
+        expected = expected_path.read_text(encoding="utf-8") if expected_path.exists() else None
+        if args.update:
+            expected_path.write_text(text, encoding="utf-8")
+        elif text != expected:
+            regressions.append(f"{page['name']} (text differs from expected)")
+
+        schema_expected = page["fields"].get("schema_org")
+        if schema_expected:
+            extracted, samples = timed(lambda: extract_job_posting(page["html"]), args.iterations)
+            latencies[("schema.org", page["site"])].extend(samples)
+            for check, passed in score_structured(extracted, schema_expected).items():
+                results[("schema.org", page["site"])][check].append(passed)
+                if not passed:
+                    failed_checks.append(f"schema.org {page['name']}: {check}")
+
+    print(f"{len(corpus)} pages, backend {backend}, {args.iterations} runs per page\n")
+    print(
+        f"{'extractor':<11} {'site':<32} {'pages/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'fields':>9}"
+    )
+    for extractor, site in sorted(latencies):
+        samples = latencies[(extractor, site)]
+        checks = [passed for values in results[(extractor, site)].values() for passed in values]
+        accuracy = f"{sum(checks)}/{len(checks)}" if checks else "-"
+        print(
+            f"{extractor:<11} {site:<32} {1000 / statistics.mean(samples):9.1f} "
+            f"{percentile(samples, 0.5):8.3f} {percentile(samples, 0.95):8.3f} "
+            f"{percentile(samples, 0.99):8.3f} {accuracy:>9}"
+        )
+
+    print("\nField accuracy:")
+    totals = defaultdict(list)
+    for checks in results.values():
+        for check, values in checks.items():
+            totals[check].extend(values)
+    for check in sorted(totals):
+        values = totals[check]
+        print(f"  {check:<14} {sum(values)}/{len(values)} ({100 * sum(values) / len(values):.0f}%)")
+    if failed_checks:
+        print("\nFailed checks:")
+        for failed in failed_checks:
+            print(f"  {failed}")
+
+    if args.update:
+        print("\nExpected text re-recorded.")
+        return 0
+    if regressions:
+        print(f"\nREGRESSION: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions against expected text or in compaction.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Check and benchmark the HTML parser backends used by extract_text_from_html.
+
+For every installed backend this:
+
+1. runs ``extract_text_from_html`` over the fixture corpus in
+   ``scripts/fixtures/html`` and compares each result with the expected
+   output in ``expected/`` (generated with the original html.parser path);
+2. reports pages per second over the corpus, and over a large synthetic
+   page (the Greenhouse fixture's body repeated) to show the cost on big
+   job pages.
+
+Exits non-zero if any backend's output differs from the expected text.
+
+Usage:
+    python scripts/bench_html_backends.py [iterations]
+
+Example:
+    python scripts/bench_html_backends.py 200
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atlasops.services.html_backends import available_backends
+from atlasops.services.scraper import extract_text_from_html
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def load_corpus():
+    manifest = json.loads((FIXTURES / "manifest.json").read_text(encoding="utf-8"))
+    corpus = []
+    for name, url in manifest.items():
+        html = (FIXTURES / name).read_text(encoding="utf-8")
+        expected = (FIXTURES / "expected" / f"{Path(name).stem}.txt").read_text(encoding="utf-8")
+        corpus.append((name, url, html, expected))
+    return corpus
+
+
+def large_page(corpus, copies: int = 60) -> str:
+    html = next(html for name, _, html, _ in corpus if name == "greenhouse_job.html")
+    head, body = html.split("<body>", 1)
+    body, tail = body.rsplit("</body>", 1)
+    return f"{head}<body>{body * copies}</body>{tail}"
+
+
+def check(backend: str, corpus) -> bool:
+    ok = True
+    for name, url, html, expected in corpus:
+        actual = extract_text_from_html(html, url, backend=backend)
+        if actual != expected:
+            ok = False
+            at = next(
+                (i for i, (a, b) in enumerate(zip(actual, expected)) if a != b),
+                min(len(actual), len(expected)),
+            )
+            print(f"  MISMATCH {name} at char {at}:")
+            print(f"    expected {expected[max(at - 30, 0):at + 30]!r}")
+            print(f"    actual   {actual[max(at - 30, 0):at + 30]!r}")
+    return ok
+
+
+def pages_per_second(backend: str, pages, iterations: int) -> float:
+    for _, url, html in pages:  # warm up
+        extract_text_from_html(html, url, backend=backend)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for _, url, html in pages:
+            extract_text_from_html(html, url, backend=backend)
+    return iterations * len(pages) / (time.perf_counter() - start)
+
+
+def main(iterations: int) -> int:
+    corpus = load_corpus()
+    backends = available_backends()
+    if not backends:
+        print("No parser backend installed (pip install beautifulsoup4 lxml selectolax)")
+        return 1
+
+    big = large_page(corpus)
+    corpus_pages = [(name, url, html) for name, url, html, _ in corpus]
+    big_pages = [("large", "https://boards.greenhouse.io/cobalt/jobs/1", big)]
+    big_iterations = max(iterations // 20, 3)
+
+    print(f"{len(corpus)} fixture pages, large page {len(big) / 1024:.0f} KiB\n")
+    print(f"{'backend':<12} {'output':<8} {'corpus pages/s':>15} {'large pages/s':>14}")
+
+    all_ok = True
+    for backend in backends:
+        ok = check(backend, corpus)
+        all_ok = all_ok and ok
+        corpus_rate = pages_per_second(backend, corpus_pages, iterations)
+        big_rate = pages_per_second(backend, big_pages, big_iterations)
+        status = "same" if ok else "DIFFERS"
+        print(f"{backend:<12} {status:<8} {corpus_rate:15.1f} {big_rate:14.1f}")
+
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
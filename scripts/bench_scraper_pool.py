@@ -0,0 +1,101 @@
+"""Benchmark: shared pooled scraper client vs a new client per URL.
+
+Starts a local keep-alive HTTP server on 127.0.0.1 that serves a stand-in job
+page, then fetches N URLs on that host with (a) a fresh ``httpx.AsyncClient``
+per URL, as the scraper used to, and (b) the shared client from
+``atlasops.services.scraper``. URL validation is bypassed because it rejects
+localhost by design.
+
+Usage:
+    python scripts/bench_scraper_pool.py [num_urls] [concurrency]
+
+Example:
+    python scripts/bench_scraper_pool.py 500 10
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from atlasops.services import scraper
+
+PAGE = (
+    "<html><head><title>Senior Engineer</title></head><body>"
+    + "<p>Stand-in job description paragraph.</p>" * 200
+    + "</body></html>"
+).encode()
+
+
+class JobPageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def fetch_with_new_client(url: str):
+    """The previous fetch path: one client (and connection) per URL."""
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        headers={"User-Agent": scraper.USER_AGENT},
+    ) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text, None
+
+
+async def run(fetch, urls: list[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url: str):
+        async with semaphore:
+            content, error = (await fetch(url))[:2]
+            assert content and not error, error
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    return time.perf_counter() - start
+
+
+async def main(num_urls: int, concurrency: int) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JobPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    urls = [f"http://{host}:{port}/jobs/{i}" for i in range(num_urls)]
+
+    try:
+        print(f"{num_urls} URLs on one host, concurrency {concurrency}\n")
+        for name, fetch in [
+            ("new client per URL", fetch_with_new_client),
+            ("shared pooled client", scraper._fetch_html),
+        ]:
+            elapsed = await run(fetch, urls, concurrency)
+            print(f"{name:<22} {elapsed:8.3f} s  {num_urls / elapsed:10.1f} URLs/s")
+    finally:
+        await scraper.close_http_client()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 6,
+        )
+    )
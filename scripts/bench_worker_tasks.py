@@ -0,0 +1,94 @@
+"""Benchmark: per-task loop/engine setup vs the worker's long-lived ones.
+
+Runs a no-op task body N times the way tasks used to (new event loop and a
+new engine per task, disposed afterwards) and the way they do now (the
+process loop and pooled engine from ``atlasops.workers.tasks``), and
+reports tasks per second for each.
+
+By default the no-op only opens and closes a session. Pass ``--db`` to also
+run ``SELECT 1`` against DATABASE_URL, which includes connection setup in
+the per-task cost.
+
+Usage:
+    python scripts/bench_worker_tasks.py [num_tasks] [--db]
+
+Example:
+    python scripts/bench_worker_tasks.py 500 --db
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import atlasops
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from atlasops.config import get_settings
+from atlasops.workers import tasks
+
+settings = get_settings()
+USE_DB = "--db" in sys.argv
+
+
+async def noop(session_maker) -> None:
+    async with session_maker() as db:
+        if USE_DB:
+            await db.execute(text("SELECT 1"))
+
+
+def legacy_task() -> None:
+    """The previous per-task setup: fresh loop, fresh engine, dispose."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def _body():
+        engine = create_async_engine(
+            settings.database_url,
+            echo=False,
+            future=True,
+            pool_pre_ping=True,
+            pool_recycle=300,
+        )
+        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            await noop(session_maker)
+        finally:
+            await engine.dispose()
+
+    try:
+        loop.run_until_complete(_body())
+    finally:
+        loop.close()
+
+
+def persistent_task() -> None:
+    """The current setup: process loop and pooled engine reused."""
+    tasks.run_async(noop(tasks.get_session_maker()))
+
+
+def measure(task, count: int) -> float:
+    task()  # warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        task()
+    return time.perf_counter() - start
+
+
+def main(count: int) -> None:
+    print(f"{count} no-op tasks{' with SELECT 1' if USE_DB else ''}\n")
+    for name, task in [
+        ("per-task loop + engine", legacy_task),
+        ("worker loop + engine", persistent_task),
+    ]:
+        elapsed = measure(task, count)
+        print(f"{name:<24} {elapsed:8.3f} s  {count / elapsed:10.1f} tasks/s")
+    tasks.shutdown_worker_process()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    main(int(args[0]) if args else 200)